@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from ..core.database import AsyncSupabase, get_supabase
+from ..core.security import require_admin
+from ..services.google_sheets import google_sheets_service
+from ..services.onboarding import onboard_applicants
+from ..services.sheets_scheduler import SheetsQuotaError
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+# 한 번에 등록할 수 있는 최대 지원자 수
+MAX_ONBOARDING_APPLICANTS = 1000
+
+class OnboardingRequest(BaseModel):
+    # 승인된 지원자 행 (name, student_id, department, phone, gender) 또는
+    # 지원서 시트와 승인된 학번 목록
+    applicants: Optional[List[Dict[str, Any]]] = None
+    spreadsheet_id: Optional[str] = None
+    student_ids: Optional[List[str]] = None
+
+@router.post("/onboarding")
+async def onboard(request: OnboardingRequest, supabase: AsyncSupabase = Depends(get_supabase)):
+    """
+    승인된 지원자를 한 번에 회원으로 등록합니다. (auth 계정 + profiles)
+    
+    applicants로 행을 직접 주거나, spreadsheet_id와 student_ids로 지원서 시트에서 승인된 행만 고릅니다.
+    지원자별 결과(created / exists / skipped / failed)와 임시 비밀번호를 반환합니다.
+    """
+    if (request.applicants is None) == (request.spreadsheet_id is None):
+        raise HTTPException(status_code=400, detail="applicants와 spreadsheet_id 중 하나만 지정해야 합니다.")
+
+    applicants = request.applicants
+    if request.spreadsheet_id is not None:
+        if not request.student_ids:
+            raise HTTPException(status_code=400, detail="승인된 학번(student_ids)을 지정해야 합니다.")
+        try:
+            info = await google_sheets_service.get_spreadsheet_info(request.spreadsheet_id)
+        except SheetsQuotaError:
+            raise HTTPException(status_code=429, detail="Google Sheets 요청이 많아 잠시 후 다시 시도해주세요.")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        approved = {str(student_id).strip() for student_id in request.student_ids}
+        applicants = [row for row in info["data"] if str(row.get("student_id") or "").strip() in approved]
+
+    if len(applicants) > MAX_ONBOARDING_APPLICANTS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_ONBOARDING_APPLICANTS}명까지 등록할 수 있습니다.")
+
+    try:
+        report = await onboard_applicants(supabase, applicants)
+    except Exception as e:
+        logger.exception(f"Onboarding failed: {e}")
+        raise HTTPException(status_code=500, detail=f"일괄 등록 실패: {str(e)}")
+    return {"status": "success", "data": report}
@@ -0,0 +1,84 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from ..core.database import AsyncSupabase, get_supabase
+from ..core.security import require_admin
+from ..services import analytics
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+@router.get("/kpis")
+async def get_kpis(
+    upcoming_limit: int = Query(5, ge=0, le=50),
+    supabase: AsyncSupabase = Depends(get_supabase)
+):
+    """
+    전체 참여율, 활동 회원 비율, 예정 행사 관심도 등 대시보드 KPI를 반환합니다.
+    """
+    try:
+        return {"status": "success", "data": await analytics.fetch_kpis(supabase, upcoming_limit)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"KPI 조회 실패: {str(e)}")
+
+@router.get("/trend")
+async def get_participation_trend(
+    months: int = Query(12, ge=1, le=120),
+    supabase: AsyncSupabase = Depends(get_supabase)
+):
+    """
+    월별 행사 참여율 추이를 반환합니다.
+    """
+    try:
+        return {"status": "success", "data": await analytics.fetch_participation_trend(supabase, months)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"참여율 추이 조회 실패: {str(e)}")
+
+@router.get("/categories")
+async def get_category_popularity(supabase: AsyncSupabase = Depends(get_supabase)):
+    """
+    행사 카테고리별 인기도를 반환합니다.
+    """
+    try:
+        return {"status": "success", "data": await analytics.fetch_category_popularity(supabase)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"카테고리 통계 조회 실패: {str(e)}")
+
+@router.get("/members/ranking")
+async def get_member_ranking(
+    limit: int = Query(20, ge=1, le=200),
+    supabase: AsyncSupabase = Depends(get_supabase)
+):
+    """
+    참가 횟수 기준 회원 활동 순위를 반환합니다.
+    """
+    try:
+        return {"status": "success", "data": await analytics.fetch_member_ranking(supabase, limit)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"회원 순위 조회 실패: {str(e)}")
+
+@router.get("/events/{event_id}")
+async def get_event_stats(event_id: str, supabase: AsyncSupabase = Depends(get_supabase)):
+    """
+    행사 하나의 참가자 수와 참여율을 반환합니다.
+    """
+    try:
+        stats = await analytics.fetch_event_stats(supabase, event_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"행사 통계 조회 실패: {str(e)}")
+    if stats is None:
+        raise HTTPException(status_code=404, detail="행사를 찾을 수 없습니다.")
+    return {"status": "success", "data": stats}
+
+@router.post("/rebuild", dependencies=[Depends(require_admin)])
+async def rebuild(supabase: AsyncSupabase = Depends(get_supabase)):
+    """
+    원본 행사/참가 데이터에서 모든 집계를 다시 계산합니다. (과거 데이터 채우기, 보정)
+    원본 테이블을 잠그고 집계 테이블을 비우므로 관리자만 실행할 수 있습니다.
+    """
+    try:
+        return {"status": "success", "data": await analytics.rebuild_analytics(supabase)}
+    except Exception as e:
+        logger.exception(f"집계 재계산 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"집계 재계산 실패: {str(e)}")
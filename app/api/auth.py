@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import Optional
-from ..core.database import get_supabase
-from supabase import Client
+from ..core.database import AsyncSupabase, get_supabase
+from ..core.metrics import track_dependency
+from ..services.member_directory import member_directory
 import logging
 
 # 로거 설정
@@ -26,7 +27,7 @@ class AuthResponse(BaseModel):
     token_type: str
 
 @router.post("/signup", response_model=AuthResponse)
-def signup(request: SignUpRequest, supabase: Client = Depends(get_supabase)):
+async def signup(request: SignUpRequest, supabase: AsyncSupabase = Depends(get_supabase)):
     try:
         logger.info(f"Attempting to sign up user with username: {request.username}")
         
@@ -34,7 +35,7 @@ def signup(request: SignUpRequest, supabase: Client = Depends(get_supabase)):
         # username을 이메일 형식으로 변환 (Supabase 요구사항)
         email = f"{request.username}@igrus.com"
         
-        auth_response = supabase.auth.sign_up({
+        auth_response = await supabase.run(supabase.auth.sign_up, {
             "email": email,
             "password": request.password,
             "options": {
@@ -50,7 +51,7 @@ def signup(request: SignUpRequest, supabase: Client = Depends(get_supabase)):
             raise HTTPException(status_code=400, detail="Failed to create user")
 
         # 2. 생성된 사용자로 바로 로그인
-        login_response = supabase.auth.sign_in_with_password({
+        login_response = await supabase.run(supabase.auth.sign_in_with_password, {
             "email": email,
             "password": request.password
         })
@@ -68,14 +69,18 @@ def signup(request: SignUpRequest, supabase: Client = Depends(get_supabase)):
         }
         
         logger.info(f"Creating profile for user: {auth_response.user.id}")
-        profile_response = supabase.table("profiles").insert(profile_data).execute()
+        profile_response = await supabase.execute(supabase.table("profiles").insert(profile_data))
         
         if not profile_response.data:
             # 프로필 생성 실패 시 사용자도 삭제
             logger.error(f"Failed to create profile: {profile_response}")
-            supabase.auth.admin.delete_user(auth_response.user.id)
+            await supabase.run(supabase.auth.admin.delete_user, auth_response.user.id)
             raise HTTPException(status_code=400, detail="Failed to create profile")
 
+        # 다음 색인 갱신을 기다리지 않고 바로 검색되도록 합니다.
+        # (색인은 잠금 없이 이벤트 루프에서만 읽고 쓰므로 Supabase 호출만 스레드 풀로 보냅니다)
+        member_directory.upsert(profile_response.data[0])
+
         # 4. 로그인 세션의 액세스 토큰 반환
         return {
             "access_token": login_response.session.access_token,
@@ -87,16 +92,17 @@ def signup(request: SignUpRequest, supabase: Client = Depends(get_supabase)):
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/signin", response_model=AuthResponse)
-def signin(request: SignInRequest, supabase: Client = Depends(get_supabase)):
+def signin(request: SignInRequest, supabase: AsyncSupabase = Depends(get_supabase)):
     try:
         # username을 이메일 형식으로 변환
         email = f"{request.username}@igrus.com"
         
         # Supabase Auth로 로그인
-        response = supabase.auth.sign_in_with_password({
-            "email": email,
-            "password": request.password
-        })
+        with track_dependency("supabase", "auth.sign_in_with_password"):
+            response = supabase.auth.sign_in_with_password({
+                "email": email,
+                "password": request.password
+            })
 
         if not response.session:
             raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -110,9 +116,10 @@ def signin(request: SignInRequest, supabase: Client = Depends(get_supabase)):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
 @router.post("/signout")
-def signout(supabase: Client = Depends(get_supabase)):
+def signout(supabase: AsyncSupabase = Depends(get_supabase)):
     try:
-        supabase.auth.sign_out()
+        with track_dependency("supabase", "auth.sign_out"):
+            supabase.auth.sign_out()
         return {"message": "Successfully signed out"}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
@@ -0,0 +1,70 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional, Union
+from ..core.database import AsyncSupabase, get_supabase
+from ..core.responses import trusted_response
+from ..models.event import EventWithParticipantSummaries, EventWithParticipants
+from ..services.participants import EVENT_WITH_PARTICIPANT_IDS, ParticipantLoader
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+# compact 값에 따라 참가자 모양이 다르므로 두 모델을 모두 선언합니다. (OpenAPI 스키마용)
+@router.get("/", response_model=Union[List[EventWithParticipantSummaries], List[EventWithParticipants]])
+async def list_events(
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    category: Optional[str] = None,
+    compact: bool = True,
+    supabase: AsyncSupabase = Depends(get_supabase)
+):
+    """
+    행사 목록을 참가자와 함께 반환합니다.
+    
+    행사(참가자 id 포함) 조회 1번과 참가자 프로필 조회 1번으로 페이지 전체를 만듭니다.
+    실행한 쿼리 수는 X-Query-Count 헤더로 확인할 수 있습니다.
+    
+    Args:
+        category: 행사 카테고리 (정확히 일치)
+        compact: true이면 참가자 프로필에서 id, name, department, student_id만 반환합니다.
+    """
+    loader = ParticipantLoader(supabase, compact=compact)
+    try:
+        query = supabase.table("events").select(EVENT_WITH_PARTICIPANT_IDS)
+        if category:
+            query = query.eq("category", category)
+        result = await supabase.execute(
+            query.order("event_date", desc=True).order("id", desc=True).range(offset, offset + limit - 1)
+        )
+        events = await loader.attach(result.data)
+    except Exception as e:
+        logger.exception(f"행사 목록 조회 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"행사 목록 조회 실패: {str(e)}")
+    
+    model = EventWithParticipantSummaries if compact else EventWithParticipants
+    return trusted_response(events, model, headers={"X-Query-Count": str(1 + loader.queries)})
+
+@router.get("/{event_id}", response_model=Union[EventWithParticipants, EventWithParticipantSummaries])
+async def get_event(
+    event_id: str,
+    compact: bool = False,
+    supabase: AsyncSupabase = Depends(get_supabase)
+):
+    """
+    행사 하나를 참가자와 함께 반환합니다.
+    """
+    loader = ParticipantLoader(supabase, compact=compact)
+    try:
+        result = await supabase.execute(
+            supabase.table("events").select(EVENT_WITH_PARTICIPANT_IDS).eq("id", event_id)
+        )
+        events = await loader.attach(result.data)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"행사 조회 실패: {str(e)}")
+    
+    if not events:
+        raise HTTPException(status_code=404, detail="행사를 찾을 수 없습니다.")
+    model = EventWithParticipantSummaries if compact else EventWithParticipants
+    return trusted_response(events[0], model)
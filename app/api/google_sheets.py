@@ -1,9 +1,24 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from ..core.database import AsyncSupabase, get_supabase
+from ..core.responses import trusted_response
+from ..core.security import require_admin
+from ..services.export import EXPORT_MEDIA_TYPES, stream_records
 from ..services.google_sheets import google_sheets_service
+from ..services.sheets_scheduler import SheetsQuotaError
+import math
 
 router = APIRouter(prefix="/google-sheets", tags=["google-sheets"])
 
+def _quota_exceeded(e: SheetsQuotaError) -> HTTPException:
+    # Google API 할당량을 다 쓴 경우 500 대신 429와 다시 시도할 시각을 알려줍니다.
+    return HTTPException(
+        status_code=429,
+        detail="Google Sheets 요청이 많아 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+    )
+
 @router.get("/test")
 async def test_google_sheets_connection():
     """
@@ -14,30 +29,132 @@ async def test_google_sheets_connection():
         raise HTTPException(status_code=500, detail="Google Sheets connection failed")
     return {"status": "success", "message": "Successfully connected to Google Sheets API"}
 
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """
+    스프레드시트 캐시 적중/미스 통계를 반환합니다.
+    """
+    return {"status": "success", "data": google_sheets_service.cache_stats()}
+
 @router.get("/spreadsheet/{spreadsheet_id}")
-async def get_spreadsheet_info(spreadsheet_id: str):
+async def get_spreadsheet_info(spreadsheet_id: str, force_refresh: bool = False):
     """
     특정 스프레드시트의 정보를 가져옵니다.
     
     Args:
         spreadsheet_id: 스프레드시트 ID 또는 URL
+        force_refresh: true이면 캐시를 무시하고 다시 가져옵니다.
+    """
+    try:
+        info = await google_sheets_service.get_spreadsheet_info(spreadsheet_id, force_refresh=force_refresh)
+        # 시트 값은 이미 문자열/숫자이므로 jsonable_encoder를 거치지 않습니다.
+        return trusted_response({"status": "success", "data": info})
+    except SheetsQuotaError as e:
+        raise _quota_exceeded(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/spreadsheet/{spreadsheet_id}/rows")
+async def get_spreadsheet_rows(
+    spreadsheet_id: str,
+    worksheet: Optional[str] = None,
+    fields: Optional[List[str]] = Query(None),
+    since_row: Optional[int] = Query(None, ge=1),
+    tail: Optional[int] = Query(None, ge=1, le=5000),
+    force_refresh: bool = False
+):
+    """
+    스프레드시트에서 필요한 열과 행 구간만 가져옵니다.
+    
+    Args:
+        spreadsheet_id: 스프레드시트 ID 또는 URL
+        worksheet: 워크시트 이름 (없으면 첫 번째 시트)
+        fields: 가져올 필드 목록 (예: name,student_id,department,payment_status)
+        since_row: 이 행 번호 이후의 행만 가져옵니다. 이전 응답의 end_row를 넘기면 새로 추가된 행만 받습니다.
+        tail: 마지막 tail개 행만 가져옵니다.
+        force_refresh: true이면 캐시된 헤더를 다시 읽습니다.
+    """
+    if fields:
+        fields = [field.strip() for value in fields for field in value.split(",") if field.strip()]
+    try:
+        result = await google_sheets_service.get_spreadsheet_rows(
+            spreadsheet_id,
+            worksheet=worksheet,
+            fields=fields,
+            since_row=since_row,
+            tail=tail,
+            force_refresh=force_refresh
+        )
+        return trusted_response({"status": "success", "data": result})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SheetsQuotaError as e:
+        raise _quota_exceeded(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/spreadsheet/{spreadsheet_id}/export")
+async def export_spreadsheet(
+    spreadsheet_id: str,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$")
+):
+    """
+    스프레드시트의 행을 NDJSON 또는 CSV로 스트리밍합니다.
+    시트를 행 범위 단위로 읽는 대로 내보냅니다.
+    
+    Args:
+        spreadsheet_id: 스프레드시트 ID 또는 URL
+        format: ndjson 또는 csv
     """
     try:
-        info = await google_sheets_service.get_spreadsheet_info(spreadsheet_id)
-        return {"status": "success", "data": info}
+        fieldnames, pages = await google_sheets_service.open_spreadsheet_pages(spreadsheet_id)
+    except SheetsQuotaError as e:
+        raise _quota_exceeded(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    return StreamingResponse(
+        stream_records(pages, format, fieldnames=fieldnames),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="spreadsheet.{format}"'}
+    )
 
 @router.get("/spreadsheets")
-async def get_multiple_spreadsheets(spreadsheet_ids: List[str] = Query(...)):
+async def get_multiple_spreadsheets(
+    spreadsheet_ids: List[str] = Query(...),
+    concurrency: Optional[int] = Query(None, ge=1, le=32),
+    timeout: Optional[float] = Query(None, gt=0, le=120),
+    force_refresh: bool = False
+):
     """
-    여러 스프레드시트의 정보를 가져옵니다.
+    여러 스프레드시트의 정보를 동시에 가져옵니다.
     
     Args:
         spreadsheet_ids: 스프레드시트 ID 목록 (쉼표로 구분된 문자열)
+        concurrency: 동시에 읽을 최대 시트 수 (서버 전체 상한은 GOOGLE_SHEETS_CONCURRENCY)
+        timeout: 시트별 타임아웃 (초)
+        force_refresh: true이면 캐시를 무시하고 다시 가져옵니다.
+    """
+    try:
+        result = await google_sheets_service.get_multiple_spreadsheets_info(
+            spreadsheet_ids, concurrency=concurrency, timeout=timeout, force_refresh=force_refresh
+        )
+        return trusted_response({"status": "success", "data": result["data"], "sheets": result["sheets"]})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/sync", dependencies=[Depends(require_admin)])
+async def sync_members(sheet_name: str, supabase: AsyncSupabase = Depends(get_supabase)):
+    """
+    지원서 시트의 회원 정보를 profiles에 동기화합니다. (관리자 전용)
+    
+    Args:
+        sheet_name: 스프레드시트 이름
     """
     try:
-        data = await google_sheets_service.get_multiple_spreadsheets_info(spreadsheet_ids)
-        return {"status": "success", "data": data}
+        stats = await google_sheets_service.sync_members(sheet_name, supabase)
+        return {"status": "success", "data": stats}
+    except SheetsQuotaError as e:
+        raise _quota_exceeded(e)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from typing import Any, Dict, Optional
+from ..core.security import require_admin
+from ..services.jobs import InvalidJobParams, JobQueueFull, JobSchedulerStopped, job_scheduler
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+@router.get("/")
+async def get_jobs():
+    """
+    등록된 작업별 주기, 다음 실행 시각, 실행/실패 횟수, 마지막 실행 상태와 소요 시간을 반환합니다.
+    """
+    return {"status": "success", "data": job_scheduler.stats()}
+
+@router.get("/runs")
+async def get_job_runs(name: Optional[str] = None, limit: int = Query(50, ge=1, le=500)):
+    """
+    진행 중인 작업과 최근 실행 기록을 최신순으로 반환합니다.
+    """
+    return {"status": "success", "data": [run.to_dict() for run in job_scheduler.runs(name, limit)]}
+
+@router.get("/runs/{run_id}")
+async def get_job_run(run_id: str):
+    """
+    실행 하나의 상태와 결과를 반환합니다.
+    """
+    run = job_scheduler.get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="실행 기록을 찾을 수 없습니다.")
+    return {"status": "success", "data": run.to_dict()}
+
+@router.post("/{name}/run", status_code=202, dependencies=[Depends(require_admin)])
+async def run_job(name: str, params: Optional[Dict[str, Any]] = Body(None)):
+    """
+    작업을 바로 대기열에 넣습니다. 같은 인자의 작업이 이미 대기 중이면 그 작업을 반환합니다.
+    """
+    try:
+        run, deduplicated = job_scheduler.enqueue(name, params)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"등록되지 않은 작업입니다: {name}")
+    except InvalidJobParams as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except (JobSchedulerStopped, JobQueueFull) as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return {"status": "accepted", "deduplicated": deduplicated, "data": run.to_dict()}
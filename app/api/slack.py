@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, Request
+from slack_bolt.adapter.fastapi import SlackRequestHandler
+from ..services.slack import get_reaction_stats, get_slack_handler
+
+router = APIRouter(prefix="/slack", tags=["slack"])
+
+@router.post("/events")
+async def slack_events(request: Request, handler: SlackRequestHandler = Depends(get_slack_handler)):
+    """
+    Slack Events API 요청을 받습니다. (서명 검증과 응답은 Bolt가 처리)
+    반응 이벤트는 큐에 넣기만 하므로 Slack의 3초 제한 안에 바로 응답합니다.
+    """
+    return await handler.handle(request)
+
+@router.get("/reactions/stats")
+async def reaction_stats():
+    """
+    반응 처리 큐 깊이, 마지막 배치 크기, 처리 지연, 재시도/실패 수를 반환합니다.
+    """
+    return {"status": "success", "data": get_reaction_stats()}
@@ -1,22 +1,36 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File
-from typing import List, Optional
-from datetime import datetime, date
-import pandas as pd
-import io
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional, Tuple
+from datetime import datetime, date, timezone
 from pydantic import BaseModel
+import asyncio
+import base64
+import json
 
-from ..core.database import supabase
-from ..models.transaction import Transaction, TransactionCreate, TransactionStats
+from ..core.database import AsyncSupabase, get_supabase
+from ..core.responses import model_columns, trusted_response
+from ..core.security import require_admin
+from ..models.transaction import Transaction, TransactionBulkDelete, TransactionBulkUpdate, TransactionCreate, TransactionStats
+from ..services.transaction_bulk import bulk_delete, bulk_update
+from ..services.export import EXPORT_MEDIA_TYPES, stream_records
+from ..services.transaction_stats import (
+    MAX_SUMMARY_BUCKETS, default_term_start, fetch_transaction_stats, fetch_transaction_summary,
+    invalidate_transaction_stats, window_start
+)
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 # 테스트 엔드포인트
 @router.get("/test")
-async def test_connection():
+async def test_connection(supabase: AsyncSupabase = Depends(get_supabase)):
     """DB 연결 및 기본 기능 테스트"""
     try:
         # Supabase 연결 테스트
-        result = supabase.table('transactions').select('count', count='exact').execute()
+        result = await supabase.execute(supabase.table('transactions').select('count', count='exact'))
         return {
             "status": "success",
             "message": "Supabase 연결 성공",
@@ -43,6 +57,8 @@ class TransactionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+TRANSACTION_COLUMNS = model_columns(TransactionResponse)
+
 class TransactionStatsResponse(BaseModel):
     total_balance: int
     this_term_income: int
@@ -52,161 +68,322 @@ class TransactionStatsResponse(BaseModel):
     total_transactions: int
     latest_transaction_date: Optional[datetime]
 
+class TransactionSummaryBucket(BaseModel):
+    bucket_start: date
+    bucket_end: date
+    income: int
+    expense: int
+    net: int
+    transaction_count: int
+    closing_balance: Optional[int]
+
+class TransactionSummaryResponse(BaseModel):
+    bucket: str
+    start_date: date
+    end_date: date
+    total_income: int
+    total_expense: int
+    total_net: int
+    buckets: List[TransactionSummaryBucket]
+
+# 기간을 주지 않았을 때 보여줄 최근 버킷 수
+SUMMARY_DEFAULT_BUCKETS = {"day": 31, "week": 26, "month": 12, "term": 4}
+
+def _quote(value: str) -> str:
+    """PostgREST 필터 값에 쉼표나 괄호가 있어도 안전하도록 큰따옴표로 감쌉니다."""
+    escaped = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+def _encode_cursor(row: dict) -> str:
+    raw = json.dumps([row['transaction_date'], row['id']]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        transaction_date, transaction_id = json.loads(raw)
+        return str(transaction_date), str(transaction_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 cursor 입니다.")
+
+def _apply_filters(query, search: Optional[str], start_date: Optional[date], end_date: Optional[date]):
+    # 검색 조건 추가 (pg_trgm 인덱스가 leading wildcard ilike를 처리합니다)
+    if search:
+        pattern = _quote(f"%{search}%")
+        query = query.or_(f"description.ilike.{pattern},memo.ilike.{pattern},transaction_type.ilike.{pattern}")
+    
+    # 날짜 범위 조건 추가
+    if start_date:
+        query = query.gte('transaction_date', start_date.isoformat())
+    
+    if end_date:
+        query = query.lte('transaction_date', end_date.isoformat())
+    
+    return query
+
+def _apply_keyset(query, cursor: Optional[str]):
+    # (transaction_date, id) 내림차순에서 cursor 다음 행부터 조회
+    # lte 조건은 중복이지만 인덱스 스캔 시작 위치를 cursor로 잡아 줍니다.
+    if cursor:
+        last_date, last_id = _decode_cursor(cursor)
+        query = query.lte('transaction_date', last_date).or_(
+            f"transaction_date.lt.{_quote(last_date)},"
+            f"and(transaction_date.eq.{_quote(last_date)},id.lt.{_quote(last_id)})"
+        )
+    return query.order('transaction_date', desc=True).order('id', desc=True)
+
 @router.get("/", response_model=List[TransactionResponse])
 async def get_transactions(
     limit: int = 100,
     offset: int = 0,
     search: Optional[str] = None,
     start_date: Optional[date] = None,
-    end_date: Optional[date] = None
+    end_date: Optional[date] = None,
+    pagination: str = Query("offset", pattern="^(offset|keyset)$"),
+    cursor: Optional[str] = None,
+    supabase: AsyncSupabase = Depends(get_supabase)
 ):
-    """거래 내역 조회"""
+    """
+    거래 내역 조회
+    
+    pagination=keyset이면 offset 대신 cursor를 사용합니다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 cursor를 돌려주며,
+    이 값을 그대로 cursor 파라미터로 넘기면 됩니다.
+    
+    행은 응답 모델의 열만 조회하므로 다시 검증하지 않고 그대로 직렬화합니다.
+    """
+    if pagination == "keyset" and cursor:
+        _decode_cursor(cursor)  # 잘못된 cursor는 400으로 응답
+    
     try:
-        query = supabase.table('transactions').select('*')
+        query = _apply_filters(supabase.table('transactions').select(TRANSACTION_COLUMNS), search, start_date, end_date)
         
-        # 검색 조건 추가
-        if search:
-            query = query.or_(f"description.ilike.%{search}%,memo.ilike.%{search}%,transaction_type.ilike.%{search}%")
-        
-        # 날짜 범위 조건 추가
-        if start_date:
-            query = query.gte('transaction_date', start_date.isoformat())
-        
-        if end_date:
-            query = query.lte('transaction_date', end_date.isoformat())
+        if pagination == "keyset":
+            query = _apply_keyset(query, cursor)
+            # 다음 페이지 존재 여부를 알기 위해 한 행을 더 가져옵니다.
+            result = await supabase.execute(query.limit(limit + 1))
+            rows = result.data
+            headers = {}
+            if len(rows) > limit:
+                rows = rows[:limit]
+                headers["X-Next-Cursor"] = _encode_cursor(rows[-1])
+            return trusted_response(rows, TransactionResponse, headers=headers)
         
         # 정렬 및 페이지네이션
-        result = query.order('transaction_date', desc=True).range(offset, offset + limit - 1).execute()
+        result = await supabase.execute(query.order('transaction_date', desc=True).range(offset, offset + limit - 1))
         
-        return result.data
+        return trusted_response(result.data, TransactionResponse)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터 조회 실패: {str(e)}")
 
 @router.get("/stats", response_model=TransactionStatsResponse)
 async def get_transaction_stats(
-    term_start: Optional[date] = None
+    term_start: Optional[date] = None,
+    supabase: AsyncSupabase = Depends(get_supabase)
 ):
     """거래 통계 조회"""
     try:
         # 기본값: 이번 학기 시작 (3월 1일)
         if not term_start:
-            current_year = datetime.now().year
-            term_start = date(current_year, 3, 1)
+            term_start = default_term_start()
         
-        # 최신 잔액 조회
-        latest_result = supabase.table('transactions').select('balance').order('transaction_date', desc=True).order('created_at', desc=True).limit(1).execute()
-        total_balance = latest_result.data[0]['balance'] if latest_result.data else 0
+        # 집계는 DB(transaction_stats RPC)에서 계산하고 결과는 캐시합니다.
+        stats = await fetch_transaction_stats(supabase, term_start)
         
-        # 모든 거래 내역 조회 (통계 계산용)
-        all_transactions = supabase.table('transactions').select('*').execute()
-        
-        # 전체 거래 수
-        total_transactions = len(all_transactions.data)
-        
-        # 이번 학기 거래 필터링
-        term_transactions = [
-            t for t in all_transactions.data 
-            if datetime.fromisoformat(t['transaction_date'].replace('Z', '+00:00')).date() >= term_start
-        ]
-        
-        # 수입과 지출 계산
-        this_term_income = sum(t['amount'] for t in term_transactions if t['amount'] > 0)
-        this_term_expense = sum(abs(t['amount']) for t in term_transactions if t['amount'] < 0)
-        this_term_profit = this_term_income - this_term_expense
-        previous_balance = total_balance - this_term_profit
-        
-        # 최신 거래 날짜
-        latest_date = max([datetime.fromisoformat(t['transaction_date'].replace('Z', '+00:00')) for t in term_transactions]) if term_transactions else None
-        
-        return TransactionStatsResponse(
-            total_balance=total_balance,
-            this_term_income=this_term_income,
-            this_term_expense=this_term_expense,
-            this_term_profit=this_term_profit,
-            previous_balance=previous_balance,
-            total_transactions=total_transactions,
-            latest_transaction_date=latest_date
-        )
+        return TransactionStatsResponse(**stats)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
 
+@router.get("/summary", response_model=TransactionSummaryResponse)
+async def get_transaction_summary(
+    bucket: str = Query("month", pattern="^(day|week|month|term)$"),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    supabase: AsyncSupabase = Depends(get_supabase)
+):
+    """
+    기간별(일/주/월/학기) 수입·지출 요약 조회
+    버킷 단위 집계는 DB(transaction_summary RPC)에서 하고, 지난 버킷은 캐시해 두었다가
+    캐시에 없거나 거래가 바뀐 버킷만 한 번의 조회로 다시 가져옵니다.
+    """
+    # 기본값: 오늘까지 최근 버킷 (일 31개, 주 26개, 월 12개, 학기 4개)
+    end_date = end_date or datetime.now(timezone.utc).date()
+    start_date = start_date or window_start(bucket, end_date, SUMMARY_DEFAULT_BUCKETS[bucket])
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="시작일이 종료일보다 늦습니다.")
+
+    try:
+        buckets, queries = await fetch_transaction_summary(supabase, bucket, start_date, end_date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"조회 기간이 너무 깁니다. (최대 {MAX_SUMMARY_BUCKETS}개 구간)")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"요약 조회 실패: {str(e)}")
+
+    total_income = sum(row["income"] for row in buckets)
+    total_expense = sum(row["expense"] for row in buckets)
+    return trusted_response(
+        {
+            "bucket": bucket,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "total_income": total_income,
+            "total_expense": total_expense,
+            "total_net": total_income - total_expense,
+            "buckets": buckets,
+        },
+        TransactionSummaryResponse,
+        headers={"X-Query-Count": str(queries)}
+    )
+
+# export는 PostgREST 최대 응답 크기 단위로 페이지를 가져옵니다.
+EXPORT_PAGE_SIZE = 1000
+
+async def _transaction_pages(
+    supabase: AsyncSupabase,
+    search: Optional[str],
+    start_date: Optional[date],
+    end_date: Optional[date]
+) -> AsyncIterator[List[dict]]:
+    """keyset 페이지네이션으로 조건에 맞는 거래 내역을 페이지 단위로 가져옵니다."""
+    async def fetch(cursor: Optional[str]) -> List[dict]:
+        # 목록 API와 같은 공개 컬럼만 내보냅니다. (natural_key 등 내부 컬럼 제외)
+        query = _apply_filters(supabase.table('transactions').select(TRANSACTION_COLUMNS), search, start_date, end_date)
+        result = await supabase.execute(_apply_keyset(query, cursor).limit(EXPORT_PAGE_SIZE))
+        return result.data
+    
+    pending = asyncio.ensure_future(fetch(None))
+    try:
+        while True:
+            rows = await pending
+            if len(rows) < EXPORT_PAGE_SIZE:
+                if rows:
+                    yield rows
+                return
+            # 현재 페이지를 내보내는 동안 다음 페이지를 미리 가져옵니다.
+            pending = asyncio.ensure_future(fetch(_encode_cursor(rows[-1])))
+            yield rows
+    finally:
+        # 클라이언트가 중간에 연결을 끊은 경우
+        pending.cancel()
+
+@router.get("/export")
+async def export_transactions(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    search: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    supabase: AsyncSupabase = Depends(get_supabase)
+):
+    """
+    거래 내역 전체를 NDJSON 또는 CSV로 스트리밍합니다.
+    페이지를 받는 대로 내보내므로 전체 행 수와 관계없이 서버 메모리 사용량이 일정합니다.
+    """
+    return StreamingResponse(
+        stream_records(
+            _transaction_pages(supabase, search, start_date, end_date),
+            format,
+            fieldnames=list(TransactionResponse.model_fields)
+        ),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="transactions.{format}"'}
+    )
+
+def _import_transactions(*args):
+    # pandas는 업로드에서만 쓰므로 import 비용을 서버 시작이 아니라 첫 업로드 때(스레드 풀에서) 치릅니다.
+    from ..services.transaction_import import import_transactions
+    return import_transactions(*args)
+
 @router.post("/upload", response_model=dict)
 async def upload_transactions(
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    batch_size: Optional[int] = Query(None, ge=1, le=5000),
+    supabase: AsyncSupabase = Depends(get_supabase)
 ):
-    """엑셀 파일에서 거래 내역 업로드"""
+    """엑셀/CSV 파일에서 거래 내역 업로드"""
+    if not file.filename.endswith(('.xlsx', '.xls', '.csv')):
+        raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다.")
+    
+    report = None
     try:
-        print(f"파일 업로드 시작: {file.filename}")
-        
-        if not file.filename.endswith(('.xlsx', '.xls', '.csv')):
-            raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다.")
-        
-        # 파일 읽기
-        contents = await file.read()
-        print(f"파일 크기: {len(contents)} bytes")
-        
-        # 간단한 테스트를 위해 DB 연결 확인
-        test_result = supabase.table('transactions').select('count', count='exact').execute()
-        print(f"DB 연결 테스트 성공, 기존 레코드 수: {test_result.count}")
-        
-        # 파일 파싱
-        if file.filename.endswith('.csv'):
-            df = pd.read_csv(io.BytesIO(contents))
-        else:
-            df = pd.read_excel(io.BytesIO(contents))
-        
-        print(f"DataFrame 생성 성공, 행 수: {len(df)}, 컬럼: {list(df.columns)}")
-        
-        # 일단 첫 번째 행만 테스트
-        if len(df) > 0:
-            first_row = df.iloc[0]
-            print(f"첫 번째 행 데이터: {dict(first_row)}")
-            
-            # 간단한 테스트 레코드 삽입
-            test_record = {
-                'transaction_date': '2025-07-08T10:00:00',
-                'description': '테스트 거래',
-                'transaction_type': '테스트',
-                'institution': '테스트 은행',
-                'account_number': '123456789',
-                'amount': 1000,
-                'balance': 100000,
-                'memo': '테스트 메모',
-                'file_name': file.filename
-            }
-            
-            result = supabase.table('transactions').insert(test_record).execute()
-            print(f"테스트 레코드 삽입 성공: {result.data}")
-            
-            return {
-                "status": "success",
-                "message": "테스트 업로드 성공",
-                "test_record": result.data[0] if result.data else None,
-                "file_info": {
-                    "name": file.filename,
-                    "size": len(contents),
-                    "rows": len(df),
-                    "columns": list(df.columns)
-                }
-            }
-        else:
-            return {"status": "error", "message": "파일에 데이터가 없습니다."}
-            
+        # 업로드 파일은 디스크에 spool 되어 있으므로 전체를 메모리에 올리지 않고 청크 단위로 읽습니다.
+        report = await supabase.run(
+            _import_transactions, supabase.client, file.file, file.filename, batch_size
+        )
     except Exception as e:
-        print(f"업로드 오류: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"업로드 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"파일 처리 중 오류 발생: {str(e)}")
+    finally:
+        if report is None:
+            # 중간에 실패해도 일부 배치는 이미 저장되었을 수 있으므로 전부 비웁니다.
+            invalidate_transaction_stats()
+        elif report["inserted_rows"]:
+            # 저장된 거래 기간에 걸친 요약 버킷만 다시 집계합니다.
+            invalidate_transaction_stats(report["first_transaction_date"], report["last_transaction_date"])
+    
+    if report["total_rows"] == 0:
+        return {"status": "error", "message": "파일에 데이터가 없습니다.", **report}
+    
+    return {"status": "success", "message": "업로드 완료", **report}
+
+def _invalidate_bulk(report: dict) -> None:
+    if report["first_transaction_date"]:
+        invalidate_transaction_stats(report["first_transaction_date"], report["last_transaction_date"])
+
+@router.post("/bulk-delete", response_model=dict, dependencies=[Depends(require_admin)])
+async def bulk_delete_transactions(
+    request: TransactionBulkDelete,
+    supabase: AsyncSupabase = Depends(get_supabase)
+):
+    """
+    거래 내역 일괄 삭제 (ids 목록 또는 file_name으로 업로드 되돌리기, 관리자 전용)
+    id 200개당 DB 문장 하나로 처리하고 행별 결과를 반환합니다.
+    file_name은 최대 5000건까지이며 삭제한 행 수(deleted)를 함께 반환합니다.
+    """
+    try:
+        report = await bulk_delete(supabase, request.ids, request.file_name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"일괄 삭제 실패: {str(e)}")
+
+    _invalidate_bulk(report)
+    return report
+
+@router.post("/bulk-update", response_model=dict, dependencies=[Depends(require_admin)])
+async def bulk_update_transactions(
+    request: TransactionBulkUpdate,
+    supabase: AsyncSupabase = Depends(get_supabase)
+):
+    """
+    거래 내역 일괄 수정 (관리자 전용)
+    ids/file_name(최대 5000건) + changes로 같은 값을 적용하거나 items로 행마다 다른 값을 지정합니다.
+    지정한 필드만 바뀌며 행별 결과를 반환합니다.
+    """
+    try:
+        report = await bulk_update(supabase, request.ids, request.file_name, request.changes, request.items)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"일괄 수정 실패: {str(e)}")
+
+    _invalidate_bulk(report)
+    return report
 
 @router.delete("/{transaction_id}")
-async def delete_transaction(transaction_id: str):
+async def delete_transaction(
+    transaction_id: str,
+    supabase: AsyncSupabase = Depends(get_supabase)
+):
     """거래 내역 삭제"""
     try:
-        result = supabase.table('transactions').delete().eq('id', transaction_id).execute()
+        result = await supabase.execute(supabase.table('transactions').delete().eq('id', transaction_id))
         
         if not result.data:
             raise HTTPException(status_code=404, detail="거래 내역을 찾을 수 없습니다.")
         
+        dates = [row["transaction_date"] for row in result.data]
+        invalidate_transaction_stats(min(dates), max(dates))
+        
         return {"message": "거래 내역이 삭제되었습니다."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"삭제 실패: {str(e)}")
@@ -214,7 +391,8 @@ async def delete_transaction(transaction_id: str):
 @router.put("/{transaction_id}", response_model=TransactionResponse)
 async def update_transaction(
     transaction_id: str, 
-    transaction: TransactionCreate
+    transaction: TransactionCreate,
+    supabase: AsyncSupabase = Depends(get_supabase)
 ):
     """거래 내역 수정"""
     try:
@@ -228,11 +406,13 @@ async def update_transaction(
             'memo': transaction.memo
         }
         
-        result = supabase.table('transactions').update(update_data).eq('id', transaction_id).execute()
+        result = await supabase.execute(supabase.table('transactions').update(update_data).eq('id', transaction_id))
         
         if not result.data:
             raise HTTPException(status_code=404, detail="거래 내역을 찾을 수 없습니다.")
         
+        invalidate_transaction_stats(result.data[0]["transaction_date"], result.data[0]["transaction_date"])
+        
         return result.data[0]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"수정 실패: {str(e)}")
\ No newline at end of file
@@ -1,22 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
-from ..core.database import get_supabase
+from ..core.database import AsyncSupabase, get_supabase
+from ..core.responses import project_rows, trusted_response
 from ..core.security import get_current_user
 from ..models.profile import Profile, ProfileCreate, ProfileUpdate
-from supabase import Client
+from ..services.member_directory import member_directory
 from datetime import datetime
 from gotrue.types import User
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+PROFILE_FIELDS = list(Profile.model_fields)
+
 @router.get("/me", response_model=Profile)
-async def read_user_me(current_user: User = Depends(get_current_user), supabase: Client = Depends(get_supabase)):
+async def read_user_me(current_user: User = Depends(get_current_user), supabase: AsyncSupabase = Depends(get_supabase)):
     """
     현재 로그인된 사용자의 프로필 정보를 반환합니다.
     """
     try:
         # get_current_user를 통해 인증된 사용자의 ID를 사용하여 프로필을 조회합니다.
-        profile = supabase.table("profiles").select("*").eq("id", str(current_user.id)).single().execute()
+        profile = await supabase.execute(
+            supabase.table("profiles").select("*").eq("id", str(current_user.id)).single()
+        )
         
         if not profile.data:
             raise HTTPException(status_code=404, detail="Profile not found for the current user")
@@ -29,31 +34,61 @@ async def read_user_me(current_user: User = Depends(get_current_user), supabase:
 async def read_users(
     name: Optional[str] = None,
     department: Optional[str] = None,
-    supabase: Client = Depends(get_supabase)
+    q: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    supabase: AsyncSupabase = Depends(get_supabase)
 ):
+    """
+    회원을 검색합니다. 메모리 색인이 준비되어 있으면 DB를 거치지 않고 순위대로 반환합니다.
+    
+    Args:
+        name: 이름 또는 초성 검색어 (예: 김아그, ㄱㅇㄱ, 김ㅇ)
+        department: 학과 (정확히 일치)
+        q: 이름, 초성, 학번, 학과, Slack ID 전체에서 검색
+        limit: 최대 반환 개수 (없으면 전체)
+    
+    색인과 DB의 행은 응답 모델 필드만 남겨 다시 검증하지 않고 그대로 직렬화합니다.
+    """
     try:
+        if member_directory.ready:
+            if q:
+                rows = member_directory.search(q, department=department, limit=limit, all_fields=True)
+            else:
+                rows = member_directory.search(name, department=department, limit=limit)
+            return trusted_response(project_rows(rows, PROFILE_FIELDS), Profile)
+
+        # 색인이 아직 준비되지 않았으면 DB에서 조회합니다. (초성 검색은 지원하지 않음)
         query = supabase.table("profiles").select("*")
         
-        if name:
-            query = query.ilike("name", f"%{name}%")
+        if name or q:
+            query = query.ilike("name", f"%{name or q}%")
         if department:
             query = query.eq("department", department)
             
-        result = query.execute()
-        return result.data
+        if limit:
+            query = query.limit(limit)
+        result = await supabase.execute(query)
+        return trusted_response(project_rows(result.data, PROFILE_FIELDS), Profile)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/directory/stats")
+async def get_directory_stats():
+    """
+    회원 검색 색인 상태를 반환합니다.
+    """
+    return {"status": "success", "data": member_directory.stats()}
+
 @router.patch("/me", response_model=Profile)
 async def update_user_me(
     profile_update: ProfileUpdate,
-    supabase: Client = Depends(get_supabase)
+    supabase: AsyncSupabase = Depends(get_supabase)
 ):
     raise HTTPException(status_code=501, detail="로그인/인증 기능이 비활성화되어 있습니다.")
 
     try:
         # 현재 로그인된 사용자 정보 조회
-        user = supabase.auth.get_user()
+        user = await supabase.run(supabase.auth.get_user)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -62,7 +97,9 @@ async def update_user_me(
         update_data["updated_at"] = datetime.utcnow().isoformat()
 
         # profiles 테이블 업데이트
-        result = supabase.table("profiles").update(update_data).eq("id", user.user.id).execute()
+        result = await supabase.execute(
+            supabase.table("profiles").update(update_data).eq("id", user.user.id)
+        )
 
         if not result.data:
             raise HTTPException(status_code=404, detail="Profile not found")
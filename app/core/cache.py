@@ -0,0 +1,126 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+import threading
+import time
+
+
+class TTLCache:
+    """
+    크기 제한(LRU)과 만료 시간(TTL)을 함께 가지는 프로세스 내 캐시입니다.
+    여러 스레드에서 동시에 접근해도 안전합니다.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            # 최근 사용한 항목을 맨 뒤로 옮깁니다 (LRU)
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[1] if entry else default
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class SizedLRUCache:
+    """
+    전체 크기(bytes) 상한을 가지는 LRU 캐시입니다.
+    항목의 유효성은 호출하는 쪽에서(예: 원본의 수정 시각 비교) 판단합니다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[Hashable, Tuple[int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, size: int) -> None:
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[0]
+            # 상한보다 큰 항목은 캐시하지 않습니다.
+            if size > self.max_bytes:
+                return
+            self._data[key] = (size, value)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, (evicted_size, _) = self._data.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return default
+            self.total_bytes -= entry[0]
+            return entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._data),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 import os
 from dotenv import load_dotenv
 import logging
@@ -14,22 +14,109 @@ load_dotenv(env_path)
 logger.debug(f"Loading environment variables from: {env_path}")
 logger.debug(f"GOOGLE_CREDENTIALS_PATH: {os.getenv('GOOGLE_CREDENTIALS_PATH')}")
 
+# JWT_SECRET_KEY 기본값 (local 토큰 검증에서는 사용할 수 없음, security.check_auth_settings)
+DEFAULT_JWT_SECRET_KEY = "your-secret-key"
+
 class Settings(BaseModel):
     # Supabase 설정
     SUPABASE_URL: str = os.getenv("SUPABASE_URL", "")
     SUPABASE_KEY: str = os.getenv("SUPABASE_KEY", "")
+    # 동기 Supabase 호출을 실행할 스레드 풀 크기
+    SUPABASE_POOL_SIZE: int = int(os.getenv("SUPABASE_POOL_SIZE", "32"))
     
     # JWT 설정
-    JWT_SECRET_KEY: str = "your-secret-key"  # 실제 운영 환경에서는 안전한 키로 변경
-    JWT_ALGORITHM: str = "HS256"
+    JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", DEFAULT_JWT_SECRET_KEY)  # 실제 운영 환경에서는 Supabase JWT secret으로 설정
+    JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
+    JWT_AUDIENCE: str = os.getenv("JWT_AUDIENCE", "authenticated")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+
+    # 토큰 검증 설정
+    # remote: 매 요청마다 Supabase에 토큰을 확인, local: 서명과 만료를 로컬에서 검증
+    AUTH_VERIFY_MODE: str = os.getenv("AUTH_VERIFY_MODE", "remote")
+    AUTH_CACHE_MAX_SIZE: int = int(os.getenv("AUTH_CACHE_MAX_SIZE", "10000"))
+    AUTH_CACHE_TTL_SECONDS: int = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "300"))
+    # 캐시된 토큰을 Supabase에 다시 확인(폐기 여부)하는 주기, 0이면 확인하지 않음
+    AUTH_REVOCATION_CHECK_SECONDS: int = int(os.getenv("AUTH_REVOCATION_CHECK_SECONDS", "60"))
     
+    # DB에서 바로 읽은 목록 응답도 응답 모델로 검증할지 여부 (개발/테스트에서 스키마 불일치 확인용)
+    RESPONSE_VALIDATE_TRUSTED: bool = os.getenv("RESPONSE_VALIDATE_TRUSTED", "false").lower() == "true"
+    
+    # 거래 통계 캐시 유지 시간 (초)
+    TRANSACTION_STATS_CACHE_SECONDS: int = int(os.getenv("TRANSACTION_STATS_CACHE_SECONDS", "300"))
+    # 기간별 거래 요약에서 지난 버킷을 기억하는 시간 (초, 진행 중인 버킷은 위의 통계 캐시 시간을 씁니다)
+    TRANSACTION_SUMMARY_CACHE_SECONDS: int = int(os.getenv("TRANSACTION_SUMMARY_CACHE_SECONDS", "86400"))
+
+    # 거래내역 업로드 설정 (파싱 청크 크기, insert 배치 크기)
+    TRANSACTION_IMPORT_CHUNK_SIZE: int = int(os.getenv("TRANSACTION_IMPORT_CHUNK_SIZE", "5000"))
+    TRANSACTION_IMPORT_BATCH_SIZE: int = int(os.getenv("TRANSACTION_IMPORT_BATCH_SIZE", "500"))
+    # 중복 확인 RPC 한 번에 보낼 자연 키 수 (이만큼 행을 모은 뒤 조회하고 insert 합니다)
+    TRANSACTION_DEDUP_LOOKUP_SIZE: int = int(os.getenv("TRANSACTION_DEDUP_LOOKUP_SIZE", "20000"))
+
     # Google Sheets 설정
     GOOGLE_CREDENTIALS_PATH: str = os.getenv("GOOGLE_CREDENTIALS_PATH", "")
+    # 여러 시트를 동시에 읽을 때의 최대 동시 요청 수와 시트별 타임아웃 (초)
+    GOOGLE_SHEETS_CONCURRENCY: int = int(os.getenv("GOOGLE_SHEETS_CONCURRENCY", "8"))
+    GOOGLE_SHEETS_TIMEOUT_SECONDS: float = float(os.getenv("GOOGLE_SHEETS_TIMEOUT_SECONDS", "30"))
+    # 스프레드시트 캐시가 사용할 최대 메모리 (bytes)
+    GOOGLE_SHEETS_CACHE_MAX_BYTES: int = int(os.getenv("GOOGLE_SHEETS_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    # 스프레드시트 export 시 한 번에 읽을 행 수
+    GOOGLE_SHEETS_EXPORT_PAGE_SIZE: int = int(os.getenv("GOOGLE_SHEETS_EXPORT_PAGE_SIZE", "1000"))
+    # 범위 조회 시 시트 헤더(열 계획)와 마지막 행 번호를 재사용할 시간 (초)
+    GOOGLE_SHEETS_HEADER_TTL_SECONDS: float = float(os.getenv("GOOGLE_SHEETS_HEADER_TTL_SECONDS", "300"))
+    # Sheets/Drive API 호출 속도 제한 (토큰 버킷: 분당 채워지는 수 + 최대 버스트)
+    # 기본값은 어느 1분 구간에서도 사용자당 읽기 할당량(분당 60회)을 넘지 않도록 50 + 10 입니다.
+    GOOGLE_SHEETS_REQUESTS_PER_MINUTE: float = float(os.getenv("GOOGLE_SHEETS_REQUESTS_PER_MINUTE", "50"))
+    GOOGLE_SHEETS_BURST: int = int(os.getenv("GOOGLE_SHEETS_BURST", "10"))
+    # 할당량 토큰을 기다릴 최대 시간 (초, 넘으면 429로 응답)
+    GOOGLE_SHEETS_QUOTA_WAIT_SECONDS: float = float(os.getenv("GOOGLE_SHEETS_QUOTA_WAIT_SECONDS", "20"))
+    # 429/5xx 응답 재시도 횟수와 지수 백오프 (초)
+    GOOGLE_SHEETS_MAX_RETRIES: int = int(os.getenv("GOOGLE_SHEETS_MAX_RETRIES", "4"))
+    GOOGLE_SHEETS_BACKOFF_BASE_SECONDS: float = float(os.getenv("GOOGLE_SHEETS_BACKOFF_BASE_SECONDS", "1"))
+    GOOGLE_SHEETS_BACKOFF_MAX_SECONDS: float = float(os.getenv("GOOGLE_SHEETS_BACKOFF_MAX_SECONDS", "32"))
+    # 회원 동기화 시 한 번에 upsert 할 행 수
+    PROFILE_SYNC_BATCH_SIZE: int = int(os.getenv("PROFILE_SYNC_BATCH_SIZE", "500"))
+    # 지원자 일괄 등록 시 동시에 보낼 auth admin API 요청 수
+    ONBOARDING_CONCURRENCY: int = int(os.getenv("ONBOARDING_CONCURRENCY", "10"))
+
+    # 회원 검색 색인 설정
+    # 변경분(updated_at 워터마크) 반영 주기와 전체 재색인 주기 (초)
+    MEMBER_DIRECTORY_REFRESH_SECONDS: float = float(os.getenv("MEMBER_DIRECTORY_REFRESH_SECONDS", "30"))
+    MEMBER_DIRECTORY_REBUILD_SECONDS: float = float(os.getenv("MEMBER_DIRECTORY_REBUILD_SECONDS", "3600"))
+
+    # 백그라운드 작업 설정 (앱 프로세스 안에서 실행, 외부 브로커 없음)
+    # 여러 프로세스로 띄울 때는 한 프로세스에서만 true로 두어 주기 작업이 한 번씩만 돌게 합니다.
+    JOBS_ENABLED: bool = os.getenv("JOBS_ENABLED", "true").lower() == "true"
+    # 동시에 실행할 작업 수, 대기열 크기, 작업별 제한 시간 (초), 보관할 실행 기록 수
+    JOBS_WORKERS: int = int(os.getenv("JOBS_WORKERS", "2"))
+    JOBS_QUEUE_SIZE: int = int(os.getenv("JOBS_QUEUE_SIZE", "100"))
+    JOBS_TIMEOUT_SECONDS: float = float(os.getenv("JOBS_TIMEOUT_SECONDS", "600"))
+    JOBS_HISTORY_SIZE: int = int(os.getenv("JOBS_HISTORY_SIZE", "200"))
+    # 주기 작업: 지원서 시트 회원 동기화 (시트 이름, 비우면 끔)
+    JOBS_SYNC_SHEET_NAME: str = os.getenv("JOBS_SYNC_SHEET_NAME", "")
+    JOBS_SYNC_INTERVAL_SECONDS: float = float(os.getenv("JOBS_SYNC_INTERVAL_SECONDS", "300"))
+    # 주기 작업: 스프레드시트 캐시 미리 읽기 (쉼표로 구분한 ID, 비우면 끔)
+    JOBS_SPREADSHEET_IDS: List[str] = [
+        s.strip() for s in os.getenv("JOBS_SPREADSHEET_IDS", "").split(",") if s.strip()
+    ]
+    JOBS_SPREADSHEET_INTERVAL_SECONDS: float = float(os.getenv("JOBS_SPREADSHEET_INTERVAL_SECONDS", "300"))
+    # 주기 작업: 이번 학기 거래 통계 미리 계산 (초, 0이면 끔. 통계 캐시 시간보다 짧게 두면 항상 캐시에서 응답)
+    JOBS_STATS_INTERVAL_SECONDS: float = float(os.getenv("JOBS_STATS_INTERVAL_SECONDS", "240"))
     
     # Slack 설정
-    SLACK_BOT_TOKEN: Optional[str] = None
-    SLACK_SIGNING_SECRET: Optional[str] = None
+    SLACK_BOT_TOKEN: Optional[str] = os.getenv("SLACK_BOT_TOKEN")
+    SLACK_SIGNING_SECRET: Optional[str] = os.getenv("SLACK_SIGNING_SECRET")
+    # 참가 의사로 인정할 이모지 (쉼표로 구분, 비우면 모든 이모지)
+    SLACK_PARTICIPATION_REACTIONS: List[str] = [
+        r.strip() for r in os.getenv("SLACK_PARTICIPATION_REACTIONS", "white_check_mark").split(",") if r.strip()
+    ]
+    # 반응 이벤트 처리 배치 설정
+    SLACK_REACTION_BATCH_SIZE: int = int(os.getenv("SLACK_REACTION_BATCH_SIZE", "200"))
+    SLACK_REACTION_FLUSH_INTERVAL: float = float(os.getenv("SLACK_REACTION_FLUSH_INTERVAL", "0.5"))
+    SLACK_REACTION_QUEUE_SIZE: int = int(os.getenv("SLACK_REACTION_QUEUE_SIZE", "10000"))
+    # DB 반영이 실패한 배치를 다시 시도할 최대 횟수 (지수 백오프, 그 사이 새 이벤트는 큐에 쌓임)
+    SLACK_REACTION_MAX_ATTEMPTS: int = int(os.getenv("SLACK_REACTION_MAX_ATTEMPTS", "10"))
+    # 메시지 ts -> 행사, Slack 사용자 -> 회원 인덱스 캐시 유지 시간 (초)
+    SLACK_INDEX_TTL_SECONDS: int = int(os.getenv("SLACK_INDEX_TTL_SECONDS", "300"))
     
     class Config:
         case_sensitive = True
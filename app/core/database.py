@@ -1,12 +1,108 @@
-from supabase import create_client
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from .config import settings
+from .metrics import describe_query, registry, track_dependency
+import asyncio
+import threading
+import time
 
-supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+if TYPE_CHECKING:
+    from supabase import Client
+
+supabase_pool_wait = registry.histogram(
+    "clubos_supabase_pool_wait_seconds", "Time Supabase calls wait for a free worker thread"
+)
+
+class AsyncSupabase:
+    """
+    동기 Supabase 클라이언트를 감싸 네트워크 호출을 전용 스레드 풀에서 실행합니다.
+
+    쿼리 조립은 기존처럼 table(), rpc() 등 클라이언트 메서드를 그대로 사용하고,
+    실제로 요청을 보내는 부분만 execute()/run()으로 await 하면
+    느린 쿼리가 이벤트 루프(다른 요청들)를 막지 않습니다.
+
+    client 대신 client_factory를 넘기면 클라이언트는 처음 사용할 때 만듭니다.
+    """
+
+    def __init__(
+        self,
+        client: Optional["Client"] = None,
+        max_workers: int = 1,
+        client_factory: Optional[Callable[[], "Client"]] = None
+    ):
+        if client is None and client_factory is None:
+            raise ValueError("client or client_factory is required")
+        self._client = client
+        self._client_factory = client_factory
+        self._client_lock = threading.Lock()
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="supabase")
+
+    @property
+    def client(self) -> "Client":
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._client_factory()
+        return self._client
+
+    async def connect(self) -> None:
+        """클라이언트를 스레드 풀에서 미리 만듭니다. (lifespan에서 이벤트 루프를 막지 않도록)"""
+        if self._client is None:
+            await asyncio.get_running_loop().run_in_executor(self._executor, lambda: self.client)
+
+    def __getattr__(self, name: str) -> Any:
+        # table, rpc, auth 등은 원래 클라이언트로 위임합니다.
+        return getattr(self.client, name)
+
+    @staticmethod
+    def _timed(operation: str, submitted: float, func: Callable[[], Any]) -> Any:
+        # 스레드를 기다린 시간과 실제 호출 시간을 따로 기록합니다.
+        supabase_pool_wait.observe(time.perf_counter() - submitted)
+        with track_dependency("supabase", operation):
+            return func()
+
+    async def _submit(self, operation: str, func: Callable[[], Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(self._timed, operation, time.perf_counter(), func)
+        )
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """동기 함수를 Supabase 전용 스레드 풀에서 실행합니다."""
+        operation = getattr(func, "__qualname__", None) or type(func).__name__
+        return await self._submit(operation, partial(func, *args, **kwargs))
+
+    async def execute(self, query: Any) -> Any:
+        """postgrest 쿼리 빌더의 execute()를 스레드 풀에서 실행합니다."""
+        return await self._submit(describe_query(query), query.execute)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+def _create_client() -> "Client":
+    # supabase 패키지(httpx, postgrest, gotrue, realtime, storage)는 import만 수백 ms가 걸리므로
+    # 모듈을 불러올 때가 아니라 클라이언트가 처음 필요할 때 가져옵니다.
+    from supabase import create_client
+    return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+
+db = AsyncSupabase(client_factory=_create_client, max_workers=settings.SUPABASE_POOL_SIZE)
+
+def get_client() -> "Client":
+    """동기 Supabase 클라이언트를 반환합니다. (처음 호출할 때 생성)"""
+    return db.client
+
+def __getattr__(name: str) -> Any:
+    # 기존 `from app.core.database import supabase` 호환
+    if name == "supabase":
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 async def get_supabase():
     try:
-        yield supabase
+        yield db
     finally:
-        # Supabase 클라이언트는 자동으로 연결을 관리하므로 
+        # Supabase 클라이언트는 자동으로 연결을 관리하므로
         # 별도의 cleanup이 필요하지 않습니다.
-        pass 
\ No newline at end of file
+        pass
@@ -0,0 +1,301 @@
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import bisect
+import logging
+import threading
+import time
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 요청/외부 호출 지연 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 -> [구간별 개수..., 합계, 개수]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._values.items())
+        lines = self.header()
+        for key, series in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {_format_value(cumulative)}")
+            le = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {series[-2]!r}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {_format_value(series[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Prometheus 텍스트 형식으로 내보낼 지표 모음입니다.
+
+    collector는 /metrics 요청 때마다 호출되어 큐 깊이, 캐시 크기처럼
+    다른 모듈이 이미 들고 있는 값을 게이지로 옮깁니다.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {str(e)}")
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "clubos_http_requests_total", "HTTP requests by route and status", ("method", "route", "status")
+)
+http_request_duration = registry.histogram(
+    "clubos_http_request_duration_seconds", "HTTP request latency by route", ("method", "route")
+)
+http_requests_in_flight = registry.gauge(
+    "clubos_http_requests_in_flight", "HTTP requests currently being processed", ("method",)
+)
+dependency_calls_total = registry.counter(
+    "clubos_dependency_calls_total", "Outbound calls by backend, operation and outcome", ("backend", "operation", "outcome")
+)
+dependency_call_duration = registry.histogram(
+    "clubos_dependency_call_duration_seconds", "Outbound call latency by backend and operation", ("backend", "operation")
+)
+
+
+@contextmanager
+def track_dependency(backend: str, operation: str) -> Iterator[None]:
+    """
+    Supabase, Google Sheets, Slack 등 외부 호출 한 번의 지연 시간과 성공/실패를 기록합니다.
+
+        with track_dependency("google_sheets", "values_get"):
+            ...
+    """
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        dependency_call_duration.observe(time.perf_counter() - started, backend=backend, operation=operation)
+        dependency_calls_total.inc(backend=backend, operation=operation, outcome=outcome)
+
+
+def describe_query(query: Any) -> str:
+    """
+    postgrest 쿼리 빌더를 "GET profiles", "POST rpc/transaction_stats" 같은 라벨로 바꿉니다.
+    """
+    request = getattr(query, "request", query)
+    method = getattr(request, "http_method", None) or str(getattr(query, "action", "execute")).upper()
+    path = str(getattr(request, "path", "") or "")
+    if "/rest/v1/" in path:
+        path = path.split("/rest/v1/", 1)[1]
+    path = path.split("?", 1)[0].strip("/")
+    return f"{method} {path}" if path else method
+
+
+def execute_query(query: Any) -> Any:
+    """
+    스레드에서 동기 클라이언트로 직접 실행하는 쿼리(배치 작업 등)의 execute()를 기록과 함께 호출합니다.
+    """
+    with track_dependency("supabase", describe_query(query)):
+        return query.execute()
+
+
+def route_template(scope: Dict[str, Any]) -> str:
+    """
+    요청 경로의 경로 파라미터 값을 이름으로 바꿔 라우트 템플릿을 만듭니다.
+    ("/transactions/3f2a..." -> "/transactions/{transaction_id}")
+
+    라우터 prefix 처리 방식이 FastAPI 버전마다 달라 route.path 대신 실제 경로에서 만듭니다.
+    라우트에 매칭되지 않은 요청은 "<unmatched>"로 묶습니다.
+    """
+    if scope.get("route") is None and scope.get("endpoint") is None:
+        return "<unmatched>"
+    path = scope.get("path", "")
+    for name, value in (scope.get("path_params") or {}).items():
+        value = str(value)
+        if not value:
+            continue
+        if "/" in value:
+            path = path.replace(value, "{" + name + "}", 1)
+        else:
+            path = "/".join("{" + name + "}" if segment == value else segment for segment in path.split("/"))
+    return path
+
+
+class MetricsMiddleware:
+    """
+    라우트별 지연 시간 히스토그램, 요청 수, 처리 중인 요청 수를 기록하는 ASGI 미들웨어입니다.
+
+    라우트 라벨은 실제 경로가 아니라 라우트 템플릿(/transactions/{transaction_id})을 사용해
+    라벨 종류가 요청 경로 수만큼 늘어나지 않도록 합니다. 스트리밍 응답은 마지막 바이트까지의 시간입니다.
+    """
+
+    def __init__(self, app: Any, exclude_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = set(exclude_paths)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or scope.get("path") in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "")
+        status: Optional[int] = None
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method=method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec(method=method)
+            route_path = route_template(scope)
+            http_request_duration.observe(elapsed, method=method, route=route_path)
+            http_requests_total.inc(method=method, route=route_path, status=status or 500)
@@ -0,0 +1,55 @@
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Type
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from .config import settings
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 동작합니다.
+    orjson = None
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson으로 직렬화하는 JSON 응답입니다. (orjson이 없으면 표준 json)
+
+    datetime, date, UUID 같은 값은 orjson이 직접 ISO 8601 문자열로 바꿉니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+_adapters: Dict[Type[BaseModel], TypeAdapter] = {}
+
+def model_columns(model: Type[BaseModel]) -> str:
+    """모델 필드만 조회하도록 PostgREST select 문자열을 만듭니다. ("id,name,...")"""
+    return ",".join(model.model_fields)
+
+def project_rows(rows: Iterable[Mapping[str, Any]], fields: Sequence[str]) -> List[Dict[str, Any]]:
+    """행에서 응답 모델 필드만 남깁니다. (없는 필드는 None)"""
+    return [{field: row.get(field) for field in fields} for row in rows]
+
+def trusted_response(
+    content: Any,
+    model: Optional[Type[BaseModel]] = None,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None
+) -> FastJSONResponse:
+    """
+    우리 DB에서 바로 읽은 행처럼 이미 응답 모델 모양인 데이터를 검증 없이 내보냅니다.
+
+    Response를 직접 반환하면 FastAPI는 response_model 검증과 jsonable_encoder를 건너뛰므로
+    1,000행 목록에서도 orjson 직렬화 비용만 남습니다. 행은 model_columns()로 조회하거나
+    project_rows()로 모델 필드만 남긴 것이어야 합니다.
+
+    RESPONSE_VALIDATE_TRUSTED=true이면 (개발/테스트용) 내보내기 전에 model로 검증해
+    스키마와 응답 모델이 어긋난 것을 바로 알 수 있습니다.
+    """
+    if model is not None and settings.RESPONSE_VALIDATE_TRUSTED:
+        adapter = _adapters.get(model)
+        if adapter is None:
+            adapter = _adapters[model] = TypeAdapter(List[model])
+        adapter.validate_python(content if isinstance(content, list) else [content])
+    return FastJSONResponse(content, status_code=status_code, headers=dict(headers) if headers else None)
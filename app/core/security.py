@@ -1,7 +1,15 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from supabase import Client
-from ..core.database import get_supabase
+from gotrue.types import User
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+import hashlib
+import time
+import jwt
+from ..core.database import AsyncSupabase, get_supabase
+from .cache import TTLCache
+from .config import DEFAULT_JWT_SECRET_KEY, settings
 import logging
 
 # 로거 설정
@@ -11,9 +19,134 @@ logger = logging.getLogger(__name__)
 # 이것이 더 간단하고 명확한 "Authorize" UI를 생성합니다.
 security = HTTPBearer()
 
+@dataclass
+class _CachedUser:
+    user: User
+    expires_at: float
+    checked_at: float
+
+# 검증된 사용자 캐시 (토큰 해시 -> 사용자)
+_user_cache = TTLCache(
+    max_size=settings.AUTH_CACHE_MAX_SIZE,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
+_jwks_client: Optional[jwt.PyJWKClient] = None
+
+def _token_key(token: str) -> str:
+    # 원본 토큰을 메모리에 남기지 않도록 해시를 키로 사용합니다.
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def _insecure_local_secret() -> bool:
+    # 공개된 기본값이나 빈 비밀키로는 누구나 유효한 HS* 토큰(관리자 포함)을 만들 수 있습니다.
+    return (
+        settings.AUTH_VERIFY_MODE == "local"
+        and settings.JWT_ALGORITHM.startswith("HS")
+        and settings.JWT_SECRET_KEY in ("", DEFAULT_JWT_SECRET_KEY)
+    )
+
+def check_auth_settings() -> None:
+    """
+    앱 시작 시 토큰 검증 설정을 확인합니다.
+    local 모드의 HS* 검증에 비밀키가 없거나 기본값이면 시작하지 않습니다.
+    """
+    if _insecure_local_secret():
+        raise RuntimeError(
+            "AUTH_VERIFY_MODE=local with an HS* algorithm requires JWT_SECRET_KEY "
+            "to be set to the Supabase JWT secret"
+        )
+
+def _get_signing_key(token: str):
+    """
+    HS* 알고리즘은 공유 비밀키를, 그 외(RS*/ES*)는 Supabase JWKS의 공개키를 사용합니다.
+    JWKS는 PyJWKClient가 내부적으로 캐시합니다.
+    """
+    global _jwks_client
+    if settings.JWT_ALGORITHM.startswith("HS"):
+        if _insecure_local_secret():
+            raise jwt.InvalidKeyError("JWT_SECRET_KEY is not configured")
+        return settings.JWT_SECRET_KEY
+    if _jwks_client is None:
+        _jwks_client = jwt.PyJWKClient(
+            f"{settings.SUPABASE_URL}/auth/v1/.well-known/jwks.json",
+            cache_keys=True
+        )
+    return _jwks_client.get_signing_key_from_jwt(token).key
+
+def decode_token(token: str) -> dict:
+    """
+    JWT의 서명과 만료 시간을 로컬에서 검증하고 claims를 반환합니다.
+    유효하지 않으면 jwt.InvalidTokenError를 발생시킵니다.
+    """
+    return jwt.decode(
+        token,
+        _get_signing_key(token),
+        algorithms=[settings.JWT_ALGORITHM],
+        audience=settings.JWT_AUDIENCE,
+        options={"require": ["exp", "sub"]}
+    )
+
+def _user_from_claims(claims: dict) -> User:
+    aud = claims.get("aud", settings.JWT_AUDIENCE)
+    return User(
+        id=claims["sub"],
+        aud=aud[0] if isinstance(aud, list) else aud,
+        email=claims.get("email"),
+        phone=claims.get("phone"),
+        role=claims.get("role"),
+        app_metadata=claims.get("app_metadata", {}),
+        user_metadata=claims.get("user_metadata", {}),
+        is_anonymous=claims.get("is_anonymous", False),
+        # 토큰에는 가입 시각이 없으므로 발급 시각으로 대신합니다.
+        created_at=datetime.fromtimestamp(claims.get("iat", 0), tz=timezone.utc)
+    )
+
+async def _verify_remote(token: str, supabase: AsyncSupabase) -> Optional[User]:
+    # Supabase에 토큰이 유효한지 물어봅니다.
+    user_response = await supabase.run(supabase.auth.get_user, token)
+    return user_response.user if user_response else None
+
+async def verify_token(token: str, supabase: AsyncSupabase) -> Optional[User]:
+    """
+    토큰을 검증하고 사용자 정보를 반환합니다.
+
+    local 모드에서는 처음 보는 토큰만 로컬에서 서명을 검증해 캐시에 넣고,
+    캐시된 토큰은 AUTH_REVOCATION_CHECK_SECONDS 주기로만 Supabase에 폐기 여부를 확인합니다.
+    """
+    if settings.AUTH_VERIFY_MODE != "local":
+        return await _verify_remote(token, supabase)
+
+    key = _token_key(token)
+    now = time.time()
+    entry = _user_cache.get(key)
+
+    if entry is None:
+        claims = decode_token(token)
+        user = _user_from_claims(claims)
+        ttl = min(settings.AUTH_CACHE_TTL_SECONDS, claims["exp"] - now)
+        _user_cache.set(key, _CachedUser(user, claims["exp"], now), ttl=ttl)
+        return user
+
+    if entry.expires_at <= now:
+        _user_cache.pop(key)
+        return None
+
+    interval = settings.AUTH_REVOCATION_CHECK_SECONDS
+    if interval and now - entry.checked_at >= interval:
+        user = await _verify_remote(token, supabase)
+        if user is None:
+            _user_cache.pop(key)
+            return None
+        entry.user = user
+        entry.checked_at = now
+
+    return entry.user
+
+def clear_auth_cache() -> None:
+    _user_cache.clear()
+
 async def get_current_user(
-    authorization: HTTPAuthorizationCredentials = Depends(security), 
-    supabase: Client = Depends(get_supabase)
+    authorization: HTTPAuthorizationCredentials = Depends(security),
+    supabase: AsyncSupabase = Depends(get_supabase)
 ):
     """
     요청 헤더에서 JWT 토큰을 가져와 유효성을 검사하고,
@@ -26,17 +159,25 @@ async def get_current_user(
     )
     try:
         token = authorization.credentials
-        # Supabase에 토큰이 유효한지 물어봅니다.
-        user_response = supabase.auth.get_user(token)
-        user = user_response.user
-        
+        user = await verify_token(token, supabase)
+
         if user is None:
             logger.warning("Invalid token or user not found.")
             raise credentials_exception
-        
-        logger.info(f"Successfully authenticated user: {user.id}")
+
+        logger.debug(f"Successfully authenticated user: {user.id}")
         return user
-        
+
     except Exception as e:
         logger.error(f"Authentication error: {e}")
         raise credentials_exception
+
+
+async def require_admin(user: User = Depends(get_current_user)):
+    """
+    관리자만 사용할 수 있는 엔드포인트용 의존성입니다.
+    app_metadata.role은 서비스 키로만 바꿀 수 있으므로 사용자가 스스로 관리자가 될 수 없습니다.
+    """
+    if (user.app_metadata or {}).get("role") != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자만 사용할 수 있습니다.")
+    return user
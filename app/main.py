@@ -1,11 +1,39 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from .api import users, google_sheets, auth, transactions
+from fastapi.middleware.gzip import GZipMiddleware
+from .api import users, google_sheets, auth, transactions, analytics, events, admin, jobs
+from .core.config import settings
+from .core.database import db
+from .core.metrics import MetricsMiddleware, registry
+from .core.responses import FastJSONResponse
+from .core.security import check_auth_settings
+from .services.jobs import job_scheduler
+from .services.member_directory import member_directory
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 누구나 토큰을 만들 수 있는 설정이면 시작하지 않습니다.
+    check_auth_settings()
+    # Supabase 클라이언트는 import 시점이 아니라 여기서(스레드 풀에서) 만듭니다.
+    await db.connect()
+    # 회원 검색 색인은 백그라운드에서 만들고 주기적으로 갱신합니다.
+    member_directory.start(db)
+    # 시트 동기화, 통계 미리 계산 등 백그라운드 작업 (프로세스 안의 대기열과 워커)
+    if settings.JOBS_ENABLED:
+        job_scheduler.start(db)
+    yield
+    await job_scheduler.stop()
+    await member_directory.stop()
 
 app = FastAPI(
     title="ClubOS API",
     description="ClubOS Backend API built with FastAPI",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # dict 응답은 orjson으로 직렬화합니다.
+    default_response_class=FastJSONResponse
 )
 
 # CORS 설정
@@ -15,14 +43,37 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Query-Count"],  # keyset 페이지네이션 cursor, 요청당 쿼리 수
 )
 
+# 응답 압축 (스트리밍 export 포함)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+# 라우트별 지연 시간/요청 수 기록 (가장 바깥에서 측정)
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(users.router)
 app.include_router(auth.router)
 app.include_router(google_sheets.router)
 app.include_router(transactions.router, prefix="/transactions", tags=["transactions"])
+app.include_router(analytics.router)
+app.include_router(events.router)
+app.include_router(admin.router)
+app.include_router(jobs.router)
+
+# Slack 앱은 생성할 때 토큰과 서명 비밀키가 필요하므로 둘 다 설정된 경우에만 불러옵니다.
+if settings.SLACK_BOT_TOKEN and settings.SLACK_SIGNING_SECRET:
+    from .api import slack
+    app.include_router(slack.router)
 
 @app.get("/")
 async def root():
-    return {"message": "Welcome to ClubOS API"} 
\ No newline at end of file
+    return {"message": "Welcome to ClubOS API"} 
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus 형식의 지표를 반환합니다.
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -2,12 +2,14 @@ from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
 import uuid
-from .profile import Profile
+from .profile import Profile, ProfileSummary
 
 class EventBase(BaseModel):
     name: str
     description: Optional[str] = None
     event_date: Optional[datetime] = None
+    # 행사 유형 (학술, 소셜, 정기총회 등), 분석 대시보드의 카테고리별 집계 기준
+    category: Optional[str] = None
     slack_message_ts: Optional[str] = None
 
 class EventCreate(EventBase):
@@ -23,4 +25,7 @@ class Event(EventBase):
         from_attributes = True
 
 class EventWithParticipants(Event):
-    participants: List[Profile] 
\ No newline at end of file
+    participants: List[Profile]
+
+class EventWithParticipantSummaries(Event):
+    participants: List[ProfileSummary]
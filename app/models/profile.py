@@ -35,4 +35,11 @@ class Profile(BaseModel):
     updated_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+class ProfileSummary(BaseModel):
+    """목록 화면에서 참가자를 보여줄 때 필요한 필드만 담은 프로필"""
+    id: str
+    name: str
+    department: Optional[str] = None
+    student_id: Optional[str] = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class TransactionBase(BaseModel):
@@ -24,6 +24,22 @@ class TransactionUpdate(BaseModel):
     balance: Optional[int] = None
     memo: Optional[str] = None
 
+class TransactionBulkUpdateItem(TransactionUpdate):
+    id: str
+
+class TransactionBulkUpdate(BaseModel):
+    # 대상: ids 또는 file_name(업로드 파일 전체)에 changes를 똑같이 적용하거나,
+    # items로 행마다 다른 값을 지정합니다. 지정한 필드만 바뀝니다.
+    ids: Optional[List[str]] = None
+    file_name: Optional[str] = None
+    changes: Optional[TransactionUpdate] = None
+    items: Optional[List[TransactionBulkUpdateItem]] = None
+
+class TransactionBulkDelete(BaseModel):
+    # ids 또는 file_name(업로드 되돌리기) 중 하나
+    ids: Optional[List[str]] = None
+    file_name: Optional[str] = None
+
 class Transaction(TransactionBase):
     id: str
     file_name: Optional[str] = None
@@ -0,0 +1,190 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from ..core.database import AsyncSupabase
+from .member_directory import member_directory
+import asyncio
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 분석 대시보드 KPI
+# 집계는 DB 트리거가 analytics_* 테이블에 증분으로 유지합니다. (20250801000005_analytics_rollups.sql)
+# 여기서는 집계 행 몇 개만 읽어 비율을 계산하므로 행사/참가 수가 늘어도 조회 비용이 일정합니다.
+# 과거 데이터를 채우거나 집계를 보정할 때: python -m app.services.analytics rebuild
+
+def _rate(numerator: float, denominator: float) -> float:
+    return round(numerator / denominator, 4) if denominator else 0.0
+
+async def _fetch_totals(supabase: AsyncSupabase) -> Dict[str, Any]:
+    result = await supabase.execute(supabase.table("analytics_totals").select("*").eq("id", 1))
+    row = result.data[0] if result.data else {}
+    return {
+        "total_events": row.get("total_events") or 0,
+        "total_participations": row.get("total_participations") or 0,
+        "total_members": row.get("total_members") or 0,
+        "active_members": row.get("active_members") or 0,
+        "updated_at": row.get("updated_at"),
+    }
+
+async def fetch_kpis(supabase: AsyncSupabase, upcoming_limit: int = 5) -> Dict[str, Any]:
+    """
+    전체 참여율, 활동 회원 비율, 예정 행사 관심도(현재 참가 의사 수)를 반환합니다.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    totals, upcoming = await asyncio.gather(
+        _fetch_totals(supabase),
+        supabase.execute(
+            supabase.table("analytics_event_stats")
+            .select("event_id,category,event_date,participant_count")
+            .gte("event_date", now)
+            .order("event_date")
+            .limit(upcoming_limit)
+        )
+    )
+
+    names: Dict[str, str] = {}
+    event_ids = [row["event_id"] for row in upcoming.data]
+    if event_ids:
+        events = await supabase.execute(supabase.table("events").select("id,name").in_("id", event_ids))
+        names = {str(row["id"]): row["name"] for row in events.data}
+
+    members = totals["total_members"]
+    events_count = totals["total_events"]
+    participations = totals["total_participations"]
+    return {
+        **totals,
+        # 행사 하나에 평균적으로 전체 회원 중 몇 %가 참가하는지
+        "participation_rate": _rate(participations, events_count * members),
+        "active_member_rate": _rate(totals["active_members"], members),
+        "avg_participants_per_event": _rate(participations, events_count),
+        "upcoming_events": [
+            {
+                "event_id": row["event_id"],
+                "name": names.get(str(row["event_id"])),
+                "category": row["category"],
+                "event_date": row["event_date"],
+                "participant_count": row["participant_count"],
+                "interest_rate": _rate(row["participant_count"], members),
+            }
+            for row in upcoming.data
+        ],
+    }
+
+async def fetch_participation_trend(supabase: AsyncSupabase, months: int = 12) -> List[Dict[str, Any]]:
+    """
+    최근 months개월의 월별 행사 수, 참가 수, 활동 회원 수와 참여율을 오래된 달부터 반환합니다.
+    참여율의 분모는 현재 전체 회원 수입니다.
+    """
+    totals, result = await asyncio.gather(
+        _fetch_totals(supabase),
+        supabase.execute(
+            supabase.table("analytics_monthly_stats")
+            .select("month,event_count,participant_count,active_members")
+            .order("month", desc=True)
+            .limit(months)
+        )
+    )
+    members = totals["total_members"]
+    return [
+        {
+            **row,
+            "participation_rate": _rate(row["participant_count"], row["event_count"] * members),
+            "avg_participants_per_event": _rate(row["participant_count"], row["event_count"]),
+        }
+        for row in reversed(result.data)
+        if row["event_count"] or row["participant_count"]
+    ]
+
+async def fetch_category_popularity(supabase: AsyncSupabase) -> List[Dict[str, Any]]:
+    """
+    카테고리별 행사 수, 참가 수, 행사당 평균 참가자 수와 전체 참가 중 비중을 반환합니다.
+    """
+    result = await supabase.execute(
+        supabase.table("analytics_category_stats")
+        .select("category,event_count,participant_count")
+        .order("participant_count", desc=True)
+    )
+    rows = [row for row in result.data if row["event_count"] > 0]
+    total = sum(row["participant_count"] for row in rows)
+    return [
+        {
+            **row,
+            "avg_participants_per_event": _rate(row["participant_count"], row["event_count"]),
+            "share": _rate(row["participant_count"], total),
+        }
+        for row in rows
+    ]
+
+async def fetch_member_ranking(supabase: AsyncSupabase, limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    누적 참가 수가 많은 회원 순위를 반환합니다. 이름은 회원 검색 색인에서 먼저 찾습니다.
+    """
+    result = await supabase.execute(
+        supabase.table("analytics_member_stats")
+        .select("profile_id,participation_count,last_participated_at")
+        .order("participation_count", desc=True)
+        .order("last_participated_at", desc=True)
+        .limit(limit)
+    )
+    rows = result.data
+
+    profiles: Dict[str, Dict[str, Any]] = {}
+    missing = []
+    for row in rows:
+        profile = member_directory.get(row["profile_id"])
+        if profile is None:
+            missing.append(row["profile_id"])
+        else:
+            profiles[str(row["profile_id"])] = profile
+    if missing:
+        found = await supabase.execute(
+            supabase.table("profiles").select("id,name,department,student_id").in_("id", missing)
+        )
+        profiles.update({str(p["id"]): p for p in found.data})
+
+    ranking = []
+    for rank, row in enumerate(rows, start=1):
+        profile = profiles.get(str(row["profile_id"]), {})
+        ranking.append({
+            "rank": rank,
+            **row,
+            "name": profile.get("name"),
+            "department": profile.get("department"),
+            "student_id": profile.get("student_id"),
+        })
+    return ranking
+
+async def fetch_event_stats(supabase: AsyncSupabase, event_id: str) -> Optional[Dict[str, Any]]:
+    """
+    행사 하나의 참가자 수와 전체 회원 대비 참여율을 반환합니다. 없는 행사면 None.
+    """
+    totals, result = await asyncio.gather(
+        _fetch_totals(supabase),
+        supabase.execute(supabase.table("analytics_event_stats").select("*").eq("event_id", event_id))
+    )
+    if not result.data:
+        return None
+    row = result.data[0]
+    return {**row, "participation_rate": _rate(row["participant_count"], totals["total_members"])}
+
+async def rebuild_analytics(supabase: AsyncSupabase) -> Dict[str, Any]:
+    """
+    원본 테이블에서 모든 집계를 다시 계산합니다. (rebuild_analytics RPC)
+    """
+    result = await supabase.execute(supabase.rpc("rebuild_analytics", {}))
+    row = result.data[0] if result.data else {}
+    logger.info(f"Analytics rebuilt: {row}")
+    return row
+
+if __name__ == "__main__":
+    import argparse
+    from ..core.database import db
+
+    parser = argparse.ArgumentParser(description="분석 집계 관리")
+    parser.add_argument("command", choices=["rebuild"])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == "rebuild":
+        print(asyncio.run(rebuild_analytics(db)))
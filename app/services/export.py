@@ -0,0 +1,51 @@
+from typing import Any, AsyncIterator, Dict, List, Optional
+import csv
+import io
+import json
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _ndjson(records: List[Dict[str, Any]]) -> bytes:
+    return "".join(
+        json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in records
+    ).encode()
+
+
+def _csv(records: List[Dict[str, Any]], fieldnames: List[str], header: bool) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+    if header:
+        writer.writeheader()
+    writer.writerows(records)
+    return buffer.getvalue().encode()
+
+
+async def stream_records(
+    pages: AsyncIterator[List[Dict[str, Any]]],
+    format: str,
+    fieldnames: Optional[List[str]] = None,
+) -> AsyncIterator[bytes]:
+    """
+    페이지 단위로 들어오는 레코드를 NDJSON 또는 CSV 바이트로 바로 내보냅니다.
+    한 번에 한 페이지만 메모리에 둡니다.
+
+    CSV의 열 목록을 주지 않으면 첫 페이지의 키를 사용합니다.
+    """
+    first = True
+    async for records in pages:
+        if format == "csv":
+            if fieldnames is None:
+                fieldnames = list(records[0].keys()) if records else []
+            # 엑셀에서 한글이 깨지지 않도록 BOM을 붙입니다.
+            prefix = "\ufeff".encode() if first else b""
+            yield prefix + _csv(records, fieldnames, header=first)
+        else:
+            yield _ndjson(records)
+        first = False
+
+    if first and format == "csv" and fieldnames:
+        yield "\ufeff".encode() + _csv([], fieldnames, header=True)
@@ -1,40 +1,56 @@
-import gspread
-from google.oauth2.service_account import Credentials
+from ..core.cache import SizedLRUCache, TTLCache
 from ..core.config import settings
-from typing import List, Dict, Any
+from ..core.database import AsyncSupabase
+from ..core.metrics import registry
+from .member_sync import sync_member_records
+from .sheets_scheduler import SheetsQuotaError, SheetsScheduler, SingleFlight, TokenBucket, sheets_quota_tokens
+from .sheet_mapping import COLUMN_MAPPING, apply_plan, compile_column_plan, map_sheet_values
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+import asyncio
+import json
 import logging
+import time
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-# 열 이름 매핑
-COLUMN_MAPPING = {
-    "타임스탬프": "timestamp",
-    "IGRUS의 활동에 참여하기 위해선 회비 2만원을 납부해주셔야 합니다. 회비 납부를 완료했습니까? ": "agreement",
-    "이름(ex.김아그)": "name",
-    "성별": "gender",
-    "학번 8자리(ex.12250000)(학번이 나오지 않은 신입생이라면 25학번이라고 적으신 후에 연락주시면 감사하겠습니다!)": "student_id",
-    "학년": "grade",
-    "학과": "department",
-    "재학/휴학 여부": "enrollment_status",
-    "연락처(ex.010-1234-5678)": "phone",
-    "관심 분야를 모두 체크해주세요.": "interests",
-    "IGRUS에 가입하게 된 경로가 어떻게 되나요?": "join_path",
-    "IGRUS에 들어오신 목적/이유가 무엇인가요?": "join_purpose",
-    "IGRUS에서 원하는 활동이 있다면 알려주세요!": "desired_activities",
-    "회비 납부": "payment_status",
-    "카톡초대": "kakao_invite"
-}
-
 class GoogleSheetsService:
     def __init__(self):
         self._client = None
         self._creds = None
+        # 스프레드시트 ID별 매핑된 행 캐시 (Drive modifiedTime으로 갱신 여부 판단)
+        self._cache = SizedLRUCache(max_bytes=settings.GOOGLE_SHEETS_CACHE_MAX_BYTES)
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_stale = 0
+        # (스프레드시트 ID, 워크시트 이름)별 헤더 열 계획과 마지막으로 본 행 번호
+        self._range_meta = TTLCache(max_size=256, ttl=settings.GOOGLE_SHEETS_HEADER_TTL_SECONDS)
+        # 모든 API 호출이 공유하는 할당량(토큰 버킷)과 재시도 규칙
+        self._scheduler = SheetsScheduler(
+            TokenBucket(settings.GOOGLE_SHEETS_REQUESTS_PER_MINUTE, settings.GOOGLE_SHEETS_BURST),
+            max_retries=settings.GOOGLE_SHEETS_MAX_RETRIES,
+            backoff_base=settings.GOOGLE_SHEETS_BACKOFF_BASE_SECONDS,
+            backoff_max=settings.GOOGLE_SHEETS_BACKOFF_MAX_SECONDS,
+            max_wait=settings.GOOGLE_SHEETS_QUOTA_WAIT_SECONDS
+        )
+        # 같은 시트를 동시에 새로고침하면 진행 중인 조회 하나를 함께 기다립니다.
+        self._sheet_flights = SingleFlight("sheet")
+        self._rows_flights = SingleFlight("rows")
+        # 시트 읽기 전용 스레드 풀. 타임아웃으로 기다리기를 포기해도 스레드의 요청은 끝까지 진행되므로,
+        # 실제로 진행 중인 읽기 수는 세마포어가 아니라 이 풀의 크기로 제한합니다.
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.GOOGLE_SHEETS_CONCURRENCY, thread_name_prefix="sheets"
+        )
         
     @property
     def client(self):
         if not self._client:
             try:
+                # gspread/google-auth는 가져오는 데 오래 걸리므로 처음 사용할 때 import 합니다.
+                import gspread
+                from google.oauth2.service_account import Credentials
+
                 logger.debug(f"Attempting to initialize Google Sheets client with credentials from: {settings.GOOGLE_CREDENTIALS_PATH}")
                 scopes = [
                     'https://www.googleapis.com/auth/spreadsheets',
@@ -53,92 +69,351 @@ class GoogleSheetsService:
                 raise
         return self._client
 
-    async def get_spreadsheet_info(self, spreadsheet_id: str) -> Dict[str, Any]:
+    def _call(self, operation: str, func, *args, **kwargs):
+        # 모든 Sheets/Drive API 호출은 이 함수를 거쳐 할당량 토큰을 받고, 지연 시간을 기록하고,
+        # 429/5xx 응답을 재시도합니다.
+        return self._scheduler.call(operation, func, *args, **kwargs)
+
+    @staticmethod
+    def _extract_spreadsheet_id(spreadsheet_id: str) -> str:
+        # URL이 주어진 경우 ID 추출
+        if "spreadsheets/d/" in spreadsheet_id:
+            spreadsheet_id = spreadsheet_id.split("spreadsheets/d/")[1].split("/")[0]
+        return spreadsheet_id
+
+    def _get_modified_time(self, spreadsheet_id: str) -> Optional[str]:
+        try:
+            return self._call("get_file_drive_metadata", self.client.get_file_drive_metadata, spreadsheet_id).get("modifiedTime")
+        except SheetsQuotaError:
+            # 할당량이 없으면 시트를 내려받을 수도 없으므로 그대로 올립니다.
+            raise
+        except Exception as e:
+            # 수정 시각을 알 수 없으면 캐시를 신뢰하지 않고 다시 가져옵니다.
+            logger.warning(f"Failed to get modifiedTime for {spreadsheet_id}: {str(e)}")
+            return None
+
+    def _load_sheet(self, spreadsheet_id: str, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        스프레드시트의 메타데이터와 매핑된 행을 반환합니다. (blocking)
+
+        Drive의 modifiedTime이 캐시된 값과 같으면 행을 다시 내려받지 않습니다.
+        """
+        logger.debug(f"Attempting to open spreadsheet: {spreadsheet_id}")
+        
+        if not self.client:
+            raise ValueError("Google Sheets client is not initialized")
+        
+        spreadsheet_id = self._extract_spreadsheet_id(spreadsheet_id)
+        
+        modified_time = self._get_modified_time(spreadsheet_id)
+        cached = self._cache.get(spreadsheet_id)
+        if cached is not None and not force_refresh and modified_time is not None \
+                and cached["modified_time"] == modified_time:
+            self._cache_hits += 1
+            return cached
+        
+        self._cache_misses += 1
+        if cached is not None:
+            self._cache_stale += 1
+        
+        # 스프레드시트 열기
+        spreadsheet = self._call("open_by_key", self.client.open_by_key, spreadsheet_id)
+        worksheet = self._call("sheet1", lambda: spreadsheet.sheet1)  # 첫 번째 시트 사용
+        
+        # 데이터 가져오기 (헤더는 한 번만 해석해 열 단위로 매핑)
+        records = map_sheet_values(self._call("get_all_values", worksheet.get_all_values))
+        
+        snapshot = {
+            "modified_time": modified_time,
+            "title": spreadsheet.title,
+            "sheet_names": [sheet.title for sheet in self._call("worksheets", spreadsheet.worksheets)],
+            "url": f"https://docs.google.com/spreadsheets/d/{spreadsheet.id}",
+            "records": records
+        }
+        if modified_time is not None:
+            size = len(json.dumps(records, ensure_ascii=False, default=str).encode())
+            self._cache.set(spreadsheet_id, snapshot, size=size)
+        
+        logger.debug(f"Successfully retrieved data from spreadsheet: {spreadsheet_id}")
+        return snapshot
+
+    async def _load_sheet_shared(self, spreadsheet_id: str, force_refresh: bool = False) -> Dict[str, Any]:
+        # 같은 시트에 대한 동시 요청은 진행 중인 _load_sheet 하나를 공유합니다.
+        key = (self._extract_spreadsheet_id(spreadsheet_id), force_refresh)
+        return await self._sheet_flights.do(
+            key, lambda: self._run_in_executor(self._load_sheet, spreadsheet_id, force_refresh)
+        )
+
+    def _run_in_executor(self, func, *args) -> "asyncio.Future":
+        # 모든 gspread 호출(blocking)은 GOOGLE_SHEETS_CONCURRENCY 크기의 전용 풀에서 실행합니다.
+        return asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        스프레드시트 캐시의 적중/미스 횟수와 사용량을 반환합니다.
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "stale": self._cache_stale,
+            **self._cache.stats()
+        }
+
+    async def get_spreadsheet_info(self, spreadsheet_id: str, force_refresh: bool = False) -> Dict[str, Any]:
         """
         스프레드시트의 기본 정보와 데이터를 가져옵니다.
         """
         try:
-            logger.debug(f"Attempting to open spreadsheet: {spreadsheet_id}")
-            
-            if not self.client:
-                raise ValueError("Google Sheets client is not initialized")
-            
-            # URL이 주어진 경우 ID 추출
-            if "spreadsheets/d/" in spreadsheet_id:
-                spreadsheet_id = spreadsheet_id.split("spreadsheets/d/")[1].split("/")[0]
-            
-            # 스프레드시트 열기
-            spreadsheet = self.client.open_by_key(spreadsheet_id)
-            worksheet = spreadsheet.sheet1  # 첫 번째 시트 사용
-            
-            # 데이터 가져오기
-            records = worksheet.get_all_records()
-            
-            # 열 이름 매핑 적용
-            mapped_records = []
-            for record in records:
-                mapped_record = {}
-                for old_key, value in record.items():
-                    if old_key.startswith("학번 8자리"):
-                        new_key = "student_id"
-                    elif old_key == "연락처(ex.010-1234-5678)": # 전화번호 컬럼 처리
-                        new_key = "phone"
-                        processed_phone = str(value).replace('-', '').replace(' ', '') # 하이픈과 공백 제거
-                        if len(processed_phone) == 10 and processed_phone.startswith('10'):
-                            # 10자리 숫자이고 '10'으로 시작하면, 앞에 '0'이 빠졌다고 가정하고 추가
-                            value = '0' + processed_phone
-                        else:
-                            value = processed_phone # 정리된 값 사용
-                    else:
-                        new_key = COLUMN_MAPPING.get(old_key, old_key)
-                    mapped_record[new_key] = value
-                mapped_records.append(mapped_record)
+            snapshot = await self._load_sheet_shared(spreadsheet_id, force_refresh)
             
             # 기본 정보 수집
             info = {
-                "title": spreadsheet.title,
-                "sheet_names": [sheet.title for sheet in spreadsheet.worksheets()],
-                "url": f"https://docs.google.com/spreadsheets/d/{spreadsheet.id}",
-                "total_sheets": len(spreadsheet.worksheets()),
-                "total_rows": len(mapped_records),
+                "title": snapshot["title"],
+                "sheet_names": snapshot["sheet_names"],
+                "url": snapshot["url"],
+                "total_sheets": len(snapshot["sheet_names"]),
+                "total_rows": len(snapshot["records"]),
                 "columns": list(COLUMN_MAPPING.values()),
-                "data": mapped_records  # 모든 행 반환
+                "data": snapshot["records"]  # 모든 행 반환
             }
             
-            logger.debug(f"Successfully retrieved spreadsheet info: {info}")
+            logger.debug(f"Successfully retrieved spreadsheet info: {info['title']} ({info['total_rows']} rows)")
             return info
             
+        except SheetsQuotaError:
+            raise
         except Exception as e:
             logger.error(f"Failed to get spreadsheet info: {str(e)}")
             raise Exception(f"Failed to get spreadsheet info: {str(e)}")
 
-    async def sync_members(self, sheet_name: str) -> Dict[str, int]:
+    @staticmethod
+    def _a1(worksheet: Optional[str], range_name: str) -> str:
+        # 시트 이름이 없으면 A1 범위는 첫 번째 시트를 가리킵니다.
+        if not worksheet:
+            return range_name
+        return "'{}'!{}".format(worksheet.replace("'", "''"), range_name)
+
+    @staticmethod
+    def _column_letter(index: int) -> str:
+        # 0 -> A, 25 -> Z, 26 -> AA
+        letters = ""
+        index += 1
+        while index:
+            index, remainder = divmod(index - 1, 26)
+            letters = chr(ord("A") + remainder) + letters
+        return letters
+
+    def _range_header(self, spreadsheet_id: str, worksheet: Optional[str], force_refresh: bool) -> Dict[str, Any]:
+        """
+        헤더 행("1:1")만 읽어 열 계획을 만들고 캐시합니다. (blocking)
+        """
+        key = (spreadsheet_id, worksheet or "")
+        meta = None if force_refresh else self._range_meta.get(key)
+        if meta is None:
+            response = self._call(
+                "values_get", self.client.http_client.values_get, spreadsheet_id, self._a1(worksheet, "1:1")
+            )
+            values = response.get("values", [])
+            meta = {"plan": compile_column_plan(values[0] if values else []), "last_row": None}
+            self._range_meta.set(key, meta)
+        return meta
+
+    def _get_columns(
+        self,
+        spreadsheet_id: str,
+        worksheet: Optional[str],
+        indices: List[int],
+        start_row: int
+    ) -> List[List[Any]]:
+        """
+        필요한 열만 start_row부터 끝까지 batchGet 한 번으로 읽어 indices 순서의 행 목록으로 돌려줍니다. (blocking)
+
+        연속된 열은 하나의 범위(예: "B120:D")로 묶습니다. 시트 API는 끝쪽 빈 행을 돌려주지 않으므로
+        항상 채워지는 첫 번째 열(타임스탬프)을 함께 읽어 행 수의 기준으로 삼습니다.
+        """
+        columns = sorted(set(indices) | {0})
+        runs: List[List[int]] = []
+        for column in columns:
+            if runs and runs[-1][1] == column - 1:
+                runs[-1][1] = column
+            else:
+                runs.append([column, column])
+
+        ranges = [
+            self._a1(worksheet, f"{self._column_letter(first)}{start_row}:{self._column_letter(last)}")
+            for first, last in runs
+        ]
+        response = self._call("values_batch_get", self.client.http_client.values_batch_get, spreadsheet_id, ranges)
+
+        by_column: Dict[int, List[Any]] = {}
+        for (first, last), value_range in zip(runs, response.get("valueRanges", [])):
+            values = value_range.get("values", [])
+            for offset, column in enumerate(range(first, last + 1)):
+                by_column[column] = [row[offset] if offset < len(row) else "" for row in values]
+
+        row_count = len(by_column.get(0, []))
+        return [
+            [by_column[c][r] if r < len(by_column.get(c, [])) else "" for c in indices]
+            for r in range(row_count)
+        ]
+
+    def _load_rows(
+        self,
+        spreadsheet_id: str,
+        worksheet: Optional[str],
+        fields: Optional[List[str]],
+        since_row: Optional[int],
+        tail: Optional[int],
+        force_refresh: bool
+    ) -> Dict[str, Any]:
+        """
+        요청한 열과 행 구간만 읽어 매핑된 레코드로 반환합니다. (blocking)
+
+        tail은 마지막으로 본 행 번호를 기억해 두었다가 끝쪽 tail개 행만 요청합니다.
+        처음 호출이거나 시트가 줄어든 경우에만 since_row 이후 전체(요청한 열만)를 읽습니다.
+        """
+        if not self.client:
+            # 필드 오류(ValueError, 400)와 구분되도록 설정 오류는 일반 예외로 올립니다.
+            raise RuntimeError("Google Sheets client is not initialized")
+
+        spreadsheet_id = self._extract_spreadsheet_id(spreadsheet_id)
+        meta = self._range_header(spreadsheet_id, worksheet, force_refresh)
+        plan = meta["plan"]
+        if fields:
+            indices, plan = plan.project(fields)
+        else:
+            indices = list(range(plan.width))
+
+        # 1행은 헤더이므로 데이터는 2행부터입니다.
+        first_row = max(2, (since_row or 1) + 1)
+        start_row = first_row
+        last_row = meta["last_row"]
+        if tail and last_row is not None:
+            start_row = max(first_row, last_row - tail + 1)
+
+        rows = self._get_columns(spreadsheet_id, worksheet, indices, start_row)
+        if tail and start_row > first_row and len(rows) < tail:
+            # 행이 삭제되어 시트가 줄었으면 처음부터 다시 읽습니다.
+            start_row = first_row
+            rows = self._get_columns(spreadsheet_id, worksheet, indices, start_row)
+
+        if rows:
+            meta["last_row"] = start_row + len(rows) - 1
+        if tail and len(rows) > tail:
+            start_row += len(rows) - tail
+            rows = rows[-tail:]
+
+        records = apply_plan(plan, rows)
+        return {
+            "worksheet": worksheet,
+            "columns": plan.keys,
+            "start_row": start_row,
+            "end_row": start_row + len(rows) - 1 if rows else first_row - 1,
+            "total_rows": len(records),
+            "data": records
+        }
+
+    async def get_spreadsheet_rows(
+        self,
+        spreadsheet_id: str,
+        worksheet: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        since_row: Optional[int] = None,
+        tail: Optional[int] = None,
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        스프레드시트에서 필요한 열과 행 구간만 가져옵니다.
+
+        Args:
+            worksheet: 워크시트 이름 (없으면 첫 번째 시트)
+            fields: 가져올 필드 (COLUMN_MAPPING의 이름 또는 원본 헤더, 없으면 전체 열)
+            since_row: 이 행 번호 이후에 추가된 행만 가져옵니다.
+            tail: 마지막 tail개 행만 가져옵니다.
+            force_refresh: true이면 캐시된 헤더를 다시 읽습니다.
+
+        Raises:
+            ValueError: 시트에 없는 필드를 요청한 경우
+        """
+        try:
+            key = (
+                self._extract_spreadsheet_id(spreadsheet_id), worksheet,
+                tuple(fields) if fields else None, since_row, tail, force_refresh
+            )
+            result = await self._rows_flights.do(key, lambda: self._run_in_executor(
+                self._load_rows, spreadsheet_id, worksheet, fields, since_row, tail, force_refresh
+            ))
+            logger.debug(
+                f"Retrieved rows {result['start_row']}-{result['end_row']} "
+                f"({len(result['columns'])} columns) from spreadsheet: {spreadsheet_id}"
+            )
+            return result
+        except (ValueError, SheetsQuotaError):
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get spreadsheet rows: {str(e)}")
+            raise Exception(f"Failed to get spreadsheet rows: {str(e)}")
+
+    async def sync_members(self, sheet_name: str, supabase: AsyncSupabase) -> Dict[str, int]:
         """
         Google Sheets에서 회원 정보를 동기화합니다.
+        fingerprint가 바뀐 회원만 profiles에 upsert 합니다.
         """
         if not self.client:
             raise ValueError("Google Sheets credentials not configured")
 
         try:
             # 시트 열기
-            sheet = self.client.open(sheet_name).sheet1
-            records = sheet.get_all_records()
+            spreadsheet = await self._run_in_executor(self._call, "open", self.client.open, sheet_name)
+            sheet = await self._run_in_executor(self._call, "sheet1", lambda: spreadsheet.sheet1)
+            values = await self._run_in_executor(self._call, "get_all_values", sheet.get_all_values)
+            records = map_sheet_values(values)
 
             # 결과 통계
-            stats = {
-                "new_members": 0,
-                "updated_members": 0
-            }
-
-            # TODO: Supabase와 동기화 로직 구현
-            # 이 부분은 실제 데이터 구조에 맞춰 구현해야 합니다.
-
-            return stats
+            return await sync_member_records(supabase, records)
 
+        except SheetsQuotaError:
+            raise
         except Exception as e:
             logger.error(f"Failed to sync members: {str(e)}")
             raise Exception(f"Failed to sync members: {str(e)}")
 
+    async def open_spreadsheet_pages(
+        self,
+        spreadsheet_id: str,
+        page_size: Optional[int] = None
+    ) -> Tuple[List[str], AsyncIterator[List[Dict[str, Any]]]]:
+        """
+        스프레드시트의 행을 page_size 행 범위씩 읽어 매핑된 레코드로 돌려주는 비동기 이터레이터를 만듭니다.
+        시트를 열고 헤더를 읽는 것까지는 바로 수행하므로, 오류는 응답을 보내기 전에 발생합니다.
+
+        Returns:
+            (매핑된 열 이름 목록, 페이지 이터레이터)
+        """
+        if not self.client:
+            raise ValueError("Google Sheets client is not initialized")
+
+        page_size = page_size or settings.GOOGLE_SHEETS_EXPORT_PAGE_SIZE
+        spreadsheet_id = self._extract_spreadsheet_id(spreadsheet_id)
+        spreadsheet = await self._run_in_executor(self._call, "open_by_key", self.client.open_by_key, spreadsheet_id)
+        worksheet = await self._run_in_executor(self._call, "sheet1", lambda: spreadsheet.sheet1)
+        header = await self._run_in_executor(self._call, "row_values", worksheet.row_values, 1)
+        plan = compile_column_plan(header)
+
+        async def pages() -> AsyncIterator[List[Dict[str, Any]]]:
+            start = 2
+            while True:
+                end = start + page_size - 1
+                # 행 범위(A1 표기 "2:1001")만 요청합니다. 뒤쪽 빈 행은 응답에서 빠집니다.
+                rows = await self._run_in_executor(self._call, "get", worksheet.get, f"{start}:{end}")
+                if rows:
+                    yield apply_plan(plan, rows)
+                if len(rows) < page_size:
+                    return
+                start = end + 1
+
+        return plan.keys, pages()
+
     async def test_connection(self) -> bool:
         """
         Google Sheets API 연결을 테스트합니다.
@@ -150,65 +425,82 @@ class GoogleSheetsService:
                 return False
                 
             # 사용 가능한 스프레드시트 목록을 가져와봅니다
-            spreadsheets = self.client.list_spreadsheet_files()
+            # 할당량 대기와 재시도 백오프가 스레드를 재우므로 이벤트 루프 밖에서 실행합니다.
+            spreadsheets = await self._run_in_executor(
+                self._call, "list_spreadsheet_files", self.client.list_spreadsheet_files
+            )
             logger.debug(f"Successfully retrieved {len(spreadsheets)} spreadsheets")
             return True
         except Exception as e:
             logger.error(f"Connection test failed: {str(e)}")
             return False
 
-    async def get_multiple_spreadsheets_info(self, spreadsheet_ids: List[str]) -> List[Dict[str, Any]]:
+    async def get_multiple_spreadsheets_info(
+        self,
+        spreadsheet_ids: List[str],
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
         """
-        여러 스프레드시트의 데이터를 가져옵니다.
+        여러 스프레드시트의 데이터를 동시에 가져옵니다.
+
+        최대 concurrency개의 시트를 스레드에서 병렬로 읽고, 시트별로 timeout초를 넘기면 건너뜁니다.
+        진행 중인 읽기는 요청과 상관없이 GOOGLE_SHEETS_CONCURRENCY개(전용 스레드 풀)를 넘지 않습니다.
+        반환값의 data는 전체 행, sheets는 시트별 처리 결과(status, rows, latency_ms)입니다.
         """
-        all_mapped_records = []
-        for spreadsheet_id in spreadsheet_ids:
-            try:
-                logger.debug(f"Attempting to open spreadsheet: {spreadsheet_id}")
-                
-                if not self.client:
-                    raise ValueError("Google Sheets client is not initialized")
-                
-                # URL이 주어진 경우 ID 추출
-                if "spreadsheets/d/" in spreadsheet_id:
-                    spreadsheet_id = spreadsheet_id.split("spreadsheets/d/")[1].split("/")[0]
-                
-                # 스프레드시트 열기
-                spreadsheet = self.client.open_by_key(spreadsheet_id)
-                worksheet = spreadsheet.sheet1  # 첫 번째 시트 사용
-                
-                # 데이터 가져오기
-                records = worksheet.get_all_records()
-                
-                # 열 이름 매핑 적용
-                mapped_records = []
-                for record in records:
-                    mapped_record = {}
-                    for old_key, value in record.items():
-                        if old_key.startswith("학번 8자리"):
-                            new_key = "student_id"
-                        elif old_key == "연락처(ex.010-1234-5678)": # 전화번호 컬럼 처리
-                            new_key = "phone"
-                            processed_phone = str(value).replace('-', '').replace(' ', '') # 하이픈과 공백 제거
-                            if len(processed_phone) == 10 and processed_phone.startswith('10'):
-                                # 10자리 숫자이고 '10'으로 시작하면, 앞에 '0'이 빠졌다고 가정하고 추가
-                                value = '0' + processed_phone
-                            else:
-                                value = processed_phone # 정리된 값 사용
-                        else:
-                            new_key = COLUMN_MAPPING.get(old_key, old_key)
-                        mapped_record[new_key] = value
-                    mapped_records.append(mapped_record)
-                
-                all_mapped_records.extend(mapped_records)
-                logger.debug(f"Successfully retrieved data from spreadsheet: {spreadsheet_id}")
-                
-            except Exception as e:
-                logger.error(f"Failed to get spreadsheet info for {spreadsheet_id}: {str(e)}")
-                # 특정 스프레드시트에서 오류가 발생해도 다른 스프레드시트 처리는 계속 진행
-                continue
-        
-        return all_mapped_records
+        semaphore = asyncio.Semaphore(concurrency or settings.GOOGLE_SHEETS_CONCURRENCY)
+        timeout = timeout or settings.GOOGLE_SHEETS_TIMEOUT_SECONDS
+
+        async def fetch(spreadsheet_id: str):
+            async with semaphore:
+                started = time.perf_counter()
+                sheet_status = {"spreadsheet_id": spreadsheet_id}
+                records: List[Dict[str, Any]] = []
+                try:
+                    # 타임아웃이 나도 스레드의 요청은 끝까지 진행되지만 결과는 버립니다.
+                    # (진행 중인 읽기는 전용 스레드 풀 크기만큼으로 제한되고, 남은 요청은 풀에서 기다립니다)
+                    snapshot = await asyncio.wait_for(
+                        self._load_sheet_shared(spreadsheet_id, force_refresh),
+                        timeout
+                    )
+                    records = snapshot["records"]
+                    sheet_status.update(status="success", rows=len(records))
+                except asyncio.TimeoutError:
+                    logger.error(f"Timed out getting spreadsheet info for {spreadsheet_id} after {timeout}s")
+                    sheet_status.update(status="timeout", rows=0)
+                except SheetsQuotaError as e:
+                    logger.error(f"Quota exceeded getting spreadsheet info for {spreadsheet_id}")
+                    sheet_status.update(status="rate_limited", rows=0, retry_after=round(e.retry_after, 1))
+                except Exception as e:
+                    # 특정 스프레드시트에서 오류가 발생해도 다른 스프레드시트 처리는 계속 진행
+                    logger.error(f"Failed to get spreadsheet info for {spreadsheet_id}: {str(e)}")
+                    sheet_status.update(status="error", rows=0, error=str(e))
+                sheet_status["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                return records, sheet_status
+
+        results = await asyncio.gather(*(fetch(spreadsheet_id) for spreadsheet_id in spreadsheet_ids))
+
+        return {
+            "data": [record for records, _ in results for record in records],
+            "sheets": [sheet_status for _, sheet_status in results]
+        }
 
 google_sheets_service = GoogleSheetsService()
+
+sheets_cache_entries = registry.gauge("clubos_sheets_cache_entries", "Spreadsheets held in the row cache")
+sheets_cache_bytes = registry.gauge("clubos_sheets_cache_bytes", "Approximate size of the spreadsheet row cache")
+sheets_cache_requests = registry.gauge(
+    "clubos_sheets_cache_requests", "Spreadsheet cache lookups by result", ("result",)
+)
+
+def _collect_cache_stats():
+    stats = google_sheets_service.cache_stats()
+    sheets_cache_entries.set(stats["entries"])
+    sheets_cache_bytes.set(stats["bytes"])
+    for result in ("hits", "misses", "stale"):
+        sheets_cache_requests.set(stats[result], result=result)
+    sheets_quota_tokens.set(google_sheets_service._scheduler.bucket.available())
+
+registry.add_collector(_collect_cache_stats)
  
\ No newline at end of file
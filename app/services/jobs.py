@@ -0,0 +1,321 @@
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from ..core.config import settings
+from ..core.database import AsyncSupabase
+from ..core.metrics import registry
+from .analytics import rebuild_analytics
+from .google_sheets import google_sheets_service
+from .transaction_stats import default_term_start, fetch_transaction_stats
+import asyncio
+import inspect
+import json
+import logging
+import time
+import uuid
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 백그라운드 작업
+# 오래 걸리는 외부 호출(시트 동기화, 시트 읽기, 통계 집계)을 요청 밖에서 실행합니다.
+# 대기열과 워커는 앱 프로세스 안의 asyncio 작업이므로 외부 브로커가 필요 없고,
+# 서버가 재시작되면 대기 중인 작업은 사라집니다. (주기 작업은 시작할 때 다시 예약됩니다)
+
+jobs_total = registry.counter("clubos_jobs_total", "Background job runs by job and status", ("job", "status"))
+job_duration = registry.histogram(
+    "clubos_job_duration_seconds", "Background job run time by job", ("job",),
+    buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 600.0)
+)
+jobs_queued = registry.gauge("clubos_jobs_queued", "Background jobs waiting for a worker")
+jobs_running = registry.gauge("clubos_jobs_running", "Background jobs currently running")
+
+class JobQueueFull(Exception):
+    pass
+
+class JobSchedulerStopped(Exception):
+    pass
+
+class InvalidJobParams(Exception):
+    pass
+
+@dataclass
+class JobRun:
+    id: str
+    name: str
+    params: Dict[str, Any]
+    trigger: str  # manual | schedule
+    status: str = "pending"  # pending | running | succeeded | failed | cancelled
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    duration_ms: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass
+class JobDefinition:
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    description: str
+    # 주기 실행 간격 (초)과 그때 넘길 인자. interval이 없으면 수동 실행만 합니다.
+    interval: Optional[float] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+    next_run_at: Optional[float] = None
+    runs: int = 0
+    failures: int = 0
+    last_run: Optional[JobRun] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        last = self.last_run
+        return {
+            "name": self.name,
+            "description": self.description,
+            "interval_seconds": self.interval,
+            "params": self.params,
+            "next_run_at": self.next_run_at,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_status": last.status if last else None,
+            "last_started_at": last.started_at if last else None,
+            "last_duration_ms": last.duration_ms if last else None,
+            "last_error": last.error if last else None,
+        }
+
+def _dedup_key(name: str, params: Dict[str, Any]) -> Tuple[str, str]:
+    return name, json.dumps(params, sort_keys=True, default=str)
+
+class JobScheduler:
+    """
+    이름으로 등록한 비동기 작업을 대기열에 넣고 workers개의 워커가 꺼내 실행합니다.
+
+    - 같은 이름과 인자의 작업이 아직 대기 중이면 새로 넣지 않고 그 작업을 돌려줍니다.
+      (실행 중인 작업과 같은 요청은 실행이 끝난 뒤 한 번 더 돌도록 새로 넣습니다)
+    - interval이 있는 작업은 그 간격으로 자동으로 대기열에 넣습니다. 이전 실행이 밀려 있으면
+      위의 중복 제거로 쌓이지 않습니다.
+    - 작업 함수는 func(supabase, **params) 형태이고 반환값은 실행 기록의 result가 됩니다.
+    """
+
+    def __init__(self, workers: int, queue_size: int, timeout: float, history_size: int):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._jobs: Dict[str, JobDefinition] = {}
+        self._active: Dict[str, JobRun] = {}
+        self._pending: Dict[Tuple[str, str], JobRun] = {}
+        self._history: Deque[JobRun] = deque(maxlen=history_size)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._supabase: Optional[AsyncSupabase] = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def register(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        description: str,
+        interval: Optional[float] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self._jobs[name] = JobDefinition(name, func, description, interval or None, params or {})
+
+    def start(self, supabase: AsyncSupabase) -> None:
+        if self.running:
+            return
+        self._supabase = supabase
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self.workers)
+        ]
+        now = time.time()
+        periodic = [job for job in self._jobs.values() if job.interval]
+        for job in periodic:
+            # 시작 직후 한 번 실행해 캐시를 채웁니다.
+            job.next_run_at = now
+        if periodic:
+            self._tasks.append(asyncio.create_task(self._schedule_loop(), name="job-scheduler"))
+        logger.info(f"Job scheduler started: {self.workers} workers, {len(periodic)} periodic jobs")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # 재시작하면 대기 중이던 작업은 사라집니다.
+        for run in self._pending.values():
+            run.status = "cancelled"
+            self._active.pop(run.id, None)
+            self._history.append(run)
+        self._pending.clear()
+        self._queue = None
+
+    def enqueue(self, name: str, params: Optional[Dict[str, Any]] = None, trigger: str = "manual") -> Tuple[JobRun, bool]:
+        """
+        작업을 대기열에 넣고 (실행 기록, 중복 여부)를 반환합니다.
+
+        Raises:
+            KeyError: 등록되지 않은 작업
+            InvalidJobParams: 작업 함수가 받지 않는 인자가 있거나 필요한 인자가 빠진 경우
+            JobSchedulerStopped: 스케줄러가 실행 중이 아닌 경우
+            JobQueueFull: 대기열이 가득 찬 경우
+        """
+        if name not in self._jobs:
+            raise KeyError(name)
+        if self._queue is None:
+            raise JobSchedulerStopped("작업 스케줄러가 실행 중이 아닙니다.")
+
+        params = params or {}
+        self._check_params(self._jobs[name], params)
+        key = _dedup_key(name, params)
+        pending = self._pending.get(key)
+        if pending is not None:
+            return pending, True
+
+        run = JobRun(id=uuid.uuid4().hex, name=name, params=params, trigger=trigger)
+        try:
+            self._queue.put_nowait(run)
+        except asyncio.QueueFull:
+            raise JobQueueFull("작업 대기열이 가득 찼습니다.")
+        self._pending[key] = run
+        self._active[run.id] = run
+        return run, False
+
+    @staticmethod
+    def _check_params(job: JobDefinition, params: Dict[str, Any]) -> None:
+        # 실행할 때 TypeError로 실패하지 않도록 넣기 전에 작업 함수의 시그니처와 맞춰 봅니다.
+        try:
+            inspect.signature(job.func).bind(None, **params)
+        except TypeError as e:
+            raise InvalidJobParams(f"{job.name} 작업의 인자가 올바르지 않습니다: {e}")
+
+    async def _worker(self) -> None:
+        while True:
+            run = await self._queue.get()
+            try:
+                await self._execute(run)
+            finally:
+                self._queue.task_done()
+
+    async def _execute(self, run: JobRun) -> None:
+        job = self._jobs[run.name]
+        # 실행을 시작하면 같은 작업을 다시 넣을 수 있습니다.
+        self._pending.pop(_dedup_key(run.name, run.params), None)
+        run.status = "running"
+        run.started_at = time.time()
+        started = time.perf_counter()
+        try:
+            run.result = await asyncio.wait_for(job.func(self._supabase, **run.params), self.timeout)
+            run.status = "succeeded"
+        except asyncio.CancelledError:
+            run.status = "cancelled"
+            raise
+        except asyncio.TimeoutError:
+            run.status = "failed"
+            run.error = f"timed out after {self.timeout}s"
+        except Exception as e:
+            logger.exception(f"Job {run.name} ({run.id}) failed")
+            run.status = "failed"
+            run.error = str(e)
+        finally:
+            elapsed = time.perf_counter() - started
+            run.finished_at = time.time()
+            run.duration_ms = round(elapsed * 1000, 1)
+            job.runs += 1
+            if run.status == "failed":
+                job.failures += 1
+            job.last_run = run
+            self._active.pop(run.id, None)
+            self._history.append(run)
+            jobs_total.inc(job=run.name, status=run.status)
+            job_duration.observe(elapsed, job=run.name)
+            logger.info(f"Job {run.name} {run.status} in {run.duration_ms}ms")
+
+    async def _schedule_loop(self) -> None:
+        periodic = [job for job in self._jobs.values() if job.interval]
+        while True:
+            now = time.time()
+            for job in periodic:
+                if job.next_run_at <= now:
+                    try:
+                        self.enqueue(job.name, job.params, trigger="schedule")
+                    except JobQueueFull:
+                        logger.warning(f"Job queue full, skipping scheduled run of {job.name}")
+                    job.next_run_at = now + job.interval
+            wake = min(job.next_run_at for job in periodic) - time.time()
+            await asyncio.sleep(max(0.05, wake))
+
+    def get(self, run_id: str) -> Optional[JobRun]:
+        run = self._active.get(run_id)
+        if run is not None:
+            return run
+        return next((run for run in self._history if run.id == run_id), None)
+
+    def runs(self, name: Optional[str] = None, limit: int = 50) -> List[JobRun]:
+        """진행 중인 작업과 최근 실행 기록을 최신순으로 반환합니다."""
+        runs = list(self._active.values()) + list(reversed(self._history))
+        if name is not None:
+            runs = [run for run in runs if run.name == name]
+        return runs[:limit]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "in_progress": sum(1 for run in self._active.values() if run.status == "running"),
+            "jobs": [job.to_dict() for job in self._jobs.values()],
+        }
+
+# 작업 정의 ------------------------------------------------------------------
+
+async def sync_members_job(supabase: AsyncSupabase, sheet_name: str) -> Dict[str, int]:
+    return await google_sheets_service.sync_members(sheet_name, supabase)
+
+async def refresh_spreadsheets_job(supabase: AsyncSupabase, spreadsheet_ids: List[str]) -> Dict[str, Any]:
+    # 시트 캐시를 미리 채워 두면 화면의 새로고침은 modifiedTime 확인만 하고 캐시에서 응답합니다.
+    result = await google_sheets_service.get_multiple_spreadsheets_info(spreadsheet_ids)
+    return {"sheets": result["sheets"]}
+
+async def transaction_stats_job(supabase: AsyncSupabase, term_start: Optional[str] = None) -> Dict[str, Any]:
+    start = date.fromisoformat(term_start) if term_start else default_term_start()
+    return await fetch_transaction_stats(supabase, start, refresh=True)
+
+async def rebuild_analytics_job(supabase: AsyncSupabase) -> Dict[str, Any]:
+    return await rebuild_analytics(supabase)
+
+job_scheduler = JobScheduler(
+    workers=settings.JOBS_WORKERS,
+    queue_size=settings.JOBS_QUEUE_SIZE,
+    timeout=settings.JOBS_TIMEOUT_SECONDS,
+    history_size=settings.JOBS_HISTORY_SIZE,
+)
+
+job_scheduler.register(
+    "sync_members", sync_members_job, "지원서 시트의 회원 정보를 profiles에 동기화",
+    interval=settings.JOBS_SYNC_INTERVAL_SECONDS if settings.JOBS_SYNC_SHEET_NAME else None,
+    params={"sheet_name": settings.JOBS_SYNC_SHEET_NAME} if settings.JOBS_SYNC_SHEET_NAME else None,
+)
+job_scheduler.register(
+    "refresh_spreadsheets", refresh_spreadsheets_job, "스프레드시트 캐시 미리 읽기",
+    interval=settings.JOBS_SPREADSHEET_INTERVAL_SECONDS if settings.JOBS_SPREADSHEET_IDS else None,
+    params={"spreadsheet_ids": settings.JOBS_SPREADSHEET_IDS} if settings.JOBS_SPREADSHEET_IDS else None,
+)
+job_scheduler.register(
+    "transaction_stats", transaction_stats_job, "이번 학기 거래 통계 미리 계산",
+    interval=settings.JOBS_STATS_INTERVAL_SECONDS,
+)
+job_scheduler.register("rebuild_analytics", rebuild_analytics_job, "분석 집계 전체 재계산")
+
+def _collect_job_stats() -> None:
+    stats = job_scheduler.stats()
+    jobs_queued.set(stats["queued"])
+    jobs_running.set(stats["in_progress"])
+
+registry.add_collector(_collect_job_stats)
@@ -0,0 +1,493 @@
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import asyncio
+import bisect
+import heapq
+import logging
+import time
+
+from ..core.config import settings
+from ..core.database import AsyncSupabase
+from ..core.metrics import registry
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 한글 음절의 초성 (유니코드 순서)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = set(CHOSEONG)
+_HANGUL_START, _HANGUL_END = 0xAC00, 0xD7A3
+_SYLLABLES_PER_CHOSEONG = 21 * 28
+
+# PostgREST가 한 번에 돌려주는 최대 행 수
+PAGE_SIZE = 1000
+
+_EMPTY: Set[str] = frozenset()  # type: ignore[assignment]
+_MAX_CHAR = chr(0x10FFFF)
+
+def normalize(text: Optional[str]) -> str:
+    return "".join(str(text or "").lower().split())
+
+
+def to_choseong(text: str) -> str:
+    """
+    한글 음절을 초성으로 바꿉니다. 한글이 아닌 문자는 그대로 둡니다. ("김아그" -> "ㄱㅇㄱ")
+    """
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_START <= code <= _HANGUL_END:
+            chars.append(CHOSEONG[(code - _HANGUL_START) // _SYLLABLES_PER_CHOSEONG])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def has_choseong(text: str) -> bool:
+    return any(ch in _CHOSEONG_SET for ch in text)
+
+
+def grams(text: str) -> Set[str]:
+    """색인용 1-gram과 2-gram을 만듭니다."""
+    result = set(text)
+    result.update(text[i:i + 2] for i in range(len(text) - 1))
+    return result
+
+
+def prefixes(text: str) -> List[str]:
+    """색인용 접두어(최대 두 글자)를 만듭니다."""
+    return [text[:n] for n in range(1, min(len(text), 2) + 1)]
+
+
+def match_choseong(name: str, query: str) -> int:
+    """
+    초성이 섞인 검색어를 이름에 맞춰 봅니다. 초성 자리는 초성만, 나머지는 글자 그대로 비교합니다.
+    일치하는 가장 앞 위치를 반환하고, 없으면 -1을 반환합니다.
+    """
+    for start in range(len(name) - len(query) + 1):
+        for offset, ch in enumerate(query):
+            target = name[start + offset]
+            if ch in _CHOSEONG_SET:
+                if to_choseong(target) != ch:
+                    break
+            elif target != ch:
+                break
+        else:
+            return start
+    return -1
+
+
+class _Postings:
+    """
+    gram -> 회원 ID 집합
+
+    자주 쓰이는 짧은 gram은 후보가 수천 개라 매번 정렬하면 느리므로,
+    정렬된 목록을 처음 요청할 때 만들어 두고 그 gram이 바뀔 때만 버립니다.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, Set[str]] = {}
+        self._sorted: Dict[str, List[str]] = {}
+
+    def add(self, keys: Iterable[str], profile_id: str) -> None:
+        for key in keys:
+            self._ids.setdefault(key, set()).add(profile_id)
+            self._sorted.pop(key, None)
+
+    def discard(self, keys: Iterable[str], profile_id: str) -> None:
+        for key in keys:
+            ids = self._ids.get(key)
+            if ids is not None:
+                ids.discard(profile_id)
+                self._sorted.pop(key, None)
+                if not ids:
+                    del self._ids[key]
+
+    def get(self, key: str) -> Set[str]:
+        return self._ids.get(key, _EMPTY)
+
+    def ordered(self, key: str, order: Callable[[str], Any]) -> List[str]:
+        ordered = self._sorted.get(key)
+        if ordered is None:
+            ordered = self._sorted[key] = sorted(self.get(key), key=order)
+        return ordered
+
+    def lookup(self, text: str) -> Set[str]:
+        """
+        text를 포함할 수 있는 후보를 gram 교집합으로 구합니다.
+        두 글자 이하면 결과가 정확하고, 더 길면 호출하는 쪽에서 한 번 더 확인해야 합니다.
+        """
+        if len(text) <= 2:
+            return self.get(text)
+        sets = sorted((self.get(text[i:i + 2]) for i in range(len(text) - 1)), key=len)
+        if not sets[0]:
+            return _EMPTY
+        return sets[0].intersection(*sets[1:])
+
+
+class _SortedKeys:
+    """(키, 회원 ID) 정렬 목록. 접두어 검색을 이진 탐색으로 처리합니다."""
+
+    def __init__(self):
+        self._items: List[Tuple[str, str]] = []
+
+    def add(self, key: str, profile_id: str, bulk: bool = False) -> None:
+        if bulk:
+            self._items.append((key, profile_id))
+        else:
+            bisect.insort(self._items, (key, profile_id))
+
+    def sort(self) -> None:
+        self._items.sort()
+
+    def discard(self, key: str, profile_id: str) -> None:
+        position = bisect.bisect_left(self._items, (key, profile_id))
+        if position < len(self._items) and self._items[position] == (key, profile_id):
+            del self._items[position]
+
+    def prefix(self, prefix: str) -> Set[str]:
+        lo = bisect.bisect_left(self._items, (prefix,))
+        hi = bisect.bisect_left(self._items, (prefix + _MAX_CHAR,))
+        return {profile_id for _, profile_id in self._items[lo:hi]}
+
+
+class MemberIndex:
+    """
+    profiles 행을 메모리에 두고 이름, 초성, 학번, 학과, Slack ID를 n-gram과 접두어로 색인합니다.
+
+    검색 결과는 아래 순서의 단계로 모으고, 같은 단계 안에서는 이름이 짧은 순 -> 가나다순입니다.
+    필요한 개수가 차면 뒤 단계는 계산하지 않습니다.
+        1. 이름 전체 일치  2. 이름 접두어  3. 이름 포함
+        4. 초성 접두어     5. 초성 포함 (검색어에 초성이 있을 때만)
+        6. 학번 접두어     7. 학번/학과/Slack ID 포함 (all_fields일 때만)
+    """
+
+    def __init__(self):
+        self.profiles: Dict[str, Dict[str, Any]] = {}
+        self._keys: Dict[str, Tuple[str, str, str, str, str]] = {}
+        self._order: Dict[str, Tuple[int, str, str]] = {}
+        self._names: Dict[str, Set[str]] = {}
+        self._departments: Dict[str, Set[str]] = {}
+        self._name_prefix = _Postings()
+        self._name_grams = _Postings()
+        self._choseong_prefix = _Postings()
+        self._choseong_grams = _Postings()
+        self._other_grams = _Postings()
+        self._name_sorted = _SortedKeys()
+        self._choseong_sorted = _SortedKeys()
+        self._student_id_sorted = _SortedKeys()
+
+    @classmethod
+    def build(cls, profiles: Iterable[Dict[str, Any]]) -> "MemberIndex":
+        index = cls()
+        for profile in profiles:
+            index.upsert(profile, bulk=True)
+        for sorted_keys in (index._name_sorted, index._choseong_sorted, index._student_id_sorted):
+            sorted_keys.sort()
+        return index
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    @staticmethod
+    def _other_keys(keys: Tuple[str, str, str, str, str]) -> Set[str]:
+        _, _, student_id, department, slack_user_id = keys
+        return grams(student_id) | grams(department) | grams(slack_user_id)
+
+    def upsert(self, profile: Dict[str, Any], bulk: bool = False) -> None:
+        """
+        회원을 색인에 넣거나 바꿉니다. bulk이면 정렬 목록을 나중에 한 번에 정렬합니다. (build 전용)
+        """
+        profile_id = str(profile["id"])
+        if profile_id in self.profiles:
+            self.remove(profile_id)
+
+        name = normalize(profile.get("name"))
+        choseong = to_choseong(name)
+        keys = (
+            name,
+            choseong,
+            normalize(profile.get("student_id")),
+            normalize(profile.get("department")),
+            normalize(profile.get("slack_user_id")),
+        )
+        self.profiles[profile_id] = profile
+        self._keys[profile_id] = keys
+        self._order[profile_id] = (len(name), name, profile_id)
+        self._names.setdefault(name, set()).add(profile_id)
+        self._departments.setdefault(profile.get("department") or "", set()).add(profile_id)
+        self._name_prefix.add(prefixes(name), profile_id)
+        self._name_grams.add(grams(name), profile_id)
+        self._choseong_prefix.add(prefixes(choseong), profile_id)
+        self._choseong_grams.add(grams(choseong), profile_id)
+        self._other_grams.add(self._other_keys(keys), profile_id)
+        self._name_sorted.add(name, profile_id, bulk)
+        self._choseong_sorted.add(choseong, profile_id, bulk)
+        self._student_id_sorted.add(keys[2], profile_id, bulk)
+
+    def remove(self, profile_id: str) -> None:
+        keys = self._keys.pop(profile_id, None)
+        profile = self.profiles.pop(profile_id, None)
+        if keys is None:
+            return
+        name, choseong = keys[0], keys[1]
+        del self._order[profile_id]
+        for groups, key in ((self._names, name), (self._departments, profile.get("department") or "")):
+            ids = groups.get(key)
+            if ids is not None:
+                ids.discard(profile_id)
+                if not ids:
+                    del groups[key]
+        self._name_prefix.discard(prefixes(name), profile_id)
+        self._name_grams.discard(grams(name), profile_id)
+        self._choseong_prefix.discard(prefixes(choseong), profile_id)
+        self._choseong_grams.discard(grams(choseong), profile_id)
+        self._other_grams.discard(self._other_keys(keys), profile_id)
+        self._name_sorted.discard(name, profile_id)
+        self._choseong_sorted.discard(choseong, profile_id)
+        self._student_id_sorted.discard(keys[2], profile_id)
+
+    def _prefix_tier(self, prefix_postings: _Postings, sorted_keys: _SortedKeys, query: str) -> Collection[str]:
+        if len(query) <= 2:
+            return prefix_postings.ordered(query, self._order.__getitem__)
+        return sorted_keys.prefix(query)
+
+    def _contains_tier(self, gram_postings: _Postings, query: str, field: int) -> Collection[str]:
+        if len(query) <= 2:
+            return gram_postings.ordered(query, self._order.__getitem__)
+        candidates = gram_postings.lookup(query)
+        return {i for i in candidates if query in self._keys[i][field]}
+
+    def _tiers(self, query: str, all_fields: bool) -> Iterator[Collection[str]]:
+        """
+        단계별 후보를 차례로 만듭니다. 목록(list)은 이미 정렬된 후보, 집합(set)은 정렬이 필요한 후보입니다.
+        """
+        if has_choseong(query):
+            lookup = to_choseong(query)
+            mixed = lookup != query
+            prefix = self._prefix_tier(self._choseong_prefix, self._choseong_sorted, lookup)
+            if mixed:
+                # "김ㅇ"처럼 완성된 글자가 섞여 있으면 그 글자는 그대로 일치해야 합니다.
+                prefix = {i for i in prefix if match_choseong(self._keys[i][0], query) == 0}
+            yield prefix
+            contains = self._contains_tier(self._choseong_grams, lookup, 1)
+            if mixed:
+                contains = {i for i in contains if match_choseong(self._keys[i][0], query) >= 0}
+            yield contains
+            return
+
+        yield self._names.get(query, _EMPTY)
+        yield self._prefix_tier(self._name_prefix, self._name_sorted, query)
+        yield self._contains_tier(self._name_grams, query, 0)
+        if all_fields:
+            yield self._student_id_sorted.prefix(query)
+            candidates = self._other_grams.lookup(query)
+            yield {
+                i for i in candidates
+                if query in self._keys[i][2] or query in self._keys[i][3] or query in self._keys[i][4]
+            }
+
+    def search(
+        self,
+        query: str,
+        department: Optional[str] = None,
+        limit: Optional[int] = None,
+        all_fields: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        검색어와 일치하는 회원을 순위대로 반환합니다.
+
+        Args:
+            query: 이름(또는 초성) 검색어. all_fields이면 학번, 학과, Slack ID도 검색합니다.
+            department: 학과가 정확히 같은 회원만 남깁니다.
+            limit: 최대 반환 개수 (없으면 전체)
+        """
+        query = normalize(query)
+        allowed = self._departments.get(department, _EMPTY) if department is not None else None
+        order = self._order.__getitem__
+
+        if not query:
+            ids = allowed if allowed is not None else self.profiles.keys()
+            tiers: Iterable[Iterable[str]] = [ids]
+        else:
+            tiers = self._tiers(query, all_fields)
+
+        results: List[str] = []
+        seen: Set[str] = set()
+        for tier in tiers:
+            remaining = None if limit is None else limit - len(results)
+            if isinstance(tier, list):
+                # 정렬된 목록은 앞에서부터 필요한 만큼만 훑습니다.
+                for profile_id in tier:
+                    if profile_id in seen or (allowed is not None and profile_id not in allowed):
+                        continue
+                    results.append(profile_id)
+                    seen.add(profile_id)
+                    if remaining is not None and len(results) >= limit:
+                        break
+            else:
+                ids = tier - seen if seen else tier
+                if allowed is not None:
+                    ids = ids & allowed
+                if remaining is not None and remaining < len(ids):
+                    results.extend(heapq.nsmallest(remaining, ids, key=order))
+                else:
+                    results.extend(sorted(ids, key=order))
+                seen.update(ids)
+            if limit is not None and len(results) >= limit:
+                break
+
+        return [self.profiles[profile_id] for profile_id in results]
+
+
+class MemberDirectory:
+    """
+    profiles 전체를 메모리 색인으로 유지합니다.
+
+    - 시작 시 전체를 읽어 색인을 만들고(start), 이후에는 updated_at 워터마크 이후 바뀐 행만 반영합니다.
+    - 삭제된 회원은 워터마크로 알 수 없으므로 rebuild_interval마다 전체를 다시 만듭니다.
+    - 색인이 준비되기 전에는 ready가 False이며, 호출하는 쪽에서 DB 조회로 대신합니다.
+    """
+
+    def __init__(self, refresh_interval: float, rebuild_interval: float):
+        self.refresh_interval = refresh_interval
+        self.rebuild_interval = rebuild_interval
+        self._index = MemberIndex()
+        self._watermark: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self.ready = False
+        self.last_rebuild_at: Optional[float] = None
+        self.last_refresh_at: Optional[float] = None
+        self.last_rebuild_ms = 0.0
+        self.refreshed_rows = 0
+
+    async def _fetch(self, supabase: AsyncSupabase, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        start = 0
+        while True:
+            query = supabase.table("profiles").select("*")
+            if since is not None:
+                query = query.gte("updated_at", since)
+            result = await supabase.execute(
+                query.order("updated_at").order("id").range(start, start + PAGE_SIZE - 1)
+            )
+            rows.extend(result.data)
+            if len(result.data) < PAGE_SIZE:
+                return rows
+            start += PAGE_SIZE
+
+    def _advance_watermark(self, rows: List[Dict[str, Any]]) -> None:
+        stamps = [str(row["updated_at"]) for row in rows if row.get("updated_at")]
+        if stamps:
+            latest = max(stamps)
+            if self._watermark is None or latest > self._watermark:
+                self._watermark = latest
+
+    async def rebuild(self, supabase: AsyncSupabase) -> None:
+        """profiles 전체를 읽어 새 색인을 만든 뒤 교체합니다."""
+        started = time.perf_counter()
+        rows = await self._fetch(supabase)
+        # 5만 건 규모의 색인 생성은 이벤트 루프를 막지 않도록 스레드에서 합니다.
+        self._index = await asyncio.to_thread(MemberIndex.build, rows)
+        self._watermark = None
+        self._advance_watermark(rows)
+        self.ready = True
+        self.last_rebuild_at = time.time()
+        self.last_rebuild_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(f"Member directory rebuilt: {len(rows)} profiles in {self.last_rebuild_ms}ms")
+
+    async def refresh(self, supabase: AsyncSupabase) -> int:
+        """
+        워터마크 이후 바뀐 행만 색인에 반영합니다. 같은 시각의 행을 놓치지 않도록 워터마크와 같은 행도 다시 읽습니다.
+        """
+        if not self.ready:
+            await self.rebuild(supabase)
+            return len(self._index)
+
+        rows = await self._fetch(supabase, since=self._watermark)
+        for row in rows:
+            self._index.upsert(row)
+        self._advance_watermark(rows)
+        self.refreshed_rows += len(rows)
+        self.last_refresh_at = time.time()
+        return len(rows)
+
+    async def _run(self, supabase: AsyncSupabase) -> None:
+        while True:
+            try:
+                if not self.ready or (
+                    self.last_rebuild_at is not None
+                    and time.time() - self.last_rebuild_at >= self.rebuild_interval
+                ):
+                    await self.rebuild(supabase)
+                else:
+                    await self.refresh(supabase)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to refresh member directory: {str(e)}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self, supabase: AsyncSupabase) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(supabase), name="member-directory")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def upsert(self, profile: Dict[str, Any]) -> None:
+        """API에서 회원을 바꾼 직후 다음 갱신을 기다리지 않고 색인에 반영합니다."""
+        if self.ready:
+            self._index.upsert(profile)
+
+    def remove(self, profile_id: str) -> None:
+        """API에서 회원을 지우거나 id가 바뀐 직후 다음 재구성을 기다리지 않고 색인에서 뺍니다."""
+        if self.ready:
+            self._index.remove(str(profile_id))
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """색인에 있는 회원을 id로 찾습니다. (색인이 준비되지 않았으면 None)"""
+        return self._index.profiles.get(str(profile_id)) if self.ready else None
+
+    def search(
+        self,
+        query: Optional[str],
+        department: Optional[str] = None,
+        limit: Optional[int] = None,
+        all_fields: bool = False
+    ) -> List[Dict[str, Any]]:
+        return self._index.search(query or "", department=department, limit=limit, all_fields=all_fields)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "profiles": len(self._index),
+            "watermark": self._watermark,
+            "last_rebuild_at": self.last_rebuild_at,
+            "last_rebuild_ms": self.last_rebuild_ms,
+            "last_refresh_at": self.last_refresh_at,
+            "refreshed_rows": self.refreshed_rows,
+        }
+
+
+member_directory = MemberDirectory(
+    refresh_interval=settings.MEMBER_DIRECTORY_REFRESH_SECONDS,
+    rebuild_interval=settings.MEMBER_DIRECTORY_REBUILD_SECONDS,
+)
+
+directory_profiles = registry.gauge("clubos_member_directory_profiles", "Profiles held in the member search index")
+directory_ready = registry.gauge("clubos_member_directory_ready", "1 when the member search index is serving queries")
+
+
+def _collect_directory_stats() -> None:
+    stats = member_directory.stats()
+    directory_profiles.set(stats["profiles"])
+    directory_ready.set(1 if stats["ready"] else 0)
+
+
+registry.add_collector(_collect_directory_stats)
@@ -0,0 +1,126 @@
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import json
+import logging
+
+from ..core.config import settings
+from ..core.database import AsyncSupabase
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 시트의 매핑된 필드 -> profiles 열
+PROFILE_SYNC_FIELDS = {
+    "name": "name",
+    "gender": "gender",
+    "student_id": "student_id",
+    "department": "department",
+    "phone": "phone_number",
+}
+
+# PostgREST가 한 번에 돌려주는 최대 행 수
+PAGE_SIZE = 1000
+
+
+def profile_from_record(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    매핑된 시트 행을 profiles 행으로 변환합니다. 학번이 없으면 None을 반환합니다.
+    """
+    profile = {}
+    for field, column in PROFILE_SYNC_FIELDS.items():
+        value = record.get(field)
+        value = str(value).strip() if value is not None else ""
+        profile[column] = value or None
+    if not profile["student_id"] or not profile["name"]:
+        return None
+    return profile
+
+
+def fingerprint(profile: Dict[str, Any]) -> str:
+    payload = json.dumps(profile, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+async def fetch_fingerprints(supabase: AsyncSupabase) -> Dict[str, Optional[str]]:
+    """
+    저장된 학번별 fingerprint를 페이지 단위로 모두 가져옵니다.
+    """
+    fingerprints: Dict[str, Optional[str]] = {}
+    start = 0
+    while True:
+        result = await supabase.execute(
+            supabase.table("profiles")
+            .select("student_id,sync_fingerprint")
+            .not_.is_("student_id", "null")
+            .order("student_id")
+            .range(start, start + PAGE_SIZE - 1)
+        )
+        for row in result.data:
+            fingerprints[row["student_id"]] = row.get("sync_fingerprint")
+        if len(result.data) < PAGE_SIZE:
+            return fingerprints
+        start += PAGE_SIZE
+
+
+def diff_members(
+    records: List[Dict[str, Any]],
+    stored: Dict[str, Optional[str]]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], int, int]:
+    """
+    시트 행을 저장된 fingerprint와 비교해 (새 회원, 변경된 회원, 변경 없음 수, 건너뛴 행 수)를 반환합니다.
+    같은 학번이 여러 번 나오면 마지막 행을 사용합니다.
+    """
+    profiles: Dict[str, Dict[str, Any]] = {}
+    skipped = 0
+    for record in records:
+        profile = profile_from_record(record)
+        if profile is None:
+            skipped += 1
+            continue
+        profiles[profile["student_id"]] = profile
+
+    new_members, updated_members = [], []
+    unchanged = 0
+    for student_id, profile in profiles.items():
+        profile["sync_fingerprint"] = fingerprint(profile)
+        if student_id not in stored:
+            new_members.append(profile)
+        elif stored[student_id] != profile["sync_fingerprint"]:
+            updated_members.append(profile)
+        else:
+            unchanged += 1
+
+    return new_members, updated_members, unchanged, skipped
+
+
+async def upsert_members(supabase: AsyncSupabase, profiles: List[Dict[str, Any]], batch_size: Optional[int] = None) -> int:
+    batch_size = batch_size or settings.PROFILE_SYNC_BATCH_SIZE
+    written = 0
+    for start in range(0, len(profiles), batch_size):
+        batch = profiles[start:start + batch_size]
+        await supabase.execute(
+            supabase.table("profiles").upsert(batch, on_conflict="student_id")
+        )
+        written += len(batch)
+    return written
+
+
+async def sync_member_records(supabase: AsyncSupabase, records: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    시트 행 중 새로 생기거나 바뀐 회원만 profiles에 배치 upsert 합니다.
+    """
+    stored = await fetch_fingerprints(supabase)
+    new_members, updated_members, unchanged, skipped = diff_members(records, stored)
+
+    await upsert_members(supabase, new_members + updated_members)
+
+    logger.info(
+        f"Member sync: {len(new_members)} new, {len(updated_members)} updated, "
+        f"{unchanged} unchanged, {skipped} skipped"
+    )
+    return {
+        "new_members": len(new_members),
+        "updated_members": len(updated_members),
+        "unchanged": unchanged,
+        "skipped": skipped
+    }
@@ -0,0 +1,164 @@
+from typing import Any, Dict, List, Optional, Sequence
+from ..core.config import settings
+from ..core.database import AsyncSupabase
+from .member_directory import member_directory
+from .member_sync import fingerprint, profile_from_record
+import asyncio
+import logging
+import secrets
+import time
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# auth.signup과 같은 규칙으로 username을 이메일로 바꿉니다. (Supabase Auth는 이메일이 필요)
+EMAIL_DOMAIN = "igrus.com"
+
+def username_email(username: str) -> str:
+    return f"{username}@{EMAIL_DOMAIN}"
+
+def _already_registered(error: Exception) -> bool:
+    message = str(error).lower()
+    return "already" in message and ("registered" in message or "exists" in message)
+
+class Onboarding:
+    """
+    승인된 지원자 한 묶음을 auth 계정과 profiles로 한 번에 등록합니다.
+
+    1. 시트 행을 profiles 행으로 바꾸고 학번으로 중복을 제거합니다. (member_sync.profile_from_record)
+    2. auth 계정은 admin API로 최대 concurrency개씩 동시에 만듭니다. (로그인 왕복 없음)
+    3. 만든 계정의 프로필은 학번 기준 배치 upsert로 저장합니다. 시트 동기화로 먼저 생긴 프로필은
+       id가 auth 계정 id로 바뀌고, 참가 기록과 회원 집계도 DB에서 함께 옮겨집니다.
+       (event_participants 외래 키의 on update cascade, 20250801000008_profile_id_cascade.sql)
+    4. 배치가 실패하면 그 배치만 한 건씩 다시 시도하고, 그래도 실패한 지원자의 auth 계정은 지웁니다.
+
+    username은 학번이고 임시 비밀번호는 지원자마다 새로 만들어 리포트에 한 번만 담습니다.
+    """
+
+    def __init__(self, supabase: AsyncSupabase, concurrency: Optional[int] = None, batch_size: Optional[int] = None):
+        self.supabase = supabase
+        self.concurrency = concurrency or settings.ONBOARDING_CONCURRENCY
+        self.batch_size = batch_size or settings.PROFILE_SYNC_BATCH_SIZE
+
+    async def _create_user(self, profile: Dict[str, Any], semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        username = profile["student_id"]
+        result = {"student_id": username, "name": profile["name"], "username": username}
+        password = secrets.token_urlsafe(9)
+        async with semaphore:
+            try:
+                response = await self.supabase.run(self.supabase.auth.admin.create_user, {
+                    "email": username_email(username),
+                    "password": password,
+                    "email_confirm": True,
+                    "user_metadata": {"username": username, "name": profile["name"], "must_change_password": True},
+                })
+            except Exception as e:
+                if _already_registered(e):
+                    return {**result, "status": "exists"}
+                logger.warning(f"Failed to create auth user for {username}: {e}")
+                return {**result, "status": "failed", "error": str(e)}
+
+        if not response or not response.user:
+            return {**result, "status": "failed", "error": "auth 계정을 만들지 못했습니다."}
+        return {**result, "status": "created", "user_id": str(response.user.id), "temporary_password": password}
+
+    async def _upsert(self, profiles: List[Dict[str, Any]]) -> None:
+        await self.supabase.execute(self.supabase.table("profiles").upsert(profiles, on_conflict="student_id"))
+
+    async def _existing_ids(self, student_ids: List[str]) -> Dict[str, str]:
+        """이미 profiles에 있는 학번 -> 프로필 id"""
+        existing: Dict[str, str] = {}
+        for start in range(0, len(student_ids), self.batch_size):
+            result = await self.supabase.execute(
+                self.supabase.table("profiles").select("id,student_id")
+                .in_("student_id", student_ids[start:start + self.batch_size])
+            )
+            existing.update({row["student_id"]: str(row["id"]) for row in result.data})
+        return existing
+
+    async def _save_profiles(self, profiles: List[Dict[str, Any]], semaphore: asyncio.Semaphore) -> Dict[str, str]:
+        """프로필을 배치로 저장하고 끝내 저장하지 못한 학번 -> 오류를 반환합니다."""
+        failed: Dict[str, str] = {}
+
+        async def save_one(profile: Dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    await self._upsert([profile])
+                except Exception as e:
+                    failed[profile["student_id"]] = str(e)
+
+        for start in range(0, len(profiles), self.batch_size):
+            batch = profiles[start:start + self.batch_size]
+            try:
+                await self._upsert(batch)
+            except Exception as e:
+                # 한 행 때문에 배치 전체가 거절되었을 수 있으므로 나머지는 한 건씩 다시 저장합니다.
+                logger.warning(f"Profile batch of {len(batch)} failed, retrying one by one: {e}")
+                await asyncio.gather(*(save_one(profile) for profile in batch))
+        return failed
+
+    async def _rollback(self, user_id: str, semaphore: asyncio.Semaphore) -> Optional[str]:
+        async with semaphore:
+            try:
+                await self.supabase.run(self.supabase.auth.admin.delete_user, user_id)
+                return None
+            except Exception as e:
+                logger.error(f"Failed to roll back auth user {user_id}: {e}")
+                return str(e)
+
+    async def run(self, records: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        results: List[Dict[str, Any]] = []
+        profiles: Dict[str, Dict[str, Any]] = {}
+        for index, record in enumerate(records):
+            profile = profile_from_record(record)
+            if profile is None:
+                results.append({"index": index, "name": record.get("name"), "status": "skipped", "error": "이름 또는 학번이 없습니다."})
+            else:
+                # 시트 동기화가 같은 값을 다시 쓰지 않도록 fingerprint도 함께 저장합니다.
+                profile["sync_fingerprint"] = fingerprint(profile)
+                # 같은 학번이 여러 번 나오면 마지막 행을 사용합니다.
+                profiles[profile["student_id"]] = profile
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        created = await asyncio.gather(*(self._create_user(profile, semaphore) for profile in profiles.values()))
+
+        new_profiles = [
+            {**profiles[result["student_id"]], "id": result["user_id"]}
+            for result in created if result["status"] == "created"
+        ]
+        existing = await self._existing_ids([profile["student_id"] for profile in new_profiles])
+        failed = await self._save_profiles(new_profiles, semaphore)
+
+        rollbacks = {}
+        for result in created:
+            if result["student_id"] in failed:
+                rollbacks[result["student_id"]] = self._rollback(result["user_id"], semaphore)
+        rollback_errors = dict(zip(rollbacks, await asyncio.gather(*rollbacks.values())))
+
+        for result in created:
+            student_id = result["student_id"]
+            if student_id in failed:
+                result.update(status="failed", error=failed[student_id], rolled_back=rollback_errors[student_id] is None)
+                result.pop("temporary_password", None)
+            elif result["status"] == "created":
+                previous_id = existing.get(student_id)
+                if previous_id is not None and previous_id != result["user_id"]:
+                    # 시트 동기화로 만들어졌던 프로필이 새 auth 계정 id로 옮겨졌습니다.
+                    result["previous_profile_id"] = previous_id
+                    member_directory.remove(previous_id)
+                member_directory.upsert({**profiles[student_id], "id": result["user_id"]})
+            results.append(result)
+
+        counts = {status: 0 for status in ("created", "exists", "skipped", "failed")}
+        for result in results:
+            counts[result["status"]] += 1
+        elapsed = time.perf_counter() - started
+        logger.info(f"Onboarded {counts['created']}/{len(records)} applicants in {elapsed:.2f}s ({counts})")
+        return {"requested": len(records), **counts, "elapsed_sec": round(elapsed, 3), "results": results}
+
+async def onboard_applicants(supabase: AsyncSupabase, records: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    승인된 지원자(매핑된 시트 행) 목록을 auth 계정과 profiles로 등록하고 지원자별 리포트를 반환합니다.
+    """
+    return await Onboarding(supabase).run(records)
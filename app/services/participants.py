@@ -0,0 +1,82 @@
+from typing import Any, Dict, Iterable, List, Sequence
+from ..core.database import AsyncSupabase
+from ..models.profile import Profile, ProfileSummary
+from .member_directory import member_directory
+import asyncio
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 참가자 id를 함께 가져오기 위한 events select (event_participants.event_id 외래 키로 임베드)
+EVENT_WITH_PARTICIPANT_IDS = "*,event_participants(profile_id)"
+
+PROFILE_FIELDS = list(Profile.model_fields)
+SUMMARY_FIELDS = list(ProfileSummary.model_fields)
+
+# in_() 필터는 URL에 들어가므로 id가 많으면 나눠서 요청합니다.
+IN_FILTER_CHUNK = 200
+
+class ParticipantLoader:
+    """
+    요청 하나 동안 참가자 프로필을 모아서 한 번에 가져오는 로더입니다.
+
+    행사 목록의 모든 참가자 id를 모아 중복을 제거한 뒤 profiles를 in_() 한 번으로 조회하고,
+    행사별로 다시 나눠 붙입니다. 여러 행사에 참가한 회원도 한 번만 가져옵니다.
+    회원 검색 색인에 있는 회원은 DB를 거치지 않습니다.
+
+    요청 사이에 공유하지 않습니다. (라우트 핸들러에서 요청마다 새로 만듭니다)
+    """
+
+    def __init__(self, supabase: AsyncSupabase, compact: bool = False):
+        self.supabase = supabase
+        self.fields = SUMMARY_FIELDS if compact else PROFILE_FIELDS
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+        self.queries = 0
+
+    async def load_many(self, profile_ids: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        id별 프로필을 반환합니다. 이미 가져온 프로필은 다시 조회하지 않습니다.
+        """
+        wanted = {str(profile_id) for profile_id in profile_ids}
+        missing = []
+        for profile_id in wanted - self._profiles.keys():
+            profile = member_directory.get(profile_id)
+            if profile is None:
+                missing.append(profile_id)
+            else:
+                self._profiles[profile_id] = self._project(profile)
+
+        select = ",".join(self.fields)
+        chunks = [missing[start:start + IN_FILTER_CHUNK] for start in range(0, len(missing), IN_FILTER_CHUNK)]
+        # 나눠진 요청은 동시에 보내므로 대기 시간은 왕복 한 번입니다.
+        results = await asyncio.gather(*(
+            self.supabase.execute(self.supabase.table("profiles").select(select).in_("id", chunk))
+            for chunk in chunks
+        ))
+        self.queries += len(chunks)
+        for result in results:
+            for row in result.data:
+                self._profiles[str(row["id"])] = self._project(row)
+
+        return {profile_id: self._profiles[profile_id] for profile_id in wanted if profile_id in self._profiles}
+
+    def _project(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return {field: row.get(field) for field in self.fields}
+
+    async def attach(self, events: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        EVENT_WITH_PARTICIPANT_IDS로 조회한 행사 행에 participants(프로필 목록)를 붙여 반환합니다.
+        """
+        participant_ids = [
+            [str(link["profile_id"]) for link in event.get("event_participants") or []]
+            for event in events
+        ]
+        profiles = await self.load_many(profile_id for ids in participant_ids for profile_id in ids)
+
+        result = []
+        for event, ids in zip(events, participant_ids):
+            item = {key: value for key, value in event.items() if key != "event_participants"}
+            item["participants"] = [profiles[profile_id] for profile_id in ids if profile_id in profiles]
+            result.append(item)
+        return result
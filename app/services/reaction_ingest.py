@@ -0,0 +1,228 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import logging
+import queue
+import random
+import threading
+import time
+
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..core.metrics import execute_query
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 찾지 못한 키도 잠시 캐시해 같은 키로 DB를 반복 조회하지 않도록 합니다.
+_NOT_FOUND = ""
+_NOT_FOUND_TTL = 30.0
+
+# 배치 반영 실패 시 재시도 간격 (지수 백오프, 초)
+_RETRY_BACKOFF_BASE = 0.5
+_RETRY_BACKOFF_MAX = 30.0
+
+
+@dataclass
+class ReactionEvent:
+    action: str  # "add" 또는 "remove"
+    message_ts: str
+    slack_user_id: str
+    reaction: str
+    enqueued_at: float
+
+
+class ReactionIngestor:
+    """
+    Slack 반응 이벤트를 메모리 큐에 쌓아 두고, 백그라운드 스레드에서 모아서 처리합니다.
+
+    - item.ts -> 행사, user -> 회원 조회는 캐시된 인덱스를 사용하고, 없는 키만 in_() 한 번으로 조회합니다.
+    - 배치 안에서 같은 (행사, 회원)의 추가/제거는 마지막 동작만 반영합니다.
+    - 참가 정보는 upsert / delete 로 처리하므로 같은 이벤트가 다시 와도 결과가 같습니다.
+      그래서 DB 반영이 실패한 배치는 버리지 않고 백오프하며 그대로 다시 시도합니다.
+      (큐에 다시 넣지 않으므로 같은 회원의 추가/제거 순서가 바뀌지 않습니다)
+    """
+
+    def __init__(
+        self,
+        client_getter: Callable[[], Any],
+        batch_size: int,
+        flush_interval: float,
+        max_queue_size: int,
+        index_ttl: float,
+        max_attempts: int = 10,
+    ):
+        self._client_getter = client_getter
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self._queue: "queue.Queue[ReactionEvent]" = queue.Queue(maxsize=max_queue_size)
+        self._events_by_ts = TTLCache(max_size=10000, ttl=index_ttl)
+        self._profiles_by_slack_id = TTLCache(max_size=50000, ttl=index_ttl)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self.processed = 0
+        self.dropped = 0
+        self.ignored = 0
+        self.failed = 0
+        self.retries = 0
+        self.flushes = 0
+        self.last_batch_size = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="slack-reactions", daemon=True)
+                self._thread.start()
+
+    def submit(self, action: str, event: Dict[str, Any]) -> bool:
+        """
+        반응 이벤트를 큐에 넣고 바로 반환합니다. 큐가 가득 차면 버리고 False를 반환합니다.
+        """
+        item = event.get("item", {})
+        if item.get("type") != "message":
+            self.ignored += 1
+            return False
+
+        reactions = settings.SLACK_PARTICIPATION_REACTIONS
+        if reactions and event["reaction"] not in reactions:
+            self.ignored += 1
+            return False
+
+        self.start()
+        try:
+            self._queue.put_nowait(ReactionEvent(
+                action=action,
+                message_ts=item["ts"],
+                slack_user_id=event["user"],
+                reaction=event["reaction"],
+                enqueued_at=time.monotonic(),
+            ))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("Slack reaction queue is full, dropping event")
+            return False
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._flush_with_retry(batch)
+
+    def _flush_with_retry(self, batch: List[ReactionEvent]) -> bool:
+        for attempt in range(self.max_attempts):
+            try:
+                self.flush(batch)
+                return True
+            except Exception as e:
+                if attempt + 1 >= self.max_attempts:
+                    self.failed += len(batch)
+                    logger.error(f"Giving up on {len(batch)} Slack reactions after {self.max_attempts} attempts: {str(e)}")
+                    return False
+                # full jitter: 0 ~ min(max, base * 2^attempt)
+                delay = random.uniform(0, min(_RETRY_BACKOFF_MAX, _RETRY_BACKOFF_BASE * 2 ** attempt))
+                self.retries += 1
+                logger.warning(f"Failed to flush {len(batch)} Slack reactions, retrying in {delay:.2f}s: {str(e)}")
+                time.sleep(delay)
+        return False
+
+    def _resolve(
+        self,
+        keys: Iterable[str],
+        cache: TTLCache,
+        table: str,
+        key_column: str,
+    ) -> Dict[str, str]:
+        """
+        키 -> id 매핑을 캐시에서 찾고, 없는 키만 한 번의 in_() 쿼리로 가져옵니다.
+        """
+        resolved: Dict[str, str] = {}
+        missing: List[str] = []
+        for key in set(keys):
+            value = cache.get(key)
+            if value is None:
+                missing.append(key)
+            elif value != _NOT_FOUND:
+                resolved[key] = value
+
+        if missing:
+            client = self._client_getter()
+            result = execute_query(client.table(table).select(f"id,{key_column}").in_(key_column, missing))
+            for row in result.data:
+                resolved[row[key_column]] = row["id"]
+                cache.set(row[key_column], row["id"])
+            for key in missing:
+                if key not in resolved:
+                    cache.set(key, _NOT_FOUND, ttl=_NOT_FOUND_TTL)
+
+        return resolved
+
+    def flush(self, batch: List[ReactionEvent]) -> None:
+        events = self._resolve((e.message_ts for e in batch), self._events_by_ts, "events", "slack_message_ts")
+        profiles = self._resolve((e.slack_user_id for e in batch), self._profiles_by_slack_id, "profiles", "slack_user_id")
+
+        # 같은 (행사, 회원)에 대해서는 마지막 동작만 남깁니다.
+        final: Dict[Tuple[str, str], str] = {}
+        for e in batch:
+            event_id = events.get(e.message_ts)
+            profile_id = profiles.get(e.slack_user_id)
+            if event_id and profile_id:
+                final[(event_id, profile_id)] = e.action
+
+        adds = [
+            {"event_id": event_id, "profile_id": profile_id}
+            for (event_id, profile_id), action in final.items() if action == "add"
+        ]
+        removes: Dict[str, List[str]] = {}
+        for (event_id, profile_id), action in final.items():
+            if action == "remove":
+                removes.setdefault(event_id, []).append(profile_id)
+
+        client = self._client_getter()
+        if adds:
+            execute_query(client.table("event_participants").upsert(
+                adds, on_conflict="event_id,profile_id", ignore_duplicates=True
+            ))
+        for event_id, profile_ids in removes.items():
+            execute_query(
+                client.table("event_participants").delete().eq("event_id", event_id).in_("profile_id", profile_ids)
+            )
+
+        lag_ms = (time.monotonic() - min(e.enqueued_at for e in batch)) * 1000
+        self.processed += len(batch)
+        self.flushes += 1
+        self.last_batch_size = len(batch)
+        self.last_lag_ms = round(lag_ms, 1)
+        self.max_lag_ms = max(self.max_lag_ms, self.last_lag_ms)
+        logger.debug(
+            f"Flushed {len(batch)} reactions ({len(adds)} adds, "
+            f"{sum(len(v) for v in removes.values())} removes) in {lag_ms:.1f}ms"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "ignored": self.ignored,
+            "failed": self.failed,
+            "retries": self.retries,
+            "flushes": self.flushes,
+            "last_batch_size": self.last_batch_size,
+            "last_lag_ms": self.last_lag_ms,
+            "max_lag_ms": self.max_lag_ms,
+            "event_index": self._events_by_ts.stats(),
+            "profile_index": self._profiles_by_slack_id.stats(),
+        }
@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# 열 이름 매핑
+COLUMN_MAPPING = {
+    "타임스탬프": "timestamp",
+    "IGRUS의 활동에 참여하기 위해선 회비 2만원을 납부해주셔야 합니다. 회비 납부를 완료했습니까? ": "agreement",
+    "이름(ex.김아그)": "name",
+    "성별": "gender",
+    "학번 8자리(ex.12250000)(학번이 나오지 않은 신입생이라면 25학번이라고 적으신 후에 연락주시면 감사하겠습니다!)": "student_id",
+    "학년": "grade",
+    "학과": "department",
+    "재학/휴학 여부": "enrollment_status",
+    "연락처(ex.010-1234-5678)": "phone",
+    "관심 분야를 모두 체크해주세요.": "interests",
+    "IGRUS에 가입하게 된 경로가 어떻게 되나요?": "join_path",
+    "IGRUS에 들어오신 목적/이유가 무엇인가요?": "join_purpose",
+    "IGRUS에서 원하는 활동이 있다면 알려주세요!": "desired_activities",
+    "회비 납부": "payment_status",
+    "카톡초대": "kakao_invite"
+}
+
+STUDENT_ID_HEADER_PREFIX = "학번 8자리"
+PHONE_HEADER = "연락처(ex.010-1234-5678)"
+
+ColumnTransform = Callable[[Sequence[Any]], List[Any]]
+
+
+def normalize_phone_column(values: Sequence[Any]) -> List[str]:
+    """
+    하이픈과 공백을 제거하고, 10자리이면서 '10'으로 시작하면
+    앞의 '0'이 빠졌다고 보고 붙여줍니다.
+    """
+    cleaned = [str(v).replace('-', '').replace(' ', '') for v in values]
+    return ['0' + v if len(v) == 10 and v.startswith('10') else v for v in cleaned]
+
+
+def normalize_student_id_column(values: Sequence[Any]) -> List[str]:
+    return [str(v).strip() for v in values]
+
+
+@dataclass
+class ColumnPlan:
+    """
+    헤더를 한 번만 해석해 만든 열 변환 계획입니다.
+    keys[i]는 원본 i번째 열의 매핑된 이름, transforms[i]는 그 열에 적용할 변환입니다.
+    """
+    headers: List[str]
+    keys: List[str]
+    transforms: List[Optional[ColumnTransform]]
+
+    @property
+    def width(self) -> int:
+        return len(self.headers)
+
+    def project(self, fields: Sequence[str]) -> Tuple[List[int], "ColumnPlan"]:
+        """
+        요청한 필드(매핑된 이름 또는 원본 헤더)만 남긴 계획을 만듭니다.
+
+        Returns:
+            (원본 열 인덱스 목록, 해당 열만 담은 계획)
+
+        Raises:
+            ValueError: 시트에 없는 필드가 있는 경우
+        """
+        indices: List[int] = []
+        unknown: List[str] = []
+        for field in fields:
+            key = resolve_header(field)
+            if key not in self.keys:
+                unknown.append(field)
+            elif self.keys.index(key) not in indices:
+                indices.append(self.keys.index(key))
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+        return indices, ColumnPlan(
+            headers=[self.headers[i] for i in indices],
+            keys=[self.keys[i] for i in indices],
+            transforms=[self.transforms[i] for i in indices],
+        )
+
+
+def resolve_header(header: str) -> str:
+    if header.startswith(STUDENT_ID_HEADER_PREFIX):
+        return "student_id"
+    return COLUMN_MAPPING.get(header, header)
+
+
+def compile_column_plan(headers: Sequence[Any]) -> ColumnPlan:
+    headers = [str(h) for h in headers]
+    keys = [resolve_header(h) for h in headers]
+    transforms: List[Optional[ColumnTransform]] = []
+    for header, key in zip(headers, keys):
+        if header == PHONE_HEADER:
+            transforms.append(normalize_phone_column)
+        elif key == "student_id":
+            transforms.append(normalize_student_id_column)
+        else:
+            transforms.append(None)
+    return ColumnPlan(headers=headers, keys=keys, transforms=transforms)
+
+
+def apply_plan(plan: ColumnPlan, rows: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    행 목록을 열 단위로 바꿔 변환을 적용한 뒤, 매핑된 이름의 dict 목록으로 돌려줍니다.
+    """
+    if not rows:
+        return []
+
+    width = plan.width
+    rows = [row if len(row) == width else (list(row) + [""] * width)[:width] for row in rows]
+
+    columns = list(zip(*rows))
+    for i, transform in enumerate(plan.transforms):
+        if transform is not None:
+            columns[i] = transform(columns[i])
+
+    keys = plan.keys
+    return [dict(zip(keys, values)) for values in zip(*columns)]
+
+
+def map_sheet_values(values: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    get_all_values() 결과(첫 행이 헤더)를 매핑된 레코드 목록으로 변환합니다.
+    """
+    if not values:
+        return []
+    plan = compile_column_plan(values[0])
+    return apply_plan(plan, values[1:])
@@ -0,0 +1,179 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from ..core.metrics import registry, track_dependency
+import asyncio
+import logging
+import random
+import threading
+import time
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 재시도할 Google API 응답 코드 (할당량 초과, 일시적인 서버 오류)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+sheets_quota_requests = registry.counter(
+    "clubos_sheets_quota_requests_total", "Google API quota token requests by outcome", ("outcome",)
+)
+sheets_quota_wait = registry.histogram(
+    "clubos_sheets_quota_wait_seconds", "Time spent waiting for a Google API quota token",
+    buckets=(0.0, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+sheets_quota_tokens = registry.gauge(
+    "clubos_sheets_quota_tokens_available", "Google API quota tokens currently available"
+)
+sheets_retries = registry.counter(
+    "clubos_sheets_retries_total", "Google API calls retried by operation and status", ("operation", "status")
+)
+sheets_coalesced = registry.counter(
+    "clubos_sheets_coalesced_total", "Spreadsheet fetches that joined an in-flight fetch", ("kind",)
+)
+
+class SheetsQuotaError(Exception):
+    """
+    Google API 할당량을 기다릴 수 있는 시간 안에 얻지 못했거나, 재시도 후에도 429가 계속된 경우.
+    API에서는 500이 아니라 429와 Retry-After로 응답합니다.
+    """
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class TokenBucket:
+    """
+    분당 rate_per_minute개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷입니다. (스레드 안전)
+
+    토큰이 없으면 미리 예약하고 채워질 때까지 기다리므로 기다리는 호출들이 도착 순서대로 나갑니다.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int):
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def available(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, self._tokens)
+
+    def acquire(self, max_wait: float) -> float:
+        """
+        토큰 하나를 가져오고 기다린 시간(초)을 반환합니다. (blocking)
+        max_wait초 안에 받을 수 없으면 예약하지 않고 SheetsQuotaError를 올립니다.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if wait > max_wait:
+                sheets_quota_requests.inc(outcome="rejected")
+                raise SheetsQuotaError("Google Sheets API 요청 한도를 초과했습니다.", retry_after=wait)
+            self._tokens -= 1
+        sheets_quota_requests.inc(outcome="granted")
+        sheets_quota_wait.observe(wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+def _status_code(error: Exception) -> Optional[int]:
+    # gspread.exceptions.APIError는 code와 requests 응답(response)을 가지고 있습니다.
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is None:
+        status = getattr(error, "code", None)
+    return status if isinstance(status, int) else None
+
+def _retry_after(error: Exception) -> Optional[float]:
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+class SheetsScheduler:
+    """
+    Sheets/Drive API 호출마다 할당량 토큰을 받고, 429/5xx 응답은 지터를 넣은 지수 백오프로 재시도합니다.
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        max_retries: int,
+        backoff_base: float,
+        backoff_max: float,
+        max_wait: float,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.bucket = bucket
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_wait = max_wait
+        self._sleep = sleep
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        # full jitter: 0 ~ min(max, base * 2^attempt) 사이에서 고르므로 동시에 실패한 호출들이 흩어집니다.
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        return max(delay, retry_after or 0.0)
+
+    def call(self, operation: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """func(*args, **kwargs)를 할당량과 재시도 규칙에 따라 실행합니다. (blocking)"""
+        attempt = 0
+        while True:
+            self.bucket.acquire(self.max_wait)
+            try:
+                with track_dependency("google_sheets", operation):
+                    return func(*args, **kwargs)
+            except Exception as e:
+                status = _status_code(e)
+                if status not in RETRYABLE_STATUS:
+                    raise
+                retry_after = _retry_after(e)
+                if attempt >= self.max_retries:
+                    if status == 429:
+                        raise SheetsQuotaError(
+                            "Google Sheets API 요청 한도를 초과했습니다.",
+                            retry_after=retry_after or self.backoff_max
+                        ) from e
+                    raise
+                delay = self.backoff(attempt, retry_after)
+                sheets_retries.inc(operation=operation, status=str(status))
+                logger.warning(f"Google API {operation} returned {status}, retrying in {delay:.2f}s (attempt {attempt + 1})")
+                self._sleep(delay)
+                attempt += 1
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 비동기 작업을 하나로 합칩니다.
+
+    먼저 온 요청이 작업을 시작하고 나중에 온 요청은 그 결과를 함께 기다립니다.
+    한 요청이 타임아웃으로 취소되어도 공유 작업은 취소되지 않습니다.
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            sheets_coalesced.inc(kind=self.kind)
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 기다리던 요청이 모두 취소된 경우에도 예외를 회수해 경고가 남지 않게 합니다.
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
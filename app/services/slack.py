@@ -1,6 +1,9 @@
 from slack_bolt import App
 from slack_bolt.adapter.fastapi import SlackRequestHandler
 from ..core.config import settings
+from ..core.database import get_client
+from ..core.metrics import registry, track_dependency
+from .reaction_ingest import ReactionIngestor
 
 # Slack 앱 초기화
 app = App(
@@ -11,24 +14,28 @@ app = App(
 # FastAPI용 핸들러
 handler = SlackRequestHandler(app)
 
+# 반응 이벤트는 큐에 넣기만 하고 백그라운드에서 모아서 DB에 반영합니다.
+reaction_ingestor = ReactionIngestor(
+    client_getter=get_client,
+    batch_size=settings.SLACK_REACTION_BATCH_SIZE,
+    flush_interval=settings.SLACK_REACTION_FLUSH_INTERVAL,
+    max_queue_size=settings.SLACK_REACTION_QUEUE_SIZE,
+    index_ttl=settings.SLACK_INDEX_TTL_SECONDS,
+    max_attempts=settings.SLACK_REACTION_MAX_ATTEMPTS
+)
+
 @app.event("reaction_added")
 def handle_reaction_added(event, say):
     """
     이모지 반응이 추가되었을 때 처리
     """
     try:
-        # 이벤트 정보 추출
-        item = event["item"]
-        user = event["user"]
-        reaction = event["reaction"]
-        
-        # TODO: 이벤트 참가 처리 로직 구현
-        # 1. item.ts로 이벤트 찾기
-        # 2. user로 회원 찾기
-        # 3. 참가 정보 저장
+        # item.ts로 행사, user로 회원을 찾아 참가 정보를 저장합니다.
+        reaction_ingestor.submit("add", event)
         
     except Exception as e:
-        say(f"Error processing reaction: {str(e)}")
+        with track_dependency("slack", "say"):
+            say(f"Error processing reaction: {str(e)}")
 
 @app.event("reaction_removed")
 def handle_reaction_removed(event, say):
@@ -36,19 +43,39 @@ def handle_reaction_removed(event, say):
     이모지 반응이 제거되었을 때 처리
     """
     try:
-        # 이벤트 정보 추출
-        item = event["item"]
-        user = event["user"]
-        reaction = event["reaction"]
-        
-        # TODO: 이벤트 참가 취소 처리 로직 구현
-        # 1. item.ts로 이벤트 찾기
-        # 2. user로 회원 찾기
-        # 3. 참가 정보 삭제
+        # item.ts로 행사, user로 회원을 찾아 참가 정보를 삭제합니다.
+        reaction_ingestor.submit("remove", event)
         
     except Exception as e:
-        say(f"Error processing reaction removal: {str(e)}")
+        with track_dependency("slack", "say"):
+            say(f"Error processing reaction removal: {str(e)}")
 
 # Slack 이벤트 핸들러 가져오기
 async def get_slack_handler():
-    return handler 
\ No newline at end of file
+    return handler
+
+def get_reaction_stats():
+    """
+    반응 처리 큐 깊이, 배치 크기, 처리 지연 등을 반환합니다.
+    """
+    return reaction_ingestor.stats()
+
+reaction_queue_depth = registry.gauge("clubos_slack_reaction_queue_depth", "Slack reaction events waiting to be flushed")
+reaction_events = registry.gauge(
+    "clubos_slack_reaction_events", "Slack reaction events by outcome since start", ("outcome",)
+)
+reaction_batch_size = registry.gauge("clubos_slack_reaction_batch_size", "Size of the last flushed Slack reaction batch")
+reaction_retries = registry.gauge("clubos_slack_reaction_retries", "Slack reaction batch flush retries since start")
+reaction_lag = registry.gauge("clubos_slack_reaction_lag_ms", "Enqueue-to-write lag of Slack reactions", ("window",))
+
+def _collect_reaction_stats():
+    stats = reaction_ingestor.stats()
+    reaction_queue_depth.set(stats["queue_depth"])
+    for outcome in ("processed", "dropped", "ignored", "failed"):
+        reaction_events.set(stats[outcome], outcome=outcome)
+    reaction_batch_size.set(stats["last_batch_size"])
+    reaction_retries.set(stats["retries"])
+    reaction_lag.set(stats["last_lag_ms"], window="last")
+    reaction_lag.set(stats["max_lag_ms"], window="max")
+
+registry.add_collector(_collect_reaction_stats)
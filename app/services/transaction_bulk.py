@@ -0,0 +1,170 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from ..core.database import AsyncSupabase
+from ..models.transaction import TransactionBulkUpdateItem, TransactionUpdate
+import asyncio
+import json
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# in_() 필터는 URL에 들어가므로 id가 많으면 나눠서 요청합니다.
+BULK_CHUNK_SIZE = 200
+
+# 요청 하나에서 처리할 수 있는 최대 id 수
+MAX_BULK_IDS = 5000
+
+def _chunks(ids: Sequence[str]) -> List[List[str]]:
+    return [list(ids[start:start + BULK_CHUNK_SIZE]) for start in range(0, len(ids), BULK_CHUNK_SIZE)]
+
+def _unique(ids: Sequence[str]) -> List[str]:
+    return list(dict.fromkeys(str(i) for i in ids))
+
+def _check_target(ids: Optional[Sequence[str]], file_name: Optional[str]) -> None:
+    if (ids is None) == (file_name is None):
+        raise ValueError("ids와 file_name 중 하나만 지정해야 합니다.")
+    if ids is not None and len(ids) > MAX_BULK_IDS:
+        raise ValueError(f"한 번에 최대 {MAX_BULK_IDS}건까지 처리할 수 있습니다.")
+
+async def _check_file_size(supabase: AsyncSupabase, file_name: str) -> int:
+    """
+    file_name으로 한 문장에 바꿀 행 수를 세고, MAX_BULK_IDS를 넘으면 ValueError를 올립니다.
+    (ids 모드와 같은 상한. 그보다 큰 업로드는 ids로 나눠서 처리합니다)
+    """
+    result = await supabase.execute(
+        supabase.table("transactions").select("id", count="exact").eq("file_name", file_name).limit(1)
+    )
+    count = result.count or 0
+    if count > MAX_BULK_IDS:
+        raise ValueError(
+            f"{file_name} 파일의 거래가 {count}건으로 한 번에 처리할 수 있는 {MAX_BULK_IDS}건을 넘습니다. ids로 나눠서 요청하세요."
+        )
+    return count
+
+async def _run_chunks(supabase: AsyncSupabase, build, ids: Sequence[str]) -> Tuple[List[dict], Dict[str, str]]:
+    """
+    id 청크마다 build(chunk) 쿼리를 동시에 실행하고 (결과 행, 실패한 id -> 오류) 를 반환합니다.
+    한 청크가 실패해도 나머지 청크는 그대로 반영됩니다.
+    """
+    chunks = _chunks(ids)
+    results = await asyncio.gather(
+        *(supabase.execute(build(chunk)) for chunk in chunks),
+        return_exceptions=True
+    )
+    rows: List[dict] = []
+    errors: Dict[str, str] = {}
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Bulk statement failed for {len(chunk)} rows: {result}")
+            errors.update({transaction_id: str(result) for transaction_id in chunk})
+        else:
+            rows.extend(result.data or [])
+    return rows, errors
+
+def _report(action: str, ids: Optional[Sequence[str]], rows: List[dict], errors: Dict[str, str]) -> Dict[str, Any]:
+    done = {str(row["id"]) for row in rows}
+    if ids is None:
+        ids = sorted(done)
+    results = []
+    for transaction_id in ids:
+        if transaction_id in done:
+            results.append({"id": transaction_id, "status": action})
+        elif transaction_id in errors:
+            results.append({"id": transaction_id, "status": "error", "error": errors[transaction_id]})
+        else:
+            results.append({"id": transaction_id, "status": "not_found"})
+    dates = [row["transaction_date"] for row in rows if row.get("transaction_date")]
+    return {
+        "requested": len(ids),
+        action: len(done),
+        "not_found": sum(1 for r in results if r["status"] == "not_found"),
+        "failed": sum(1 for r in results if r["status"] == "error"),
+        "results": results,
+        "first_transaction_date": min(dates) if dates else None,
+        "last_transaction_date": max(dates) if dates else None,
+    }
+
+async def bulk_delete(
+    supabase: AsyncSupabase,
+    ids: Optional[Sequence[str]] = None,
+    file_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    id 목록(BULK_CHUNK_SIZE개씩 in_() 한 문장) 또는 업로드 파일 이름(최대 MAX_BULK_IDS건, 한 문장)으로 거래 내역을 삭제하고
+    행별 결과(deleted / not_found / error)를 담은 리포트를 반환합니다.
+    """
+    _check_target(ids, file_name)
+    table = lambda: supabase.table("transactions")
+
+    if file_name is not None:
+        await _check_file_size(supabase, file_name)
+        result = await supabase.execute(table().delete().eq("file_name", file_name))
+        return _report("deleted", None, result.data or [], {})
+
+    ids = _unique(ids)
+    rows, errors = await _run_chunks(supabase, lambda chunk: table().delete().in_("id", chunk), ids)
+    return _report("deleted", ids, rows, errors)
+
+def _changes(update: TransactionUpdate) -> Dict[str, Any]:
+    # 요청에서 지정한 필드만 바꿉니다. (null을 지정하면 null로)
+    return update.model_dump(exclude_unset=True)
+
+async def bulk_update(
+    supabase: AsyncSupabase,
+    ids: Optional[Sequence[str]] = None,
+    file_name: Optional[str] = None,
+    changes: Optional[TransactionUpdate] = None,
+    items: Optional[Sequence[TransactionBulkUpdateItem]] = None
+) -> Dict[str, Any]:
+    """
+    거래 내역을 한꺼번에 수정하고 행별 결과(updated / not_found / error)를 담은 리포트를 반환합니다.
+
+    - ids 또는 file_name + changes: 같은 값을 적용하므로 청크마다 update ... in_() 한 문장
+    - items: 행마다 다른 값. 바꾸는 값이 같은 행끼리 묶어 묶음마다 update ... in_() 한 문장을 보냅니다.
+      (upsert는 NOT NULL 열을 모두 보내야 하므로 부분 수정에는 쓰지 않습니다)
+    """
+    table = lambda: supabase.table("transactions")
+
+    if items is not None:
+        if ids is not None or file_name is not None or changes is not None:
+            raise ValueError("items는 ids, file_name, changes와 함께 쓸 수 없습니다.")
+        if len(items) > MAX_BULK_IDS:
+            raise ValueError(f"한 번에 최대 {MAX_BULK_IDS}건까지 처리할 수 있습니다.")
+
+        # 같은 id가 여러 번 오면 마지막 값을 씁니다.
+        per_id: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            values = item.model_dump(exclude_unset=True)
+            per_id[str(values.pop("id"))] = values
+        groups: Dict[str, Tuple[Dict[str, Any], List[str]]] = {}
+        for transaction_id, values in per_id.items():
+            key = json.dumps(values, sort_keys=True, default=str)
+            groups.setdefault(key, (values, []))[1].append(transaction_id)
+
+        ids = list(per_id)
+        rows: List[dict] = []
+        errors: Dict[str, str] = {}
+        empty = [i for values, group in groups.values() if not values for i in group]
+        errors.update({transaction_id: "수정할 필드가 없습니다." for transaction_id in empty})
+        results = await asyncio.gather(*(
+            _run_chunks(supabase, lambda chunk, values=values: table().update(values).in_("id", chunk), group)
+            for values, group in groups.values() if values
+        ))
+        for group_rows, group_errors in results:
+            rows.extend(group_rows)
+            errors.update(group_errors)
+        return _report("updated", ids, rows, errors)
+
+    _check_target(ids, file_name)
+    values = _changes(changes) if changes is not None else {}
+    if not values:
+        raise ValueError("수정할 필드가 없습니다.")
+
+    if file_name is not None:
+        await _check_file_size(supabase, file_name)
+        result = await supabase.execute(table().update(values).eq("file_name", file_name))
+        return _report("updated", None, result.data or [], {})
+
+    ids = _unique(ids)
+    rows, errors = await _run_chunks(supabase, lambda chunk: table().update(values).in_("id", chunk), ids)
+    return _report("updated", ids, rows, errors)
@@ -0,0 +1,317 @@
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+from pydantic import ValidationError
+from supabase import Client
+import numpy as np
+import pandas as pd
+import time
+import logging
+
+from ..core.config import settings
+from ..core.metrics import execute_query
+from ..models.transaction import TransactionCreate
+from .transaction_reconcile import BalanceChecker, existing_keys, natural_keys
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 은행 거래내역 파일의 열 이름 매핑
+TRANSACTION_COLUMN_MAPPING = {
+    "거래일시": "transaction_date",
+    "거래일자": "transaction_date",
+    "거래일": "transaction_date",
+    "적요": "description",
+    "내용": "description",
+    "거래내용": "description",
+    "거래구분": "transaction_type",
+    "구분": "transaction_type",
+    "거래기관": "institution",
+    "은행": "institution",
+    "계좌번호": "account_number",
+    "거래금액": "amount",
+    "입금액": "deposit",
+    "입금": "deposit",
+    "출금액": "withdrawal",
+    "출금": "withdrawal",
+    "잔액": "balance",
+    "거래 후 잔액": "balance",
+    "거래후잔액": "balance",
+    "메모": "memo",
+}
+
+TEXT_COLUMNS = ["description", "transaction_type", "institution", "account_number", "memo"]
+
+# 리포트에 포함할 거절 행 예시 개수
+MAX_REJECTED_SAMPLES = 20
+
+
+def _detect_encoding(file: BinaryIO) -> str:
+    """
+    국내 은행 CSV는 cp949인 경우가 많으므로 앞부분만 읽어 인코딩을 판별합니다.
+    """
+    head = file.read(64 * 1024)
+    file.seek(0)
+    try:
+        head.decode("utf-8")
+        return "utf-8-sig"
+    except UnicodeDecodeError as e:
+        # 잘린 멀티바이트 문자 때문에 끝부분에서만 실패한 경우는 utf-8로 봅니다.
+        if e.start >= len(head) - 3:
+            return "utf-8-sig"
+        return "cp949"
+
+
+def iter_chunks(file: BinaryIO, filename: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    파일을 chunk_size 행 단위의 DataFrame으로 나눠 읽습니다.
+    DataFrame의 index는 파일 내 데이터 행 번호(0부터)입니다.
+    """
+    if filename.endswith(".csv"):
+        yield from pd.read_csv(
+            file,
+            chunksize=chunk_size,
+            dtype=str,
+            encoding=_detect_encoding(file),
+            skipinitialspace=True,
+        )
+    elif filename.endswith(".xlsx"):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = [str(c).strip() if c is not None else "" for c in header]
+
+            start = 0
+            batch: List[tuple] = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= chunk_size:
+                    yield pd.DataFrame(batch, columns=columns, index=range(start, start + len(batch)))
+                    start += len(batch)
+                    batch = []
+            if batch:
+                yield pd.DataFrame(batch, columns=columns, index=range(start, start + len(batch)))
+        finally:
+            workbook.close()
+    else:
+        # .xls는 스트리밍 파서가 없으므로 한 번에 읽은 뒤 나눕니다.
+        df = pd.read_excel(file, dtype=str)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size]
+
+
+def _to_datetime(series: pd.Series) -> pd.Series:
+    # "2025.03.02 10:00:00", "2025/03/02", "2025.03.02." 형식을 ISO 8601로 맞춘 뒤 한 번에 변환합니다.
+    # 구분자는 앞의 날짜 부분에서만 바꿉니다. (시각의 소수점 초 "10:00:00.123"은 그대로)
+    cleaned = series.astype(str).str.strip().str.replace(
+        r"^(\d{4})[./](\d{1,2})[./](\d{1,2})\.?", r"\1-\2-\3", regex=True
+    )
+    return pd.to_datetime(cleaned, errors="coerce", format="ISO8601")
+
+
+def _to_int(series: pd.Series) -> pd.Series:
+    cleaned = series.astype(str).str.replace(r"[,\s원]", "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce")
+
+
+def normalize_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    열 이름을 매핑하고 날짜/금액/잔액을 벡터 연산으로 정규화합니다.
+    정규화할 수 없는 값은 NaN/NaT가 됩니다.
+    """
+    df = df.rename(columns=lambda c: TRANSACTION_COLUMN_MAPPING.get(str(c).strip(), str(c).strip()))
+    # 같은 의미의 열이 여러 개면 첫 번째만 사용합니다.
+    df = df.loc[:, ~df.columns.duplicated()]
+
+    out = pd.DataFrame(index=df.index)
+
+    if "transaction_date" in df:
+        out["transaction_date"] = _to_datetime(df["transaction_date"])
+    else:
+        out["transaction_date"] = pd.NaT
+
+    if "amount" in df:
+        out["amount"] = _to_int(df["amount"])
+    elif "deposit" in df or "withdrawal" in df:
+        deposit = _to_int(df["deposit"]).fillna(0) if "deposit" in df else 0
+        withdrawal = _to_int(df["withdrawal"]).fillna(0) if "withdrawal" in df else 0
+        out["amount"] = deposit - withdrawal
+    else:
+        out["amount"] = np.nan
+
+    out["balance"] = _to_int(df["balance"]) if "balance" in df else np.nan
+
+    for column in TEXT_COLUMNS:
+        if column in df:
+            values = df[column].astype("string").str.strip()
+            out[column] = values.where(values != "", None)
+        else:
+            out[column] = None
+
+    return out
+
+
+def _reject_reasons(df: pd.DataFrame) -> pd.Series:
+    """
+    필수 값이 빠진 행에 대해 거절 사유를 반환합니다. 정상 행은 빈 문자열입니다.
+    """
+    reasons = pd.Series("", index=df.index, dtype=object)
+    checks = [
+        (df["transaction_date"].isna(), "transaction_date "),
+        (df["amount"].isna(), "amount "),
+        (df["balance"].isna(), "balance "),
+        (df["description"].isna(), "description "),
+    ]
+    for mask, label in checks:
+        reasons = reasons.where(~mask, reasons + label)
+    return reasons.str.strip()
+
+
+def _to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    df = df.astype({"amount": "int64", "balance": "int64"})
+    df = df.astype(object).where(df.notna(), None)
+    return df.to_dict("records")
+
+
+def import_transactions(
+    supabase: Client,
+    file: BinaryIO,
+    filename: str,
+    batch_size: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    lookup_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    거래내역 파일을 청크 단위로 파싱/정규화/검증하고 배치 insert 합니다.
+    처리량, 거절된 행, 단계별 소요 시간을 담은 리포트를 반환합니다.
+
+    겹치는 기간의 파일을 다시 올려도 같은 거래가 두 번 저장되지 않도록 행마다 자연 키
+    (거래일시, 금액, 잔액, 적요, 계좌번호)를 계산하고, lookup_size 행마다 한 번의 RPC로
+    이미 있는 키를 확인해 건너뜁니다. 잔액이 이어지지 않는 행(누락된 거래)은 저장하되 리포트에 표시합니다.
+    """
+    batch_size = batch_size or settings.TRANSACTION_IMPORT_BATCH_SIZE
+    chunk_size = chunk_size or settings.TRANSACTION_IMPORT_CHUNK_SIZE
+    lookup_size = lookup_size or settings.TRANSACTION_DEDUP_LOOKUP_SIZE
+
+    timings = {"parse": 0.0, "normalize": 0.0, "validate": 0.0, "dedup": 0.0, "insert": 0.0}
+    total_rows = 0
+    inserted_rows = 0
+    rejected_rows = 0
+    duplicate_rows = 0
+    lookups = 0
+    rejected_samples: List[Dict[str, Any]] = []
+    balances = BalanceChecker()
+    # 자연 키 조회를 기다리는 행과 이번 파일에서 이미 본 키
+    pending: List[Dict[str, Any]] = []
+    seen_keys: set = set()
+    # 저장한 거래의 거래일시 범위 (기간별 요약 캐시 무효화용)
+    date_range: List[Optional[str]] = [None, None]
+
+    def reject(row_index: int, reason: str) -> None:
+        nonlocal rejected_rows
+        rejected_rows += 1
+        if len(rejected_samples) < MAX_REJECTED_SAMPLES:
+            # 헤더가 1행이므로 파일상의 행 번호는 index + 2 입니다.
+            rejected_samples.append({"row": int(row_index) + 2, "reason": reason})
+
+    def flush_pending() -> None:
+        nonlocal inserted_rows, duplicate_rows, lookups, pending
+        if not pending:
+            return
+        t = time.perf_counter()
+        existing = existing_keys(supabase, [row["natural_key"] for row in pending])
+        lookups += 1
+        rows = [row for row in pending if row["natural_key"] not in existing]
+        duplicate_rows += len(pending) - len(rows)
+        pending = []
+        timings["dedup"] += time.perf_counter() - t
+
+        t = time.perf_counter()
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            # 동시에 같은 파일을 올린 경우에도 고유 인덱스 충돌은 건너뜁니다.
+            result = execute_query(supabase.table("transactions").upsert(
+                batch, on_conflict="natural_key", ignore_duplicates=True
+            ))
+            inserted = len(result.data) if result.data is not None else len(batch)
+            inserted_rows += inserted
+            duplicate_rows += len(batch) - inserted
+            if inserted:
+                dates = [row["transaction_date"] for row in batch]
+                date_range[0] = min(filter(None, [date_range[0], min(dates)]))
+                date_range[1] = max(filter(None, [date_range[1], max(dates)]))
+        timings["insert"] += time.perf_counter() - t
+
+    started = time.perf_counter()
+    chunks = iter_chunks(file, filename, chunk_size)
+    while True:
+        t = time.perf_counter()
+        chunk = next(chunks, None)
+        timings["parse"] += time.perf_counter() - t
+        if chunk is None:
+            break
+        total_rows += len(chunk)
+
+        t = time.perf_counter()
+        normalized = normalize_chunk(chunk)
+        reasons = _reject_reasons(normalized)
+        invalid = reasons != ""
+        for row_index, reason in reasons[invalid].items():
+            reject(row_index, f"missing or invalid: {reason}")
+        valid = normalized[~invalid]
+        timings["normalize"] += time.perf_counter() - t
+
+        t = time.perf_counter()
+        balances.check(valid)
+        keys = natural_keys(valid)
+        timings["dedup"] += time.perf_counter() - t
+
+        t = time.perf_counter()
+        for row_index, key, record in zip(valid.index, keys, _to_records(valid)):
+            if key in seen_keys:
+                # 같은 파일 안에서 반복된 행
+                duplicate_rows += 1
+                continue
+            try:
+                row = TransactionCreate(**record).model_dump(mode="json")
+            except ValidationError as e:
+                reject(row_index, e.errors()[0]["msg"])
+                continue
+            seen_keys.add(key)
+            row["file_name"] = filename
+            row["natural_key"] = key
+            pending.append(row)
+        timings["validate"] += time.perf_counter() - t
+
+        if len(pending) >= lookup_size:
+            flush_pending()
+
+    flush_pending()
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"Imported {inserted_rows}/{total_rows} rows from {filename} "
+        f"in {elapsed:.2f}s ({rejected_rows} rejected, {duplicate_rows} duplicates, "
+        f"{balances.gaps} balance gaps)"
+    )
+
+    return {
+        "file_name": filename,
+        "total_rows": total_rows,
+        "inserted_rows": inserted_rows,
+        "duplicate_rows": duplicate_rows,
+        "rejected_rows": rejected_rows,
+        "rejected_samples": rejected_samples,
+        "balance_gaps": balances.gaps,
+        "balance_gap_samples": balances.samples,
+        "dedup_lookups": lookups,
+        "first_transaction_date": date_range[0],
+        "last_transaction_date": date_range[1],
+        "batch_size": batch_size,
+        "rows_per_sec": round(total_rows / elapsed, 1) if elapsed > 0 else None,
+        "elapsed_sec": round(elapsed, 4),
+        "timings": {stage: round(seconds, 4) for stage, seconds in timings.items()},
+    }
@@ -0,0 +1,119 @@
+from typing import Any, Dict, Iterable, List, Optional, Set
+from supabase import Client
+import hashlib
+import logging
+import pandas as pd
+
+from ..core.metrics import execute_query
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 자연 키를 만드는 열 (순서 고정, DB의 transaction_natural_key()와 같아야 합니다)
+NATURAL_KEY_COLUMNS = ["transaction_date", "amount", "balance", "description", "account_number"]
+
+# 리포트에 포함할 잔액 불일치 예시 개수
+MAX_GAP_SAMPLES = 20
+
+
+def natural_key(transaction_date: str, amount: int, balance: int, description: Optional[str], account_number: Optional[str]) -> str:
+    """
+    거래 한 건의 자연 키(md5 hex)를 만듭니다.
+    transaction_date는 초 단위 UTC 'YYYY-MM-DDTHH:MM:SS' 문자열입니다.
+    """
+    raw = "|".join([transaction_date, str(amount), str(balance), description or "", account_number or ""])
+    return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def natural_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    정규화된 청크(normalize_chunk 결과)의 행별 자연 키를 계산합니다.
+    문자열 조립은 열 단위로 하고 해시만 행마다 계산합니다.
+    """
+    dates = df["transaction_date"]
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_convert("UTC").dt.tz_localize(None)
+    raw = (
+        dates.dt.strftime("%Y-%m-%dT%H:%M:%S")
+        .str.cat(df["amount"].astype("int64").astype(str), sep="|")
+        .str.cat(df["balance"].astype("int64").astype(str), sep="|")
+        .str.cat(df["description"].fillna("").astype(str), sep="|")
+        .str.cat(df["account_number"].fillna("").astype(str), sep="|")
+    )
+    return pd.Series([hashlib.md5(s.encode("utf-8")).hexdigest() for s in raw], index=df.index, dtype=object)
+
+
+def existing_keys(supabase: Client, keys: Iterable[str]) -> Set[str]:
+    """
+    이미 저장된 자연 키를 한 번의 RPC로 조회합니다. (natural_key 고유 인덱스 사용)
+    """
+    keys = list(keys)
+    if not keys:
+        return set()
+    result = execute_query(supabase.rpc("transaction_keys_exist", {"keys": keys}))
+    return {row["natural_key"] if isinstance(row, dict) else row for row in result.data or []}
+
+
+class BalanceChecker:
+    """
+    계좌별로 '이전 잔액 + 금액 = 잔액'이 이어지는지 청크 단위 벡터 연산으로 확인합니다.
+
+    은행 파일은 최신순 또는 과거순으로 정렬되어 있으므로 첫 청크에서 더 많이 맞는 방향을 고르고,
+    청크 사이는 계좌별 마지막 행을 넘겨 받아 이어서 확인합니다.
+    """
+
+    def __init__(self):
+        self.newest_first: Optional[bool] = None
+        # 계좌 -> 직전 행의 (잔액, 금액)
+        self._last: Dict[str, tuple] = {}
+        self.gaps = 0
+        self.samples: List[Dict[str, Any]] = []
+
+    def check(self, df: pd.DataFrame) -> pd.Series:
+        """잔액이 이어지지 않는 행이면 True인 Series를 반환합니다."""
+        if df.empty:
+            return pd.Series(False, index=df.index)
+
+        account = df["account_number"].fillna("").astype(str)
+        balance = df["balance"].astype("int64")
+        amount = df["amount"].astype("int64")
+
+        prev_balance = balance.groupby(account).shift(1)
+        prev_amount = amount.groupby(account).shift(1)
+        # 청크 첫 행은 이전 청크의 같은 계좌 마지막 행과 비교합니다.
+        first = prev_balance.isna()
+        if self._last:
+            carried = account[first].map(lambda a: self._last.get(a, (None, None)))
+            prev_balance[first] = [c[0] for c in carried]
+            prev_amount[first] = [c[1] for c in carried]
+
+        has_prev = prev_balance.notna()
+        # 과거순: 이전 잔액 + 이번 금액 = 이번 잔액 / 최신순: 이번 잔액 + 이전 행 금액 = 이전 잔액
+        oldest_first_ok = (prev_balance + amount) == balance
+        newest_first_ok = (balance + prev_amount) == prev_balance
+
+        if self.newest_first is None and has_prev.any():
+            self.newest_first = int(newest_first_ok[has_prev].sum()) > int(oldest_first_ok[has_prev].sum())
+
+        ok = newest_first_ok if self.newest_first else oldest_first_ok
+        mismatch = has_prev & ~ok
+
+        for row_index in mismatch[mismatch].index[:max(0, MAX_GAP_SAMPLES - len(self.samples))]:
+            if self.newest_first:
+                expected = int(prev_balance[row_index] - prev_amount[row_index])
+            else:
+                expected = int(prev_balance[row_index] + amount[row_index])
+            self.samples.append({
+                # 헤더가 1행이므로 파일상의 행 번호는 index + 2 입니다.
+                "row": int(row_index) + 2,
+                "account_number": account[row_index] or None,
+                "expected_balance": expected,
+                "balance": int(balance[row_index]),
+                "difference": int(balance[row_index]) - expected,
+            })
+        self.gaps += int(mismatch.sum())
+
+        last_rows = pd.DataFrame({"account": account, "balance": balance, "amount": amount}).groupby("account").last()
+        for acct, row in last_rows.iterrows():
+            self._last[acct] = (int(row["balance"]), int(row["amount"]))
+        return mismatch
@@ -0,0 +1,258 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Tuple
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..core.database import AsyncSupabase
+import logging
+import time
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 학기 시작일별 통계 캐시
+# 앱을 거치지 않은 변경도 결국 반영되도록 TTL을 함께 둡니다.
+_stats_cache = TTLCache(max_size=32, ttl=settings.TRANSACTION_STATS_CACHE_SECONDS)
+
+# invalidate_transaction_stats()가 불릴 때마다 1씩 늘어납니다. 조회 전후로 값이 다르면 캐시에 쓰지 않습니다.
+# (통계와 기간별 요약 캐시가 함께 사용)
+_stats_generation = 0
+
+def default_term_start() -> date:
+    """기본 통계 기간의 시작일: 올해 3월 1일"""
+    return date(datetime.now().year, 3, 1)
+
+async def fetch_transaction_stats(supabase: AsyncSupabase, term_start: date, refresh: bool = False) -> Dict[str, Any]:
+    """
+    transaction_stats RPC로 DB에서 집계한 거래 통계를 반환합니다.
+    refresh=True이면 캐시를 무시하고 다시 계산해 캐시를 채웁니다. (백그라운드 미리 계산용)
+    """
+    cached = None if refresh else _stats_cache.get(term_start)
+    if cached is not None:
+        return cached
+
+    # 집계하는 동안 거래가 바뀌면(invalidate_transaction_stats) 결과를 캐시에 넣지 않습니다.
+    generation = _stats_generation
+    result = await supabase.execute(
+        supabase.rpc("transaction_stats", {"term_start": term_start.isoformat()})
+    )
+    row = result.data[0] if result.data else {}
+
+    total_balance = row.get("total_balance") or 0
+    this_term_income = row.get("this_term_income") or 0
+    this_term_expense = row.get("this_term_expense") or 0
+    this_term_profit = this_term_income - this_term_expense
+
+    stats = {
+        "total_balance": total_balance,
+        "this_term_income": this_term_income,
+        "this_term_expense": this_term_expense,
+        "this_term_profit": this_term_profit,
+        "previous_balance": total_balance - this_term_profit,
+        "total_transactions": row.get("total_transactions") or 0,
+        "latest_transaction_date": row.get("latest_transaction_date")
+    }
+
+    if generation == _stats_generation:
+        _stats_cache.set(term_start, stats)
+    return stats
+
+# 기간별 요약 버킷 단위
+SUMMARY_BUCKETS = ("day", "week", "month", "term")
+
+# 요청 하나에서 돌려줄 수 있는 최대 버킷 수 (일 단위 약 5년)
+MAX_SUMMARY_BUCKETS = 2000
+
+# 버킷 단위별로 기억할 최대 버킷 수 (넘으면 그 단위의 캐시를 비웁니다)
+_MAX_CACHED_BUCKETS = 20000
+
+# 버킷 단위 -> {버킷 시작일: (만료 시각, 집계 행)}
+# 지난 버킷은 거래가 더 생기지 않으므로 오래 기억하고, 진행 중인 버킷은 통계 캐시와 같은 TTL을 씁니다.
+# 앱을 통한 변경은 invalidate_transaction_stats()가 바뀐 날짜의 버킷만 지웁니다.
+_summary_cache: Dict[str, Dict[date, Tuple[float, Dict[str, Any]]]] = {bucket: {} for bucket in SUMMARY_BUCKETS}
+
+# 요약 창의 첫 버킷에 거래가 없을 때 쓰는 시작일 -> 그 이전 마지막 잔액
+_opening_balance_cache = TTLCache(max_size=256, ttl=settings.TRANSACTION_STATS_CACHE_SECONDS)
+
+
+def bucket_start(bucket: str, day: date) -> date:
+    """
+    day가 속한 버킷의 시작일. (DB의 transaction_bucket_start()와 같은 규칙)
+    주는 월요일, 학기는 3월 1일(1학기)과 9월 1일(2학기)에 시작합니다.
+    """
+    if bucket == "day":
+        return day
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    if bucket == "term":
+        if day.month >= 9:
+            return date(day.year, 9, 1)
+        if day.month >= 3:
+            return date(day.year, 3, 1)
+        return date(day.year - 1, 9, 1)
+    raise ValueError(f"invalid bucket: {bucket}")
+
+def next_bucket_start(bucket: str, start: date) -> date:
+    """버킷 시작일 start 다음 버킷의 시작일"""
+    if bucket == "day":
+        return start + timedelta(days=1)
+    if bucket == "week":
+        return start + timedelta(days=7)
+    if bucket == "month":
+        return date(start.year + start.month // 12, start.month % 12 + 1, 1)
+    if bucket == "term":
+        return date(start.year, 9, 1) if start.month == 3 else date(start.year + 1, 3, 1)
+    raise ValueError(f"invalid bucket: {bucket}")
+
+def bucket_starts(bucket: str, start_date: date, end_date: date) -> List[date]:
+    """start_date ~ end_date에 걸치는 버킷 시작일 목록"""
+    starts = []
+    current = bucket_start(bucket, start_date)
+    while current <= end_date:
+        starts.append(current)
+        current = next_bucket_start(bucket, current)
+    return starts
+
+def window_start(bucket: str, end_date: date, buckets: int) -> date:
+    """end_date가 속한 버킷을 포함해 최근 buckets개 버킷의 시작일"""
+    start = bucket_start(bucket, end_date)
+    for _ in range(buckets - 1):
+        start = bucket_start(bucket, start - timedelta(days=1))
+    return start
+
+def _empty_bucket() -> Dict[str, Any]:
+    return {"income": 0, "expense": 0, "transaction_count": 0, "closing_balance": None}
+
+async def _opening_balance(supabase: AsyncSupabase, before: date) -> int:
+    """before 이전 마지막 거래 후 잔액 (그 전에 거래가 없으면 0)"""
+    result = await supabase.execute(
+        supabase.table("transactions")
+        .select("balance")
+        .lt("transaction_date", before.isoformat())
+        .order("transaction_date", desc=True)
+        .order("created_at", desc=True)
+        .limit(1)
+    )
+    return (result.data[0].get("balance") or 0) if result.data else 0
+
+async def fetch_transaction_summary(
+    supabase: AsyncSupabase,
+    bucket: str,
+    start_date: date,
+    end_date: date
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    start_date ~ end_date를 bucket 단위로 나눈 수입/지출/순이익/거래 수/기말 잔액과 DB 조회 횟수를 반환합니다.
+
+    캐시에 없는 버킷만 transaction_summary RPC 한 번으로 DB에서 집계합니다.
+    (빠진 버킷 중 가장 이른 것부터 마지막 것까지를 한 범위로 조회)
+    거래가 없는 버킷도 0으로 채워 반환하며, 기말 잔액은 직전 버킷의 값을 이어 받습니다.
+    첫 버킷에 거래가 없으면 그 이전 마지막 거래 후 잔액을 한 번 더 조회해 채웁니다.
+    """
+    starts = bucket_starts(bucket, start_date, end_date)
+    if len(starts) > MAX_SUMMARY_BUCKETS:
+        raise ValueError(f"too many buckets: {len(starts)} > {MAX_SUMMARY_BUCKETS}")
+
+    cache = _summary_cache[bucket]
+    now = time.monotonic()
+    # 응답은 이 지역 사본으로 만듭니다. (아래에서 캐시를 비우거나 다른 요청이 무효화해도 영향 없음)
+    entries: Dict[date, Dict[str, Any]] = {}
+    missing = []
+    for start in starts:
+        cached = cache.get(start)
+        if cached is not None and cached[0] > now:
+            entries[start] = cached[1]
+        else:
+            missing.append(start)
+
+    queries = 0
+    if missing:
+        # RPC를 기다리는 동안 invalidate_transaction_stats()가 불리면 결과가 이미 낡았을 수 있으므로
+        # 이번 응답에만 쓰고 캐시에는 넣지 않습니다.
+        generation = _stats_generation
+        query_start = missing[0]
+        query_end = min(next_bucket_start(bucket, missing[-1]) - timedelta(days=1), end_date)
+        result = await supabase.execute(supabase.rpc("transaction_summary", {
+            "bucket": bucket,
+            "start_date": query_start.isoformat(),
+            "end_date": query_end.isoformat(),
+        }))
+        queries = 1
+        found = {date.fromisoformat(str(row["bucket_start"])[:10]): row for row in result.data or []}
+
+        cacheable = generation == _stats_generation
+        if cacheable and len(cache) + len(missing) > _MAX_CACHED_BUCKETS:
+            cache.clear()
+        today = datetime.now(timezone.utc).date()
+        open_start = bucket_start(bucket, today)
+        for start in bucket_starts(bucket, query_start, query_end):
+            row = found.get(start)
+            entry = _empty_bucket() if row is None else {
+                "income": row.get("income") or 0,
+                "expense": row.get("expense") or 0,
+                "transaction_count": row.get("transaction_count") or 0,
+                "closing_balance": row.get("closing_balance"),
+            }
+            entries[start] = entry
+            # end_date에서 잘린 과거 버킷은 일부만 집계했으므로 이번 응답에만 씁니다.
+            partial = next_bucket_start(bucket, start) - timedelta(days=1) > query_end and query_end < today
+            if cacheable and not partial:
+                ttl = settings.TRANSACTION_SUMMARY_CACHE_SECONDS if start < open_start else settings.TRANSACTION_STATS_CACHE_SECONDS
+                cache[start] = (now + ttl, entry)
+
+    closing_balance = None
+    if starts and entries[starts[0]]["closing_balance"] is None:
+        closing_balance = _opening_balance_cache.get(starts[0])
+        if closing_balance is None:
+            generation = _stats_generation
+            closing_balance = await _opening_balance(supabase, starts[0])
+            queries += 1
+            if generation == _stats_generation:
+                _opening_balance_cache.set(starts[0], closing_balance)
+
+    summary = []
+    for start in starts:
+        entry = entries[start]
+        if entry["closing_balance"] is not None:
+            closing_balance = entry["closing_balance"]
+        summary.append({
+            "bucket_start": start.isoformat(),
+            "bucket_end": (next_bucket_start(bucket, start) - timedelta(days=1)).isoformat(),
+            "income": entry["income"],
+            "expense": entry["expense"],
+            "net": entry["income"] - entry["expense"],
+            "transaction_count": entry["transaction_count"],
+            "closing_balance": closing_balance,
+        })
+    return summary, queries
+
+def _to_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).date() if value.tzinfo else value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+def invalidate_transaction_stats(first_date: Any = None, last_date: Any = None) -> None:
+    """
+    거래 내역이 변경되었을 때 호출해 캐시된 통계를 비웁니다.
+    바뀐 거래의 거래일시 범위(first_date ~ last_date)를 주면 기간별 요약은 그 범위에 걸친 버킷만 지우고,
+    주지 않으면 모두 지웁니다.
+    """
+    global _stats_generation
+    logger.debug("Invalidating cached transaction stats")
+    _stats_generation += 1
+    _stats_cache.clear()
+    _opening_balance_cache.clear()
+
+    if first_date is None or last_date is None:
+        for cache in _summary_cache.values():
+            cache.clear()
+        return
+
+    first, last = sorted((_to_date(first_date), _to_date(last_date)))
+    for bucket, cache in _summary_cache.items():
+        lowest = bucket_start(bucket, first)
+        for start in [start for start in cache if lowest <= start <= last]:
+            del cache[start]
@@ -0,0 +1,91 @@
+"""
+인증 오버헤드 벤치마크
+
+Supabase에 매번 토큰을 확인하는 remote 모드와
+로컬 서명 검증 + 캐시를 사용하는 local 모드의 요청당 인증 비용을 비교합니다.
+
+    python -m benchmarks.bench_auth --requests 2000 --latency-ms 30
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "benchmark-key")
+# local 모드는 기본 JWT 비밀키를 거부하므로 벤치마크용 비밀키를 씁니다.
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-jwt-secret-0123456789abcdef")
+
+import jwt
+
+from app.core import security
+from app.core.config import settings
+from app.core.database import AsyncSupabase
+from benchmarks.fakes import FakeSupabase
+
+
+def make_token(user_id: str) -> str:
+    now = int(time.time())
+    claims = {
+        "sub": user_id,
+        "aud": settings.JWT_AUDIENCE,
+        "role": "authenticated",
+        "email": f"{user_id}@igrus.com",
+        "iat": now,
+        "exp": now + 3600,
+    }
+    return jwt.encode(claims, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
+async def run(mode: str, tokens, supabase: AsyncSupabase, requests: int):
+    settings.AUTH_VERIFY_MODE = mode
+    security.clear_auth_cache()
+    supabase.client.calls = 0
+
+    samples = []
+    for i in range(requests):
+        token = tokens[i % len(tokens)]
+        start = time.perf_counter()
+        user = await security.verify_token(token, supabase)
+        samples.append(time.perf_counter() - start)
+        assert user is not None
+
+    samples.sort()
+    return {
+        "mode": mode,
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99) - 1] * 1e6,
+        "remote_calls": supabase.client.calls,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=50, help="동시에 활동하는 사용자(토큰) 수")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="Supabase auth 왕복 지연")
+    args = parser.parse_args()
+
+    fake = FakeSupabase(latency=args.latency_ms / 1000)
+    tokens = [make_token(f"user-{i}") for i in range(args.users)]
+    for token in tokens:
+        claims = jwt.decode(token, options={"verify_signature": False})
+        fake.auth.users[token] = security._user_from_claims(claims)
+    supabase = AsyncSupabase(fake, max_workers=1)
+
+    # remote 모드는 요청마다 지연이 발생하므로 요청 수를 줄여서 측정합니다.
+    remote_requests = min(args.requests, 200)
+    results = [
+        asyncio.run(run("remote", tokens, supabase, remote_requests)),
+        asyncio.run(run("local", tokens, supabase, args.requests)),
+    ]
+
+    print(f"{'mode':<8}{'mean(us)':>12}{'p50(us)':>12}{'p99(us)':>12}{'remote calls':>14}")
+    for r in results:
+        print(f"{r['mode']:<8}{r['mean_us']:>12.1f}{r['p50_us']:>12.1f}{r['p99_us']:>12.1f}{r['remote_calls']:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+거래 내역 일괄 수정/삭제 벤치마크 (건별 요청 vs 일괄 엔드포인트)
+
+app.main:app 을 FakeSupabase에 연결하고 같은 작업을 두 가지 방식으로 보냅니다.
+
+    single  프런트엔드처럼 PUT/DELETE /transactions/{id} 를 한 건씩 순서대로 N번
+    bulk    POST /transactions/bulk-update, /transactions/bulk-delete 한 번
+
+HTTP 요청 수, DB 문장 수, 전체 시간을 출력합니다.
+
+    python -m benchmarks.bench_bulk --rows 1000 --latency-ms 5
+"""
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "benchmark-key")
+
+import httpx
+
+from app.core.database import AsyncSupabase, get_supabase
+from app.core.security import require_admin
+from benchmarks.bench_concurrency import seed_transactions
+from benchmarks.fakes import FakeSupabase
+
+
+async def single_update(client: httpx.AsyncClient, rows):
+    for row in rows:
+        body = {
+            "transaction_date": str(row["transaction_date"]),
+            "description": row["description"],
+            "amount": row["amount"],
+            "balance": row["balance"],
+            "memo": "재분류",
+        }
+        (await client.put(f"/transactions/{row['id']}", json=body)).raise_for_status()
+    return len(rows)
+
+
+async def bulk_update(client: httpx.AsyncClient, rows):
+    body = {"ids": [row["id"] for row in rows], "changes": {"memo": "재분류"}}
+    response = await client.post("/transactions/bulk-update", json=body)
+    response.raise_for_status()
+    assert response.json()["updated"] == len(rows)
+    return 1
+
+
+async def single_delete(client: httpx.AsyncClient, rows):
+    for row in rows:
+        (await client.delete(f"/transactions/{row['id']}")).raise_for_status()
+    return len(rows)
+
+
+async def bulk_delete(client: httpx.AsyncClient, rows):
+    response = await client.post("/transactions/bulk-delete", json={"ids": [row["id"] for row in rows]})
+    response.raise_for_status()
+    assert response.json()["deleted"] == len(rows)
+    return 1
+
+
+async def run(args):
+    from app.main import app
+
+    app.dependency_overrides[require_admin] = lambda: None
+    print(f"{'mode':<16}{'requests':>10}{'db calls':>10}{'ms':>12}")
+    for label, action in (
+        ("single update", single_update),
+        ("bulk update", bulk_update),
+        ("single delete", single_delete),
+        ("bulk delete", bulk_delete),
+    ):
+        rows = seed_transactions(args.rows)
+        fake = FakeSupabase(latency=args.latency_ms / 1000, tables={"transactions": rows})
+        db = AsyncSupabase(fake, max_workers=8)
+
+        async def override():
+            yield db
+
+        app.dependency_overrides[get_supabase] = override
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                start = time.perf_counter()
+                requests = await action(client, list(rows))
+                elapsed = (time.perf_counter() - start) * 1000
+            print(f"{label:<16}{requests:>10}{fake.calls:>10}{elapsed:>12.1f}")
+        finally:
+            app.dependency_overrides.pop(get_supabase, None)
+            db.shutdown()
+    app.dependency_overrides.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="DB 문장 하나의 왕복 시간")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
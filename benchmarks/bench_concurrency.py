@@ -0,0 +1,87 @@
+"""
+동시성 벤치마크
+
+지연이 있는 로컬 Supabase 대역을 두고 GET /transactions/ 를 N개 동시에 보내
+스레드 풀 크기에 따라 처리량이 늘어나는지 확인합니다.
+풀 크기 1은 모든 DB 호출이 직렬로 처리되던 기존 동작과 같은 처리량입니다.
+
+    python -m benchmarks.bench_concurrency --requests 200 --latency-ms 50
+"""
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "benchmark-key")
+
+import httpx
+
+from app.core.database import AsyncSupabase, get_supabase
+from app.main import app
+from benchmarks.fakes import FakeSupabase
+
+
+def seed_transactions(count: int):
+    rows = []
+    balance = 0
+    for i in range(count):
+        balance += 1000
+        rows.append({
+            "id": f"tx-{i}",
+            "transaction_date": f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:00:00",
+            "description": f"거래 {i}",
+            "transaction_type": "입금",
+            "institution": "테스트은행",
+            "account_number": "123-456",
+            "amount": 1000,
+            "balance": balance,
+            "memo": None,
+            "file_name": "seed.csv",
+            "uploaded_at": "2025-07-01T00:00:00",
+            "created_at": "2025-07-01T00:00:00",
+            "updated_at": "2025-07-01T00:00:00",
+        })
+    return rows
+
+
+async def run(pool_size: int, requests: int, fake: FakeSupabase):
+    db = AsyncSupabase(fake, max_workers=pool_size)
+
+    async def override():
+        yield db
+
+    app.dependency_overrides[get_supabase] = override
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            started = time.perf_counter()
+            responses = await asyncio.gather(*[
+                client.get("/transactions/", params={"limit": 20}) for _ in range(requests)
+            ])
+            elapsed = time.perf_counter() - started
+    finally:
+        app.dependency_overrides.pop(get_supabase, None)
+        db.shutdown()
+
+    assert all(r.status_code == 200 for r in responses)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 8, 32, 64])
+    args = parser.parse_args()
+
+    fake = FakeSupabase(latency=args.latency_ms / 1000, tables={"transactions": seed_transactions(500)})
+
+    print(f"{'pool':>6}{'elapsed(s)':>12}{'req/s':>10}")
+    for pool_size in args.pool_sizes:
+        elapsed = asyncio.run(run(pool_size, args.requests, fake))
+        print(f"{pool_size:>6}{elapsed:>12.2f}{args.requests / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+스트리밍 export 벤치마크
+
+로컬 Supabase 대역에 거래 내역을 시드하고 GET /transactions/export 를 스트리밍으로 받아
+첫 바이트까지의 시간(TTFB), 전체 시간, 서버 측 최대 메모리 증가량을 행 수별로 측정합니다.
+
+    python -m benchmarks.bench_export --rows 1000 100000 --latency-ms 20
+"""
+import argparse
+import asyncio
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "benchmark-key")
+
+from app.core.database import AsyncSupabase, get_supabase
+from app.main import app
+from benchmarks.bench_concurrency import seed_transactions
+from benchmarks.fakes import FakeSupabase
+
+
+async def run(rows: int, latency: float, format: str, encoding: str):
+    fake = FakeSupabase(latency=latency, tables={"transactions": seed_transactions(rows)})
+    db = AsyncSupabase(fake, max_workers=4)
+
+    async def override():
+        yield db
+
+    # httpx의 ASGITransport는 응답 전체를 모은 뒤 돌려주므로 ASGI 앱을 직접 호출해
+    # 첫 body 메시지가 나가는 시점을 잽니다.
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/transactions/export",
+        "raw_path": b"/transactions/export",
+        "query_string": f"format={format}".encode(),
+        "headers": [(b"host", b"bench"), (b"accept-encoding", encoding.encode())],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    ttfb = None
+    size = 0
+    requested = False
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # 응답이 끝날 때까지 연결이 유지되는 것처럼 기다립니다.
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal ttfb, size
+        if message["type"] != "http.response.body":
+            return
+        if message.get("body"):
+            if ttfb is None:
+                ttfb = time.perf_counter() - started
+            size += len(message["body"])
+        if not message.get("more_body", False):
+            finished.set()
+
+    app.dependency_overrides[get_supabase] = override
+    try:
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        started = time.perf_counter()
+        await app(scope, receive, send)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        app.dependency_overrides.pop(get_supabase, None)
+        db.shutdown()
+
+    return ttfb, elapsed, size, peak - baseline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--encoding", choices=["gzip", "identity"], default="gzip")
+    args = parser.parse_args()
+
+    print(f"{'rows':>8}{'ttfb(ms)':>10}{'total(s)':>10}{'bytes':>12}{'peak(MB)':>10}")
+    for rows in args.rows:
+        ttfb, elapsed, size, peak = asyncio.run(run(rows, args.latency_ms / 1000, args.format, args.encoding))
+        print(f"{rows:>8}{ttfb * 1000:>10.1f}{elapsed:>10.2f}{size:>12}{peak / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+회원 검색 색인 마이크로 벤치마크
+
+합성 50k명의 profiles로 MemberIndex를 만들고, 검색어 종류별로 색인 검색과
+전체 행을 훑는 방식(ilike '%name%'과 같은 선형 탐색)의 지연 시간(p50/p95, µs)을 비교합니다.
+
+    python -m benchmarks.bench_member_search --profiles 50000
+"""
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+import uuid
+
+from app.services.member_directory import MemberIndex, to_choseong
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+SYLLABLES = "민서준지현우도윤하은예수영진성호연유아그다솔빈주원채희승재"
+DEPARTMENTS = ["컴퓨터공학과", "정보통신공학과", "수학과", "경영학과", "전기공학과", "산업경영공학과", "물리학과"]
+
+
+def make_profiles(count: int):
+    random.seed(7)
+    profiles = []
+    for i in range(count):
+        name = random.choice(SURNAMES) + "".join(random.choices(SYLLABLES, k=random.choice((1, 2, 2, 2, 3))))
+        profiles.append({
+            "id": str(uuid.UUID(int=i)),
+            "name": name,
+            "department": random.choice(DEPARTMENTS),
+            "student_id": str(12180000 + i),
+            "slack_user_id": f"U{i:08X}",
+            "updated_at": "2025-08-01T00:00:00+00:00",
+        })
+    return profiles
+
+
+def linear_search(profiles, query):
+    # 기존 ilike '%name%' 조회를 메모리에서 흉내낸 것 (DB 왕복 시간은 제외)
+    needle = query.lower()
+    return [p for p in profiles if needle in p["name"].lower()]
+
+
+def percentile(samples, q):
+    return statistics.quantiles(samples, n=100)[q - 1] if len(samples) > 1 else samples[0]
+
+
+def measure(func, queries, repeat):
+    samples = []
+    for _ in range(repeat):
+        for query in queries:
+            start = time.perf_counter()
+            func(query)
+            samples.append((time.perf_counter() - start) * 1e6)
+    return percentile(samples, 50), percentile(samples, 95)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    profiles = make_profiles(args.profiles)
+
+    start = time.perf_counter()
+    index = MemberIndex.build(profiles)
+    build_seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    MemberIndex.build(profiles)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"build: {len(index)} profiles in {build_seconds:.2f}s, peak {peak / 1e6:.1f}MB")
+
+    random.seed(11)
+    sample = random.sample(profiles, args.queries)
+    query_sets = {
+        "full name": [p["name"] for p in sample],
+        "prefix (2 chars)": [p["name"][:2] for p in sample],
+        "single char": [p["name"][1] for p in sample],
+        "choseong": [to_choseong(p["name"]) for p in sample],
+        "student_id": [p["student_id"][:6] for p in sample],
+    }
+
+    print(f"{'query':<18}{'index p50':>11}{'index p95':>11}{'scan p50':>11}{'scan p95':>11}  (µs)")
+    for label, queries in query_sets.items():
+        all_fields = label == "student_id"
+        index_p50, index_p95 = measure(
+            lambda q: index.search(q, limit=20, all_fields=all_fields), queries, args.repeat
+        )
+        if label in ("choseong", "student_id"):
+            scan = "-"
+            print(f"{label:<18}{index_p50:>11.1f}{index_p95:>11.1f}{scan:>11}{scan:>11}")
+            continue
+        scan_p50, scan_p95 = measure(lambda q: linear_search(profiles, q), queries, 1)
+        print(f"{label:<18}{index_p50:>11.1f}{index_p95:>11.1f}{scan_p50:>11.1f}{scan_p95:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+지원자 일괄 등록 벤치마크 (공개 회원가입 라우트 반복 vs 관리자 일괄 등록)
+
+app.main:app 을 FakeSupabase에 연결하고 승인된 지원자 N명을 두 가지 방식으로 등록합니다.
+
+    signup   POST /auth/signup 을 한 명씩 순서대로 (sign_up, sign_in_with_password, profiles insert = 3왕복/명)
+    bulk     POST /admin/onboarding 한 번 (admin create_user 동시 실행 + profiles 배치 upsert)
+
+    python -m benchmarks.bench_onboarding --applicants 150 --latency-ms 30
+"""
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "benchmark-key")
+
+import httpx
+
+from app.core.database import AsyncSupabase, get_supabase
+from app.core.security import require_admin
+from benchmarks.fakes import FakeSupabase
+
+
+def make_applicants(count: int):
+    return [
+        {
+            "name": f"지원자{i}",
+            "student_id": f"2025{i:05d}",
+            "department": "컴퓨터공학과",
+            "phone": f"010-0000-{i:04d}",
+            "gender": "남" if i % 2 else "여",
+        }
+        for i in range(count)
+    ]
+
+
+async def signup_each(client: httpx.AsyncClient, applicants):
+    for applicant in applicants:
+        response = await client.post("/auth/signup", json={
+            "username": applicant["student_id"],
+            "password": "temporary-password",
+            "name": applicant["name"],
+            "department": applicant["department"],
+            "phone": applicant["phone"],
+        })
+        response.raise_for_status()
+    return len(applicants)
+
+
+async def bulk(client: httpx.AsyncClient, applicants):
+    response = await client.post("/admin/onboarding", json={"applicants": applicants})
+    response.raise_for_status()
+    assert response.json()["data"]["created"] == len(applicants)
+    return len(applicants)
+
+
+async def run(args):
+    from app.main import app
+
+    applicants = make_applicants(args.applicants)
+    app.dependency_overrides[require_admin] = lambda: None
+    print(f"{'mode':<10}{'created':>9}{'db calls':>10}{'sec':>9}")
+    try:
+        for label, action in (("signup", signup_each), ("bulk", bulk)):
+            fake = FakeSupabase(latency=args.latency_ms / 1000, tables={"profiles": []})
+            db = AsyncSupabase(fake, max_workers=32)
+
+            async def override():
+                yield db
+
+            app.dependency_overrides[get_supabase] = override
+            transport = httpx.ASGITransport(app=app)
+            try:
+                async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+                    start = time.perf_counter()
+                    created = await action(client, applicants)
+                    elapsed = time.perf_counter() - start
+                assert len(fake.tables["profiles"]) == len(applicants)
+                print(f"{label:<10}{created:>9}{fake.calls:>10}{elapsed:>9.2f}")
+            finally:
+                db.shutdown()
+    finally:
+        app.dependency_overrides.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applicants", type=int, default=150)
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="Supabase 호출 한 번의 왕복 시간")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+행사 목록 참가자 로딩 벤치마크 (N+1 vs 배치 로더)
+
+FakeSupabase에 행사, 참가, 회원을 만들어 두고 행사 한 페이지를 참가자와 함께 만드는 방식을 비교합니다.
+
+    naive   행사 조회 1번 + 행사마다 참가자 프로필 조회 (N+1, 여러 행사 참가자는 중복 조회)
+    loader  행사 조회 1번 + 중복을 제거한 profiles in_() 조회 (ParticipantLoader)
+
+쿼리 수, 가져온 프로필 행 수, 페이지 생성 시간을 출력합니다.
+
+    python -m benchmarks.bench_participants --events 50 --participants 30 --latency-ms 20
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+import uuid
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "benchmark-key")
+
+from app.core.database import AsyncSupabase
+from app.services.participants import EVENT_WITH_PARTICIPANT_IDS, PROFILE_FIELDS, ParticipantLoader
+from benchmarks.bench_member_search import make_profiles
+from benchmarks.fakes import FakeSupabase
+
+
+def make_tables(events: int, participants: int, members: int):
+    random.seed(5)
+    profiles = make_profiles(members)
+    rows = []
+    links = []
+    for i in range(events):
+        event_id = str(uuid.UUID(int=10**6 + i))
+        rows.append({
+            "id": event_id,
+            "name": f"행사 {i}",
+            "category": random.choice(["학술", "소셜", "정기총회"]),
+            "event_date": f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}T18:00:00+00:00",
+        })
+        for profile in random.sample(profiles, min(participants, members)):
+            links.append({"event_id": event_id, "profile_id": profile["id"]})
+    return {"events": rows, "event_participants": links, "profiles": profiles}
+
+
+async def naive_page(supabase: AsyncSupabase, limit: int):
+    result = await supabase.execute(
+        supabase.table("events").select(EVENT_WITH_PARTICIPANT_IDS).order("event_date", desc=True).limit(limit)
+    )
+    page, fetched = [], 0
+    for event in result.data:
+        ids = [link["profile_id"] for link in event["event_participants"]]
+        profiles = await supabase.execute(supabase.table("profiles").select(",".join(PROFILE_FIELDS)).in_("id", ids))
+        fetched += len(profiles.data)
+        page.append({**event, "participants": profiles.data})
+    return page, 1 + len(result.data), fetched
+
+
+async def loader_page(supabase: AsyncSupabase, limit: int, compact: bool):
+    loader = ParticipantLoader(supabase, compact=compact)
+    result = await supabase.execute(
+        supabase.table("events").select(EVENT_WITH_PARTICIPANT_IDS).order("event_date", desc=True).limit(limit)
+    )
+    page = await loader.attach(result.data)
+    return page, 1 + loader.queries, len(loader._profiles)
+
+
+async def run(args):
+    fake = FakeSupabase(latency=args.latency_ms / 1000, tables=make_tables(args.events, args.participants, args.members))
+    db = AsyncSupabase(fake, max_workers=4)
+    try:
+        print(f"{'mode':<16}{'queries':>9}{'profiles':>10}{'ms':>10}")
+        for label, page in (
+            ("naive", lambda: naive_page(db, args.events)),
+            ("loader", lambda: loader_page(db, args.events, compact=False)),
+            ("loader compact", lambda: loader_page(db, args.events, compact=True)),
+        ):
+            start = time.perf_counter()
+            _, queries, fetched = await page()
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{label:<16}{queries:>9}{fetched:>10}{elapsed:>10.1f}")
+    finally:
+        db.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--participants", type=int, default=30, help="행사당 참가자 수")
+    parser.add_argument("--members", type=int, default=300)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
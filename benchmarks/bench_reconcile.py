@@ -0,0 +1,91 @@
+"""
+거래내역 재업로드 중복 제거/잔액 검증 벤치마크
+
+잔액이 이어지는 합성 거래내역 CSV(--rows)를 만들고, 그 중 앞쪽 --overlap 행은 이미 저장된
+상태(FakeSupabase)에서 import_transactions를 실행합니다.
+
+새로 저장된 행, 건너뛴 중복 행, 잔액 불일치, 중복 확인 왕복 횟수와 단계별 시간을 출력하고,
+행마다 존재 여부를 조회했다면 필요했을 왕복 횟수/예상 시간과 비교합니다.
+
+    python -m benchmarks.bench_reconcile --rows 10000 --overlap 9000 --latency-ms 20
+"""
+import argparse
+import io
+import os
+from datetime import datetime, timedelta
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "benchmark-key")
+
+from app.services.transaction_import import import_transactions
+from app.services.transaction_reconcile import natural_key
+from benchmarks.fakes import FakeSupabase, transaction_keys_exist_rpc
+
+
+def make_statement(rows: int, gap_every: int = 0):
+    """과거순 거래내역 행 목록 (gap_every마다 거래 하나를 빼서 잔액 불일치를 만듭니다)"""
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    balance = 1_000_000
+    records = []
+    for i in range(rows + (rows // gap_every if gap_every else 0)):
+        amount = 15000 if i % 3 == 0 else -4000 - (i % 7) * 100
+        balance += amount
+        if gap_every and i % gap_every == gap_every - 1:
+            continue
+        records.append({
+            "transaction_date": start + timedelta(minutes=37 * i),
+            "description": f"거래 {i % 50}",
+            "amount": amount,
+            "balance": balance,
+            "account_number": "123-456-789",
+        })
+    return records[:rows]
+
+
+def to_csv(records) -> bytes:
+    lines = ["거래일시,적요,입금액,출금액,잔액,계좌번호"]
+    for r in records:
+        deposit, withdrawal = (r["amount"], 0) if r["amount"] > 0 else (0, -r["amount"])
+        lines.append(
+            f"{r['transaction_date']:%Y.%m.%d %H:%M:%S},{r['description']},{deposit},{withdrawal},"
+            f"{r['balance']},{r['account_number']}"
+        )
+    return "\n".join(lines).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--overlap", type=int, default=9000, help="이미 저장되어 있는 행 수")
+    parser.add_argument("--gap-every", type=int, default=2500, help="N행마다 거래 하나를 빼서 잔액 불일치를 만듭니다 (0이면 없음)")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    records = make_statement(args.rows, args.gap_every)
+    existing = [
+        {
+            **r,
+            "transaction_date": r["transaction_date"].isoformat(),
+            "natural_key": natural_key(
+                r["transaction_date"].strftime("%Y-%m-%dT%H:%M:%S"), r["amount"], r["balance"],
+                r["description"], r["account_number"]
+            ),
+        }
+        for r in records[:args.overlap]
+    ]
+    fake = FakeSupabase(latency=args.latency_ms / 1000, tables={"transactions": existing})
+    fake.rpcs["transaction_keys_exist"] = transaction_keys_exist_rpc
+
+    report = import_transactions(fake, io.BytesIO(to_csv(records)), "statement.csv")
+
+    print(f"rows {report['total_rows']}, inserted {report['inserted_rows']}, duplicates {report['duplicate_rows']}, "
+          f"rejected {report['rejected_rows']}")
+    print(f"balance gaps {report['balance_gaps']}: {report['balance_gap_samples'][:3]}")
+    print(f"dedup lookups {report['dedup_lookups']}, total round trips {fake.calls}, elapsed {report['elapsed_sec']}s")
+    print(f"timings {report['timings']}")
+    per_row = args.rows * args.latency_ms / 1000
+    print(f"per-row lookups would need {args.rows} round trips (~{per_row:.0f}s of latency alone)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+목록 응답 직렬화 벤치마크
+
+1,000행짜리 거래 내역 페이지를 응답으로 만드는 비용을 경로별로 비교합니다. (rows/sec)
+
+    validated+json      response_model 검증 -> jsonable_encoder -> 표준 json (FastAPI 기존 경로)
+    validated+dump_json response_model 검증 -> pydantic JSON 직렬화 (최신 FastAPI 기본 경로)
+    trusted+orjson      검증 없이 FastJSONResponse (trusted_response)
+    trusted+json        위와 같지만 orjson이 없을 때의 표준 json
+
+그 다음 같은 행을 돌려주는 두 라우트(response_model / trusted_response)와 실제 GET /transactions를
+ASGI로 호출해 프레임워크 오버헤드까지 포함한 요청당 시간을 잽니다.
+
+    python -m benchmarks.bench_serialization --rows 1000 --repeat 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from typing import Callable, List
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "benchmark-key")
+
+import httpx
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.api.transactions import TransactionResponse
+from app.core import responses
+from app.core.database import AsyncSupabase, get_supabase
+from app.core.responses import FastJSONResponse, trusted_response
+from benchmarks.bench_concurrency import seed_transactions
+from benchmarks.fakes import FakeSupabase
+
+
+def make_rows(count: int) -> List[dict]:
+    rows = seed_transactions(count)
+    fields = list(TransactionResponse.model_fields)
+    return [{field: row.get(field) for field in fields} for row in rows]
+
+
+def measure(func: Callable[[], object], repeat: int) -> List[float]:
+    func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def report(label: str, samples: List[float], rows: int) -> None:
+    median = statistics.median(samples)
+    print(f"{label:<24}{median * 1000:>10.2f}{rows / median:>14,.0f}")
+
+
+def serializer_paths(rows: List[dict]):
+    adapter = TypeAdapter(List[TransactionResponse])
+
+    def validated_json():
+        models = adapter.validate_python(rows)
+        return json.dumps(jsonable_encoder(models)).encode()
+
+    def validated_dump_json():
+        return adapter.dump_json(adapter.validate_python(rows))
+
+    def trusted_orjson():
+        return FastJSONResponse(rows).body
+
+    def trusted_json():
+        saved, responses.orjson = responses.orjson, None
+        try:
+            return FastJSONResponse(rows).body
+        finally:
+            responses.orjson = saved
+
+    return {
+        "validated+json": validated_json,
+        "validated+dump_json": validated_dump_json,
+        "trusted+orjson": trusted_orjson,
+        "trusted+json": trusted_json,
+    }
+
+
+def make_reference_app(rows: List[dict]) -> FastAPI:
+    reference = FastAPI()
+
+    @reference.get("/validated", response_model=List[TransactionResponse])
+    async def validated():
+        return rows
+
+    @reference.get("/trusted", response_model=List[TransactionResponse])
+    async def trusted():
+        return trusted_response(rows, TransactionResponse)
+
+    return reference
+
+
+async def measure_http(app, path: str, repeat: int) -> List[float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        (await client.get(path)).raise_for_status()
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def run_http(rows: List[dict], repeat: int) -> None:
+    from app.main import app
+
+    count = len(rows)
+    reference = make_reference_app(rows)
+    report("route response_model", await measure_http(reference, "/validated", repeat), count)
+    report("route trusted", await measure_http(reference, "/trusted", repeat), count)
+
+    # 실제 라우터 (FakeSupabase, 지연 없음)
+    db = AsyncSupabase(FakeSupabase(tables={"transactions": seed_transactions(count)}), max_workers=4)
+
+    async def override():
+        yield db
+
+    app.dependency_overrides[get_supabase] = override
+    try:
+        report("GET /transactions", await measure_http(app, f"/transactions/?limit={count}", repeat), count)
+    finally:
+        app.dependency_overrides.pop(get_supabase, None)
+        db.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    print(f"{'path':<24}{'ms/page':>10}{'rows/sec':>14}")
+    for label, func in serializer_paths(rows).items():
+        report(label, measure(func, args.repeat), len(rows))
+
+    print()
+    asyncio.run(run_http(rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+지원서 시트 매핑 마이크로 벤치마크
+
+합성 20k행 시트에 대해 기존 방식(get_all_records 형태의 dict를 셀마다 헤더 해석)과
+헤더를 한 번만 해석하는 열 단위 매핑(map_sheet_values)의 시간과 최대 메모리를 비교합니다.
+
+    python -m benchmarks.bench_sheet_mapping --rows 20000
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from app.services.sheet_mapping import COLUMN_MAPPING, map_sheet_values
+
+
+def make_values(rows: int):
+    headers = list(COLUMN_MAPPING.keys())
+    values = [headers]
+    for i in range(rows):
+        row = []
+        for header in headers:
+            key = COLUMN_MAPPING[header]
+            if key == "phone":
+                row.append(f"10-{random.randint(1000, 9999)}-{random.randint(1000, 9999)}")
+            elif key == "student_id":
+                row.append(str(12250000 + i))
+            else:
+                row.append(f"{key}-{i % 97}")
+        values.append(row)
+    return values
+
+
+def legacy_get_all_records(values):
+    # gspread의 get_all_records()처럼 행마다 헤더 dict를 만듭니다.
+    headers = values[0]
+    return [dict(zip(headers, row)) for row in values[1:]]
+
+
+def legacy_map(records):
+    # 기존 GoogleSheetsService의 셀 단위 매핑 루프
+    mapped_records = []
+    for record in records:
+        mapped_record = {}
+        for old_key, value in record.items():
+            if old_key.startswith("학번 8자리"):
+                new_key = "student_id"
+            elif old_key == "연락처(ex.010-1234-5678)":
+                new_key = "phone"
+                processed_phone = str(value).replace('-', '').replace(' ', '')
+                if len(processed_phone) == 10 and processed_phone.startswith('10'):
+                    value = '0' + processed_phone
+                else:
+                    value = processed_phone
+            else:
+                new_key = COLUMN_MAPPING.get(old_key, old_key)
+            mapped_record[new_key] = value
+        mapped_records.append(mapped_record)
+    return mapped_records
+
+
+def measure(name, func, values, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(values)
+        best = min(best, time.perf_counter() - start)
+        del result
+
+    tracemalloc.start()
+    result = func(values)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return name, best, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    values = make_values(args.rows)
+    results = [
+        measure("legacy", lambda v: legacy_map(legacy_get_all_records(v)), values, args.repeat),
+        measure("column plan", map_sheet_values, values, args.repeat),
+    ]
+    assert results[0][3] == results[1][3]
+
+    baseline = results[0][1]
+    print(f"{'engine':<14}{'best(ms)':>10}{'peak(MB)':>10}{'speedup':>9}")
+    for name, best, peak, _ in results:
+        print(f"{name:<14}{best * 1000:>10.1f}{peak / 1e6:>10.1f}{baseline / best:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
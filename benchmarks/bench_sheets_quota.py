@@ -0,0 +1,117 @@
+"""
+Google Sheets 할당량 벤치마크 (모집 기간 동시 새로고침)
+
+임원 여러 명이 같은 지원서 시트를 동시에 반복해서 새로고침하는 상황을 FakeGspreadClient로 재현합니다.
+대역은 Google처럼 quota_window 동안 quota회를 넘는 호출에 429를 돌려주고, 라운드마다 시트가
+수정되어(새 지원자) 캐시로는 막을 수 없습니다.
+
+    unscheduled  속도 제한/재시도/합치기 없음 (Google의 429가 그대로 요청 실패가 됨)
+    scheduled    토큰 버킷 + 지터 백오프 재시도 + 같은 시트 조회 합치기
+
+실제 1분을 --time-scale 배로 줄여 실행합니다. (할당량 창, 토큰 충전 속도, 백오프 모두 같은 비율)
+
+    python -m benchmarks.bench_sheets_quota --officers 8 --rounds 6 --time-scale 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from collections import Counter
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "benchmark-key")
+
+import httpx
+
+from app.core.config import settings
+from app.services.google_sheets import google_sheets_service
+from app.services.sheets_scheduler import SheetsScheduler, SingleFlight, TokenBucket
+from benchmarks.bench_suite import make_values
+from benchmarks.fakes import FakeGspreadClient
+
+SPREADSHEET_ID = "applicants"
+
+
+class NoCoalescing:
+    """SingleFlight 대신 매번 따로 조회합니다."""
+
+    async def do(self, key, factory):
+        return await factory()
+
+
+def configure(mode: str, args) -> FakeGspreadClient:
+    sheets = FakeGspreadClient(latency=args.latency_ms / 1000, quota=args.quota, quota_window=60 / args.time_scale)
+    sheets.add_spreadsheet(SPREADSHEET_ID, make_values(args.rows))
+    service = google_sheets_service
+    service._client = sheets
+    service._cache.clear()
+
+    if mode == "unscheduled":
+        service._scheduler = SheetsScheduler(
+            TokenBucket(rate_per_minute=10 ** 9, burst=10 ** 9), max_retries=0,
+            backoff_base=0, backoff_max=0, max_wait=0
+        )
+        service._sheet_flights = NoCoalescing()
+    else:
+        scale = args.time_scale
+        service._scheduler = SheetsScheduler(
+            TokenBucket(settings.GOOGLE_SHEETS_REQUESTS_PER_MINUTE * scale, settings.GOOGLE_SHEETS_BURST),
+            max_retries=settings.GOOGLE_SHEETS_MAX_RETRIES,
+            backoff_base=settings.GOOGLE_SHEETS_BACKOFF_BASE_SECONDS / scale,
+            backoff_max=settings.GOOGLE_SHEETS_BACKOFF_MAX_SECONDS / scale,
+            max_wait=settings.GOOGLE_SHEETS_QUOTA_WAIT_SECONDS / scale
+        )
+        service._sheet_flights = SingleFlight("sheet")
+    return sheets
+
+
+async def run_mode(mode: str, args) -> None:
+    from app.main import app
+
+    sheets = configure(mode, args)
+    statuses: Counter = Counter()
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    started = time.perf_counter()
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def refresh():
+            t = time.perf_counter()
+            response = await client.get(f"/google-sheets/spreadsheet/{SPREADSHEET_ID}")
+            latencies.append(time.perf_counter() - t)
+            statuses[response.status_code] += 1
+
+        for _ in range(args.rounds):
+            # 새 지원서가 들어와 시트가 바뀐 뒤 모두가 새로고침합니다.
+            sheets.touch(SPREADSHEET_ID)
+            await asyncio.gather(*(refresh() for _ in range(args.officers)))
+            await asyncio.sleep(args.interval / args.time_scale)
+    elapsed = time.perf_counter() - started
+
+    ok = statuses.get(200, 0)
+    total = sum(statuses.values())
+    print(
+        f"{mode:<14}{ok:>5}/{total:<5}{statuses.get(429, 0):>6}{statuses.get(500, 0):>6}"
+        f"{sheets.calls:>8}{sheets.rejected:>8}"
+        f"{statistics.median(latencies) * 1000:>10.0f}{max(latencies) * 1000:>10.0f}{elapsed:>9.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--officers", type=int, default=8, help="동시에 새로고침하는 사람 수")
+    parser.add_argument("--rounds", type=int, default=6)
+    parser.add_argument("--interval", type=float, default=10.0, help="라운드 간격 (실제 시간 기준 초)")
+    parser.add_argument("--rows", type=int, default=300)
+    parser.add_argument("--quota", type=int, default=60, help="분당 허용 호출 수")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--time-scale", type=float, default=20.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':<14}{'ok/total':>11}{'429':>6}{'500':>6}{'calls':>8}{'g429':>8}{'p50 ms':>10}{'max ms':>10}{'sec':>9}")
+    for mode in ("unscheduled", "scheduled"):
+        asyncio.run(run_mode(mode, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+서버 시작(import) 시간 측정
+
+새 인터프리터에서 `python -X importtime -c "import app.main"`을 여러 번 실행해
+import 소요 시간(중앙값)과 누적 시간이 큰 모듈 목록을 보여줍니다.
+pandas, gspread, supabase처럼 처음 사용할 때만 불러와야 하는 모듈이 시작 시점에
+올라오거나 시간이 --budget-ms를 넘으면 종료 코드 1을 반환하므로 CI에서 회귀 검사로 쓸 수 있습니다.
+
+    python -m benchmarks.bench_startup --runs 5 --top 15
+    python -m benchmarks.bench_startup --budget-ms 800 --output startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# 시작 시점에 import 되면 안 되는 (첫 사용 시 불러오는) 모듈
+LAZY_MODULES = ["pandas", "numpy", "gspread", "google.oauth2", "supabase", "slack_bolt"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+lazy = {lazy!r}
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in lazy if m in sys.modules]}}))
+"""
+
+# (모듈 이름, 자체 시간 µs, 누적 시간 µs)
+ImportRow = Tuple[str, int, int]
+
+
+def parse_importtime(stderr: str) -> List[ImportRow]:
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def run_once(module: str, lazy: List[str]) -> Tuple[Dict, List[ImportRow]]:
+    env = dict(os.environ)
+    # 설정 검증을 통과할 값만 채웁니다. (실제 연결은 하지 않습니다)
+    env.setdefault("SUPABASE_URL", "http://localhost:54321")
+    env.setdefault("SUPABASE_KEY", "startup-check")
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", PROBE.format(module=module, lazy=lazy)],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    if completed.returncode != 0:
+        sys.stderr.write(completed.stderr[-4000:])
+        raise SystemExit(f"import {module} failed")
+    return json.loads(completed.stdout.strip().splitlines()[-1]), parse_importtime(completed.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="누적 시간 기준 상위 모듈 수")
+    parser.add_argument("--budget-ms", type=float, default=None, help="import 시간(중앙값) 상한")
+    parser.add_argument("--lazy", nargs="*", default=LAZY_MODULES, help="시작 시점에 불러오면 안 되는 모듈")
+    parser.add_argument("--output", help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    timings = []
+    loaded: List[str] = []
+    rows: List[ImportRow] = []
+    for _ in range(args.runs):
+        probe, rows = run_once(args.module, args.lazy)
+        timings.append(probe["seconds"] * 1000)
+        loaded = probe["loaded"]
+
+    median_ms = statistics.median(timings)
+    print(f"import {args.module}: median {median_ms:.0f}ms, min {min(timings):.0f}ms, max {max(timings):.0f}ms ({args.runs} runs)")
+
+    # 마지막 실행 기준 누적 시간 상위 모듈
+    top = sorted(rows, key=lambda row: row[2], reverse=True)[:args.top]
+    print(f"\n{'module':<48}{'self ms':>10}{'cumulative ms':>15}")
+    for name, self_us, cumulative_us in top:
+        print(f"{name[:47]:<48}{self_us / 1000:>10.1f}{cumulative_us / 1000:>15.1f}")
+
+    failures = []
+    if loaded:
+        failures.append(f"loaded at startup: {', '.join(loaded)}")
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        failures.append(f"median {median_ms:.0f}ms exceeds budget {args.budget_ms:.0f}ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({
+                "module": args.module,
+                "python": sys.version.split()[0],
+                "timings_ms": [round(t, 1) for t in timings],
+                "median_ms": round(median_ms, 1),
+                "loaded_lazy_modules": loaded,
+                "top": [{"module": n, "self_ms": s / 1000, "cumulative_ms": c / 1000} for n, s, c in top],
+            }, f, indent=2)
+
+    if failures:
+        print("\nFAIL: " + "; ".join(failures))
+        raise SystemExit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
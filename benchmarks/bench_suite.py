@@ -0,0 +1,268 @@
+"""
+오프라인 부하 벤치마크
+
+app.main:app 을 로컬 대역(FakeSupabase, FakeGspreadClient)에 연결하고 주요 엔드포인트에
+동시 요청을 보내 시나리오별 처리량(req/s)과 p50/p95/p99 지연 시간을 측정합니다.
+결과는 JSON으로 저장되므로 변경 전후 실행을 --compare 로 비교할 수 있습니다.
+
+    python -m benchmarks.bench_suite --duration 10 --concurrency 32 --latency-ms 20
+    python -m benchmarks.bench_suite --scenarios transactions users_search --output after.json --compare before.json
+
+대역의 지연 시간은 호출 한 번의 네트워크 왕복을 흉내냅니다. 실제 Postgres 실행 계획은
+bench_pagination(로컬 Postgres)에서 따로 확인합니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "benchmark-key")
+# 대역에는 Google 할당량이 없으므로 처리량을 재기 위해 속도 제한을 풉니다. (bench_sheets_quota 참고)
+os.environ.setdefault("GOOGLE_SHEETS_REQUESTS_PER_MINUTE", "100000000")
+os.environ.setdefault("GOOGLE_SHEETS_BURST", "100000")
+
+import httpx
+
+from app.core.config import settings
+from app.core.database import AsyncSupabase, get_supabase
+from app.main import app
+from app.services.google_sheets import google_sheets_service
+from app.services.member_directory import member_directory
+from benchmarks.bench_concurrency import seed_transactions
+from benchmarks.bench_member_search import make_profiles
+from benchmarks.bench_sheet_mapping import make_values
+from benchmarks.fakes import FakeGspreadClient, FakeSupabase, transaction_stats_rpc, transaction_summary_rpc
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# 시나리오 이름 -> (random.Random, 설정) -> (경로, 쿼리 파라미터)
+Request = Tuple[str, Any]
+Scenario = Callable[[random.Random, argparse.Namespace], Request]
+
+
+def _transactions(rng: random.Random, args: argparse.Namespace) -> Request:
+    offset = rng.randrange(0, max(1, args.transactions - 50))
+    return "/transactions/", {"limit": 50, "offset": offset}
+
+
+def _transactions_keyset(rng: random.Random, args: argparse.Namespace) -> Request:
+    return "/transactions/", {"limit": 50, "pagination": "keyset"}
+
+
+def _transactions_search(rng: random.Random, args: argparse.Namespace) -> Request:
+    return "/transactions/", {"limit": 50, "search": f"거래 {rng.randrange(100)}"}
+
+
+def _transactions_stats(rng: random.Random, args: argparse.Namespace) -> Request:
+    return "/transactions/stats", None
+
+
+def _transactions_summary(rng: random.Random, args: argparse.Namespace) -> Request:
+    # 대시보드 차트: 5년치 월별 / 최근 1년 주별
+    bucket = rng.choice(("month", "week"))
+    start = "2021-01-01" if bucket == "month" else "2025-01-01"
+    return "/transactions/summary", {"bucket": bucket, "start_date": start}
+
+
+def _users_search(rng: random.Random, args: argparse.Namespace) -> Request:
+    name = rng.choice(args.profile_names)
+    return "/users/", {"name": name[:rng.choice((1, 2, 3))], "limit": 20}
+
+
+def _sheets_multi(rng: random.Random, args: argparse.Namespace) -> Request:
+    return "/google-sheets/spreadsheets", {"spreadsheet_ids": args.spreadsheet_ids}
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "transactions": _transactions,
+    "transactions_keyset": _transactions_keyset,
+    "transactions_search": _transactions_search,
+    "transactions_stats": _transactions_stats,
+    "transactions_summary": _transactions_summary,
+    "users_search": _users_search,
+    "sheets_multi": _sheets_multi,
+}
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def setup(args: argparse.Namespace) -> AsyncSupabase:
+    """대역을 만들고 앱의 Supabase 의존성과 Google Sheets 클라이언트를 바꿔 끼웁니다."""
+    profiles = make_profiles(args.profiles)
+    fake = FakeSupabase(
+        latency=args.latency_ms / 1000,
+        tables={"transactions": seed_transactions(args.transactions), "profiles": profiles},
+    )
+    fake.rpcs["transaction_stats"] = transaction_stats_rpc
+    fake.rpcs["transaction_summary"] = transaction_summary_rpc
+    db = AsyncSupabase(fake, max_workers=settings.SUPABASE_POOL_SIZE)
+
+    async def override():
+        yield db
+
+    app.dependency_overrides[get_supabase] = override
+
+    sheets = FakeGspreadClient(latency=args.sheets_latency_ms / 1000)
+    values = make_values(args.sheet_rows)
+    args.spreadsheet_ids = [f"bench-sheet-{i}" for i in range(args.spreadsheets)]
+    for spreadsheet_id in args.spreadsheet_ids:
+        sheets.add_spreadsheet(spreadsheet_id, values)
+    google_sheets_service._client = sheets
+
+    args.profile_names = [p["name"] for p in profiles[:1000]]
+    if not args.no_directory:
+        # 서버 시작 시 lifespan에서 하는 색인 생성을 미리 해 둡니다.
+        await member_directory.rebuild(db)
+    return db
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    args: argparse.Namespace,
+) -> Dict[str, Any]:
+    scenario = SCENARIOS[name]
+    latencies: List[float] = []
+    errors = 0
+    stop_at = 0.0
+
+    async def worker(seed: int, record: bool):
+        nonlocal errors
+        rng = random.Random(seed)
+        while time.perf_counter() < stop_at:
+            path, params = scenario(rng, args)
+            started = time.perf_counter()
+            try:
+                response = await client.get(path, params=params)
+                ok = response.status_code < 400
+            except Exception:
+                ok = False
+            if record:
+                latencies.append(time.perf_counter() - started)
+                errors += 0 if ok else 1
+
+    # 워밍업 (캐시, 색인, 스레드 풀)
+    stop_at = time.perf_counter() + args.warmup
+    await asyncio.gather(*(worker(i, False) for i in range(args.concurrency)))
+
+    started = time.perf_counter()
+    stop_at = started + args.duration
+    await asyncio.gather(*(worker(1000 + i, True) for i in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ms = [latency * 1000 for latency in latencies]
+    return {
+        "requests": len(ms),
+        "errors": errors,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(ms) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(ms), 2) if ms else 0.0,
+        "p50_ms": round(percentile(ms, 50), 2),
+        "p95_ms": round(percentile(ms, 95), 2),
+        "p99_ms": round(percentile(ms, 99), 2),
+        "max_ms": round(max(ms), 2) if ms else 0.0,
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    db = await setup(args)
+    transport = httpx.ASGITransport(app=app)
+    results: Dict[str, Any] = {}
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            for name in args.scenarios:
+                results[name] = await run_scenario(client, name, args)
+                print_row(name, results[name])
+    finally:
+        app.dependency_overrides.pop(get_supabase, None)
+        db.shutdown()
+    return results
+
+
+def print_header() -> None:
+    print(f"{'scenario':<22}{'req':>8}{'err':>6}{'req/s':>10}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)")
+
+
+def print_row(name: str, result: Dict[str, Any]) -> None:
+    print(
+        f"{name:<22}{result['requests']:>8}{result['errors']:>6}{result['throughput_rps']:>10.1f}"
+        f"{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}{result['p99_ms']:>9.2f}"
+    )
+
+
+def compare(current: Dict[str, Any], baseline_path: str) -> None:
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["scenarios"]
+
+    def change(new: float, old: float) -> str:
+        return f"{(new - old) / old * 100:+.1f}%" if old else "-"
+
+    print(f"\nvs {baseline_path}")
+    print(f"{'scenario':<22}{'req/s':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for name, result in current.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        print(
+            f"{name:<22}{change(result['throughput_rps'], old['throughput_rps']):>10}"
+            f"{change(result['p50_ms'], old['p50_ms']):>10}{change(result['p95_ms'], old['p95_ms']):>10}"
+            f"{change(result['p99_ms'], old['p99_ms']):>10}"
+        )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--duration", type=float, default=10.0, help="시나리오별 측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=1.0, help="시나리오별 워밍업 시간 (초)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Supabase 호출당 지연")
+    parser.add_argument("--sheets-latency-ms", type=float, default=150.0, help="Sheets/Drive 호출당 지연")
+    parser.add_argument("--transactions", type=int, default=5000)
+    parser.add_argument("--profiles", type=int, default=5000)
+    parser.add_argument("--spreadsheets", type=int, default=4)
+    parser.add_argument("--sheet-rows", type=int, default=500)
+    parser.add_argument("--no-directory", action="store_true", help="회원 검색 색인 없이 DB 조회 경로를 측정")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/bench_suite-<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    print_header()
+    scenarios = asyncio.run(run(args))
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"bench_suite-{datetime.now():%Y%m%d-%H%M%S}.json")
+    config = {k: v for k, v in vars(args).items() if k not in ("profile_names", "spreadsheet_ids", "output", "compare")}
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": config,
+            "scenarios": scenarios,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\nsaved {output}")
+
+    if args.compare:
+        compare(scenarios, args.compare)
+
+
+if __name__ == "__main__":
+    main()
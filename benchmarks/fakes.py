@@ -0,0 +1,562 @@
+"""
+벤치마크용 로컬 대역(fake)
+
+실제 Supabase 대신 메모리에 데이터를 두고, 설정한 지연 시간만큼 sleep 한 뒤
+PostgREST와 비슷한 결과를 돌려주는 최소한의 구현입니다.
+"""
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+
+def _split_terms(expression: str) -> List[str]:
+    """괄호와 큰따옴표를 고려해 최상위 쉼표로 나눕니다."""
+    terms, depth, quoted, current = [], 0, False, []
+    i = 0
+    while i < len(expression):
+        ch = expression[i]
+        if ch == "\\" and quoted:
+            current.append(expression[i:i + 2])
+            i += 2
+            continue
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and ch == ",":
+            terms.append("".join(current))
+            current = []
+            i += 1
+            continue
+        current.append(ch)
+        i += 1
+    terms.append("".join(current))
+    return terms
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    return value
+
+
+_OPERATORS = {
+    "eq": lambda a, b: str(a) == b,
+    "neq": lambda a, b: str(a) != b,
+    "lt": lambda a, b: a is not None and str(a) < b,
+    "lte": lambda a, b: a is not None and str(a) <= b,
+    "gt": lambda a, b: a is not None and str(a) > b,
+    "gte": lambda a, b: a is not None and str(a) >= b,
+    "ilike": lambda a, b: b.strip("%*").lower() in str(a or "").lower(),
+}
+
+
+def _parse_logic(operator: str, expression: str) -> Callable[[Dict[str, Any]], bool]:
+    """PostgREST의 or=(...)/and(...) 식을 행 조건 함수로 바꿉니다."""
+    predicates = []
+    for term in _split_terms(expression):
+        if term.startswith(("and(", "or(")):
+            nested, _, rest = term.partition("(")
+            predicates.append(_parse_logic(nested, rest[:-1]))
+            continue
+        column, op, value = term.split(".", 2)
+        compare, expected = _OPERATORS[op], _unquote(value)
+        predicates.append(lambda r, c=column, f=compare, v=expected: f(r.get(c), v))
+    combine = any if operator == "or" else all
+    return lambda r: combine(p(r) for p in predicates)
+
+
+def _split_columns(columns: str) -> List[str]:
+    # "*,event_participants(profile_id)" -> ["*", "event_participants(profile_id)"]
+    parts, depth, current = [], 0, ""
+    for ch in columns:
+        if ch == "," and depth == 0:
+            parts.append(current.strip())
+            current = ""
+            continue
+        depth += (ch == "(") - (ch == ")")
+        current += ch
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+class FakeQuery:
+    """postgrest 쿼리 빌더에서 앱이 사용하는 메서드만 흉내냅니다."""
+
+    def __init__(self, db: "FakeSupabase", table: str):
+        self.db = db
+        self.table = table
+        self.path = f"/{table}"
+        self.filters: List[Callable[[Dict[str, Any]], bool]] = []
+        self.orders: List[tuple] = []
+        self.start = 0
+        self.end: Optional[int] = None
+        self.columns: Optional[List[str]] = None
+        self.count: Optional[str] = None
+        self.action = "select"
+        self.payload: Any = None
+        self.on_conflict: Optional[str] = None
+        self.ignore_duplicates = False
+        self.is_single = False
+        self._negate = False
+
+    # 조회 / 변경 ------------------------------------------------------------
+    def select(self, columns: str = "*", count: Optional[str] = None):
+        if columns not in ("*", "count"):
+            self.columns = _split_columns(columns)
+        self.count = count
+        return self
+
+    def insert(self, rows):
+        self.action, self.payload = "insert", rows
+        return self
+
+    def upsert(self, rows, on_conflict: str = "id", ignore_duplicates: bool = False, **kwargs):
+        self.action, self.payload, self.on_conflict = "upsert", rows, on_conflict
+        self.ignore_duplicates = ignore_duplicates
+        return self
+
+    def update(self, data):
+        self.action, self.payload = "update", data
+        return self
+
+    def delete(self):
+        self.action = "delete"
+        return self
+
+    # 필터 ------------------------------------------------------------------
+    def _add(self, predicate):
+        if self._negate:
+            self._negate = False
+            self.filters.append(lambda r: not predicate(r))
+        else:
+            self.filters.append(predicate)
+        return self
+
+    @property
+    def not_(self):
+        self._negate = True
+        return self
+
+    def is_(self, column, value):
+        return self._add(lambda r: r.get(column) is None if value in (None, "null") else r.get(column) == value)
+
+    def eq(self, column, value):
+        return self._add(lambda r: str(r.get(column)) == str(value))
+
+    def neq(self, column, value):
+        return self._add(lambda r: str(r.get(column)) != str(value))
+
+    def gt(self, column, value):
+        return self._add(lambda r: r.get(column) is not None and r.get(column) > value)
+
+    def gte(self, column, value):
+        return self._add(lambda r: r.get(column) is not None and r.get(column) >= value)
+
+    def lt(self, column, value):
+        return self._add(lambda r: r.get(column) is not None and r.get(column) < value)
+
+    def lte(self, column, value):
+        return self._add(lambda r: r.get(column) is not None and r.get(column) <= value)
+
+    def in_(self, column, values):
+        allowed = {str(v) for v in values}
+        return self._add(lambda r: str(r.get(column)) in allowed)
+
+    def ilike(self, column, pattern):
+        needle = pattern.strip("%").lower()
+        return self._add(lambda r: needle in str(r.get(column) or "").lower())
+
+    def or_(self, expression):
+        return self._add(_parse_logic("or", expression))
+
+    # 정렬 / 페이지 ------------------------------------------------------------
+    def order(self, column, desc=False):
+        self.orders.append((column, desc))
+        return self
+
+    def range(self, start, end):
+        self.start, self.end = start, end
+        return self
+
+    def limit(self, count):
+        self.end = self.start + count - 1
+        return self
+
+    def single(self):
+        self.is_single = True
+        return self
+
+    # 실행 ------------------------------------------------------------------
+    def _matches(self, row):
+        return all(f(row) for f in self.filters)
+
+    def _project(self, row):
+        out = dict(row) if "*" in self.columns else {}
+        for column in self.columns:
+            if column == "*":
+                continue
+            if "(" not in column:
+                out[column] = row.get(column)
+                continue
+            # 임베드: 자식 테이블의 <부모 단수형>_id 외래 키로 연결 (events -> event_participants.event_id)
+            relation, _, inner = column.partition("(")
+            fields = _split_columns(inner[:-1])
+            foreign_key = f"{self.table.rstrip('s')}_id"
+            children = [c for c in self.db.tables.get(relation, []) if str(c.get(foreign_key)) == str(row.get("id"))]
+            out[relation] = [c if "*" in fields else {f: c.get(f) for f in fields} for c in children]
+        return out
+
+    def execute(self):
+        self.db.calls += 1
+        if self.db.latency:
+            time.sleep(self.db.latency)
+
+        rows = self.db.tables.setdefault(self.table, [])
+
+        if self.action == "insert":
+            new_rows = self.payload if isinstance(self.payload, list) else [self.payload]
+            rows.extend(dict(r) for r in new_rows)
+            return SimpleNamespace(data=new_rows, count=None)
+
+        if self.action == "upsert":
+            new_rows = self.payload if isinstance(self.payload, list) else [self.payload]
+            keys = self.on_conflict.split(",")
+            index = {tuple(str(r.get(k)) for k in keys): r for r in rows}
+            written = []
+            for r in new_rows:
+                key = tuple(str(r.get(k)) for k in keys)
+                existing = index.get(key)
+                if existing is None:
+                    rows.append(dict(r))
+                    index[key] = rows[-1]
+                    written.append(r)
+                elif not self.ignore_duplicates:
+                    existing.update(r)
+                    written.append(r)
+            return SimpleNamespace(data=written, count=None)
+
+        matched = [r for r in rows if self._matches(r)]
+
+        if self.action == "update":
+            for r in matched:
+                r.update(self.payload)
+            return SimpleNamespace(data=matched, count=None)
+
+        if self.action == "delete":
+            self.db.tables[self.table] = [r for r in rows if not self._matches(r)]
+            return SimpleNamespace(data=matched, count=None)
+
+        for column, desc in reversed(self.orders):
+            matched.sort(key=lambda r: (r.get(column) is None, r.get(column)), reverse=desc)
+        count = len(matched) if self.count else None
+        end = len(matched) if self.end is None else self.end + 1
+        page = matched[self.start:end]
+        if self.columns:
+            page = [self._project(r) for r in page]
+        if self.is_single:
+            return SimpleNamespace(data=page[0] if page else None, count=count)
+        return SimpleNamespace(data=page, count=count)
+
+
+class FakeRpc:
+    def __init__(self, db: "FakeSupabase", func: Callable[..., Any], params: dict):
+        self.db = db
+        self.func = func
+        self.params = params
+        self.path = "/rpc"
+
+    def execute(self):
+        self.db.calls += 1
+        if self.db.latency:
+            time.sleep(self.db.latency)
+        return SimpleNamespace(data=self.func(self.db, **self.params), count=None)
+
+
+class FakeAuthAdmin:
+    """auth.admin 대역 (계정 생성/삭제, 이메일 중복 시 오류)"""
+
+    def __init__(self, auth: "FakeAuth"):
+        self.auth = auth
+
+    def create_user(self, attributes: dict):
+        self.auth._call()
+        return SimpleNamespace(user=self.auth._register(attributes["email"]))
+
+    def delete_user(self, user_id: str):
+        self.auth._call()
+        self.auth.accounts = {email: u for email, u in self.auth.accounts.items() if u.id != user_id}
+
+
+class FakeAuth:
+    def __init__(self, db: "FakeSupabase"):
+        self.db = db
+        self.users: Dict[str, Any] = {}
+        # 이메일 -> 계정
+        self.accounts: Dict[str, Any] = {}
+        self.admin = FakeAuthAdmin(self)
+        self._lock = threading.Lock()
+
+    def _call(self):
+        self.db.calls += 1
+        if self.db.latency:
+            time.sleep(self.db.latency)
+
+    def _register(self, email: str):
+        import uuid
+
+        with self._lock:
+            if email in self.accounts:
+                raise Exception("User already registered")
+            user = SimpleNamespace(id=str(uuid.uuid4()), email=email)
+            self.accounts[email] = user
+            return user
+
+    def get_user(self, token=None):
+        self._call()
+        return SimpleNamespace(user=self.users.get(token))
+
+    def sign_up(self, credentials: dict):
+        self._call()
+        return SimpleNamespace(user=self._register(credentials["email"]))
+
+    def sign_in_with_password(self, credentials: dict):
+        self._call()
+        user = self.accounts.get(credentials["email"])
+        session = SimpleNamespace(access_token=f"token-{user.id}") if user else None
+        return SimpleNamespace(user=user, session=session)
+
+
+class FakeSupabase:
+    """
+    supabase.Client 대역입니다.
+
+    latency: execute() 한 번마다 추가할 왕복 지연(초)
+    """
+
+    def __init__(self, latency: float = 0.0, tables: Optional[Dict[str, List[dict]]] = None):
+        self.latency = latency
+        self.tables: Dict[str, List[dict]] = tables or {}
+        self.rpcs: Dict[str, Callable[..., Any]] = {}
+        self.auth = FakeAuth(self)
+        self.calls = 0
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: Optional[dict] = None) -> FakeRpc:
+        return FakeRpc(self, self.rpcs[name], params or {})
+
+
+def transaction_keys_exist_rpc(db: "FakeSupabase", keys: List[str]) -> List[dict]:
+    """transaction_keys_exist RPC (natural_key 고유 인덱스 조회)"""
+    index = {r.get("natural_key") for r in db.tables.get("transactions", [])}
+    return [{"natural_key": key} for key in keys if key in index]
+
+
+def transaction_stats_rpc(db: "FakeSupabase", term_start: str) -> List[dict]:
+    """transaction_stats RPC를 메모리의 transactions 행으로 계산합니다."""
+    rows = db.tables.get("transactions", [])
+    term = [r for r in rows if str(r["transaction_date"]) >= term_start]
+    latest = max(rows, key=lambda r: (r["transaction_date"], r.get("created_at") or ""), default=None)
+    return [{
+        "total_transactions": len(rows),
+        "this_term_income": sum(r["amount"] for r in term if r["amount"] > 0),
+        "this_term_expense": sum(-r["amount"] for r in term if r["amount"] < 0),
+        "latest_transaction_date": max((r["transaction_date"] for r in term), default=None),
+        "total_balance": latest["balance"] if latest else 0,
+    }]
+
+
+def transaction_summary_rpc(db: "FakeSupabase", bucket: str, start_date: str, end_date: str) -> List[dict]:
+    """transaction_summary RPC (버킷별 수입/지출/거래 수/기말 잔액)"""
+    from datetime import date
+    from app.services.transaction_stats import bucket_start
+
+    last = date.fromisoformat(end_date)
+    groups: Dict[Any, List[dict]] = {}
+    for r in db.tables.get("transactions", []):
+        day = date.fromisoformat(str(r["transaction_date"])[:10])
+        if start_date <= day.isoformat() and day <= last:
+            groups.setdefault(bucket_start(bucket, day), []).append(r)
+    result = []
+    for start in sorted(groups):
+        rows = groups[start]
+        latest = max(rows, key=lambda r: (str(r["transaction_date"]), r.get("created_at") or ""))
+        result.append({
+            "bucket_start": start.isoformat(),
+            "income": sum(r["amount"] for r in rows if r["amount"] > 0),
+            "expense": sum(-r["amount"] for r in rows if r["amount"] < 0),
+            "transaction_count": len(rows),
+            "closing_balance": latest["balance"],
+        })
+    return result
+
+
+# Google Sheets -----------------------------------------------------------------
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for ch in letters:
+        index = index * 26 + ord(ch) - ord("A") + 1
+    return index - 1
+
+
+def _read_range(values: List[List[str]], a1: str) -> List[List[str]]:
+    """
+    "1:1", "2:1001", "B2:D", "A5:C9" 형태의 A1 범위를 잘라냅니다.
+    Sheets API처럼 끝쪽 빈 행은 돌려주지 않습니다.
+    """
+    start, _, end = a1.partition(":")
+    start_col = "".join(ch for ch in start if ch.isalpha())
+    end_col = "".join(ch for ch in end if ch.isalpha())
+    start_row = int("".join(ch for ch in start if ch.isdigit()) or 1)
+    end_row_digits = "".join(ch for ch in end if ch.isdigit())
+    end_row = int(end_row_digits) if end_row_digits else len(values)
+    first = _column_index(start_col) if start_col else 0
+    last = _column_index(end_col) + 1 if end_col else None
+    rows = [row[first:last] for row in values[start_row - 1:end_row]]
+    while rows and not any(rows[-1]):
+        rows.pop()
+    return rows
+
+
+class FakeWorksheet:
+    def __init__(self, sheets: "FakeGspreadClient", title: str, values: List[List[str]]):
+        self._sheets = sheets
+        self.title = title
+        self.values = values
+
+    def get_all_values(self):
+        self._sheets._call()
+        return [list(row) for row in self.values]
+
+    def row_values(self, row: int):
+        self._sheets._call()
+        return list(self.values[row - 1]) if row <= len(self.values) else []
+
+    def get(self, a1: str):
+        self._sheets._call()
+        return _read_range(self.values, a1)
+
+
+class FakeSpreadsheet:
+    def __init__(self, sheets: "FakeGspreadClient", spreadsheet_id: str, title: str, worksheets: List[FakeWorksheet]):
+        self._sheets = sheets
+        self.id = spreadsheet_id
+        self.title = title
+        self._worksheets = worksheets
+
+    @property
+    def sheet1(self):
+        self._sheets._call()
+        return self._worksheets[0]
+
+    def worksheets(self):
+        self._sheets._call()
+        return list(self._worksheets)
+
+
+class FakeSheetsHTTPClient:
+    """values.get / values.batchGet 저수준 호출 대역"""
+
+    def __init__(self, sheets: "FakeGspreadClient"):
+        self._sheets = sheets
+
+    def _worksheet_values(self, spreadsheet_id: str, a1: str):
+        spreadsheet = self._sheets.spreadsheets[spreadsheet_id]
+        if "!" in a1:
+            title, a1 = a1.rsplit("!", 1)
+            title = title.strip("'").replace("''", "'")
+            worksheet = next(w for w in spreadsheet._worksheets if w.title == title)
+        else:
+            worksheet = spreadsheet._worksheets[0]
+        return worksheet.values, a1
+
+    def values_get(self, id: str, range: str, params=None):
+        self._sheets._call()
+        values, a1 = self._worksheet_values(id, range)
+        return {"range": range, "values": _read_range(values, a1)}
+
+    def values_batch_get(self, id: str, ranges: List[str], params=None):
+        self._sheets._call()
+        value_ranges = []
+        for a1_range in ranges:
+            values, a1 = self._worksheet_values(id, a1_range)
+            value_ranges.append({"range": a1_range, "values": _read_range(values, a1)})
+        return {"valueRanges": value_ranges}
+
+
+class FakeAPIError(Exception):
+    """gspread.exceptions.APIError 대역 (code, response.status_code, response.headers)"""
+
+    def __init__(self, code: int, retry_after: Optional[float] = None):
+        super().__init__(f"APIError: [{code}]")
+        self.code = code
+        headers = {"Retry-After": str(retry_after)} if retry_after is not None else {}
+        self.response = SimpleNamespace(status_code=code, headers=headers)
+
+
+class FakeGspreadClient:
+    """
+    gspread.Client 대역입니다. 앱이 사용하는 호출마다 latency만큼 sleep 합니다.
+
+    spreadsheets: 스프레드시트 ID -> FakeSpreadsheet
+    quota: quota_window초 동안 허용할 호출 수. 넘으면 Google처럼 429(FakeAPIError)를 올립니다.
+    """
+
+    def __init__(self, latency: float = 0.0, quota: Optional[int] = None, quota_window: float = 60.0):
+        self.latency = latency
+        self.spreadsheets: Dict[str, FakeSpreadsheet] = {}
+        self.modified_times: Dict[str, str] = {}
+        self.http_client = FakeSheetsHTTPClient(self)
+        self.calls = 0
+        self.quota = quota
+        self.quota_window = quota_window
+        self.rejected = 0
+        self._recent: List[float] = []
+        self._lock = threading.Lock()
+
+    def _call(self):
+        with self._lock:
+            self.calls += 1
+            if self.quota is not None:
+                now = time.monotonic()
+                self._recent = [t for t in self._recent if now - t < self.quota_window]
+                if len(self._recent) >= self.quota:
+                    self.rejected += 1
+                    raise FakeAPIError(429)
+                self._recent.append(now)
+        if self.latency:
+            time.sleep(self.latency)
+
+    def add_spreadsheet(self, spreadsheet_id: str, values: List[List[str]], title: Optional[str] = None) -> FakeSpreadsheet:
+        spreadsheet = FakeSpreadsheet(self, spreadsheet_id, title or spreadsheet_id, [])
+        spreadsheet._worksheets.append(FakeWorksheet(self, "Sheet1", values))
+        self.spreadsheets[spreadsheet_id] = spreadsheet
+        self.modified_times[spreadsheet_id] = "2025-08-01T00:00:00.000Z"
+        return spreadsheet
+
+    def touch(self, spreadsheet_id: str) -> None:
+        """시트가 수정된 것처럼 modifiedTime을 바꿉니다."""
+        self.modified_times[spreadsheet_id] = f"2025-08-01T00:00:{time.time():.6f}Z"
+
+    def open_by_key(self, key: str):
+        self._call()
+        return self.spreadsheets[key]
+
+    def open(self, title: str):
+        self._call()
+        return next(s for s in self.spreadsheets.values() if s.title == title)
+
+    def get_file_drive_metadata(self, id: str):
+        self._call()
+        return {"id": id, "modifiedTime": self.modified_times[id]}
+
+    def list_spreadsheet_files(self):
+        self._call()
+        return [{"id": s.id, "name": s.title} for s in self.spreadsheets.values()]
@@ -0,0 +1,31 @@
+-- /transactions/stats 집계를 DB에서 계산하기 위한 RPC
+-- 전체 테이블을 내려받지 않고 집계 결과 한 행만 반환합니다.
+
+create index if not exists transactions_date_created_idx
+    on public.transactions (transaction_date desc, created_at desc);
+
+create or replace function public.transaction_stats(term_start date)
+returns table (
+    total_transactions bigint,
+    this_term_income bigint,
+    this_term_expense bigint,
+    latest_transaction_date timestamptz,
+    total_balance bigint
+)
+language sql
+stable
+as $$
+    select
+        (select count(*) from public.transactions),
+        coalesce(sum(t.amount) filter (where t.amount > 0), 0)::bigint,
+        coalesce(sum(-t.amount) filter (where t.amount < 0), 0)::bigint,
+        max(t.transaction_date),
+        (
+            select balance
+            from public.transactions
+            order by transaction_date desc, created_at desc
+            limit 1
+        )::bigint
+    from public.transactions t
+    where t.transaction_date >= term_start;
+$$;
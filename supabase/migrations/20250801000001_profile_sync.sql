@@ -0,0 +1,12 @@
+-- 지원서 시트 -> profiles 증분 동기화를 위한 컬럼과 인덱스
+-- 지원자 프로필은 auth 계정이 생기기 전에 먼저 만들어질 수 있으므로 id 기본값을 둡니다.
+
+alter table public.profiles
+    alter column id set default gen_random_uuid();
+
+alter table public.profiles
+    add column if not exists sync_fingerprint text;
+
+-- upsert(on_conflict=student_id)의 충돌 대상
+create unique index if not exists profiles_student_id_key
+    on public.profiles (student_id);
@@ -0,0 +1,17 @@
+-- GET /transactions 의 keyset 페이지네이션과 검색을 위한 인덱스
+
+-- (transaction_date, id) 내림차순 keyset 조회
+create index if not exists transactions_date_id_idx
+    on public.transactions (transaction_date desc, id desc);
+
+-- '%검색어%' 형태의 ilike는 B-tree로 처리할 수 없으므로 trigram GIN 인덱스를 사용합니다.
+create extension if not exists pg_trgm;
+
+create index if not exists transactions_description_trgm_idx
+    on public.transactions using gin (description gin_trgm_ops);
+
+create index if not exists transactions_memo_trgm_idx
+    on public.transactions using gin (memo gin_trgm_ops);
+
+create index if not exists transactions_type_trgm_idx
+    on public.transactions using gin (transaction_type gin_trgm_ops);
@@ -0,0 +1,18 @@
+-- Slack 반응 기반 행사 참가 정보
+
+create table if not exists public.event_participants (
+    event_id uuid not null references public.events (id) on delete cascade,
+    profile_id uuid not null references public.profiles (id) on delete cascade,
+    created_at timestamptz not null default now(),
+    primary key (event_id, profile_id)
+);
+
+create index if not exists event_participants_profile_idx
+    on public.event_participants (profile_id);
+
+-- item.ts -> 행사, user -> 회원 조회용 인덱스
+create index if not exists events_slack_message_ts_idx
+    on public.events (slack_message_ts);
+
+create index if not exists profiles_slack_user_id_idx
+    on public.profiles (slack_user_id);
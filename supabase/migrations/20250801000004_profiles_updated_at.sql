@@ -0,0 +1,23 @@
+-- 회원 검색 색인의 증분 갱신(updated_at 워터마크)을 위한 컬럼, 트리거, 인덱스
+
+alter table public.profiles
+    add column if not exists updated_at timestamptz not null default now();
+
+create or replace function public.set_updated_at()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.updated_at := now();
+    return new;
+end;
+$$;
+
+-- 시트 동기화 upsert 등 updated_at을 직접 넣지 않는 변경도 워터마크에 잡히도록 합니다.
+drop trigger if exists profiles_set_updated_at on public.profiles;
+create trigger profiles_set_updated_at
+    before update on public.profiles
+    for each row execute function public.set_updated_at();
+
+create index if not exists profiles_updated_at_idx
+    on public.profiles (updated_at, id);
@@ -0,0 +1,446 @@
+-- 분석 대시보드용 사전 집계(rollup) 테이블
+-- 참가 정보(event_participants)와 행사(events)가 바뀔 때 트리거가 집계 값을 증감하므로
+-- 대시보드는 원본 행을 훑지 않고 집계 행만 읽습니다.
+-- 집계가 어긋났거나 과거 데이터를 채울 때는 rebuild_analytics()로 전체를 다시 계산합니다.
+
+alter table public.events
+    add column if not exists category text;
+
+-- 행사별 참가자 수 (카테고리/월은 행사 삭제·변경 시 되돌리기 위해 함께 저장)
+create table if not exists public.analytics_event_stats (
+    event_id uuid primary key,
+    category text not null,
+    event_month date not null,
+    event_date timestamptz,
+    participant_count integer not null default 0,
+    updated_at timestamptz not null default now()
+);
+
+create index if not exists analytics_event_stats_event_date_idx
+    on public.analytics_event_stats (event_date);
+
+-- 카테고리별 행사 수와 참가 수
+create table if not exists public.analytics_category_stats (
+    category text primary key,
+    event_count integer not null default 0,
+    participant_count integer not null default 0,
+    updated_at timestamptz not null default now()
+);
+
+-- 월별 행사 수, 참가 수, 한 번 이상 참가한 회원 수
+create table if not exists public.analytics_monthly_stats (
+    month date primary key,
+    event_count integer not null default 0,
+    participant_count integer not null default 0,
+    active_members integer not null default 0,
+    updated_at timestamptz not null default now()
+);
+
+-- 회원별 월 참가 수 (월별 active_members를 증분으로 유지하기 위한 보조 테이블)
+create table if not exists public.analytics_member_monthly (
+    month date not null,
+    profile_id uuid not null,
+    participation_count integer not null default 0,
+    primary key (month, profile_id)
+);
+
+-- 회원별 누적 참가 수 (활동 순위)
+create table if not exists public.analytics_member_stats (
+    profile_id uuid primary key,
+    participation_count integer not null default 0,
+    last_participated_at timestamptz,
+    updated_at timestamptz not null default now()
+);
+
+create index if not exists analytics_member_stats_rank_idx
+    on public.analytics_member_stats (participation_count desc, last_participated_at desc);
+
+-- 전체 KPI (항상 id = 1 한 행)
+create table if not exists public.analytics_totals (
+    id smallint primary key default 1 check (id = 1),
+    total_events integer not null default 0,
+    total_participations bigint not null default 0,
+    total_members integer not null default 0,
+    active_members integer not null default 0,
+    updated_at timestamptz not null default now()
+);
+
+insert into public.analytics_totals (id) values (1) on conflict (id) do nothing;
+
+create or replace function public.analytics_event_month(event_date timestamptz, created_at timestamptz)
+returns date
+language sql
+stable
+as $$
+    select date_trunc('month', coalesce(event_date, created_at, now()))::date;
+$$;
+
+-- 참가 행 묶음(delta = +1 추가, -1 삭제)을 모든 집계에 반영합니다.
+-- 행 단위가 아니라 트리거 문장 단위로 한 번 호출되므로 배치 upsert도 집계 행을 한 번씩만 갱신합니다.
+create or replace function public.analytics_apply_participation(
+    delta integer,
+    event_ids uuid[],
+    profile_ids uuid[],
+    created_ats timestamptz[]
+)
+returns void
+language plpgsql
+as $$
+declare
+    active_delta integer;
+begin
+    create temporary table if not exists pg_temp.analytics_changes (
+        event_id uuid,
+        profile_id uuid,
+        created_at timestamptz,
+        category text,
+        event_month date
+    ) on commit drop;
+    truncate pg_temp.analytics_changes;
+
+    insert into pg_temp.analytics_changes
+    select c.event_id, c.profile_id, c.created_at, s.category, s.event_month
+    from unnest(event_ids, profile_ids, created_ats) as c (event_id, profile_id, created_at)
+    join public.analytics_event_stats s on s.event_id = c.event_id;
+
+    update public.analytics_event_stats s
+    set participant_count = s.participant_count + delta * d.n, updated_at = now()
+    from (select event_id, count(*)::integer as n from pg_temp.analytics_changes group by event_id) d
+    where s.event_id = d.event_id;
+
+    update public.analytics_category_stats s
+    set participant_count = s.participant_count + delta * d.n, updated_at = now()
+    from (select category, count(*)::integer as n from pg_temp.analytics_changes group by category) d
+    where s.category = d.category;
+
+    update public.analytics_monthly_stats s
+    set participant_count = s.participant_count + delta * d.n, updated_at = now()
+    from (select event_month, count(*)::integer as n from pg_temp.analytics_changes group by event_month) d
+    where s.month = d.event_month;
+
+    -- 회원별 월 참가 수가 0 <-> 1 이상으로 바뀐 경우만 월별 active_members를 증감합니다.
+    with agg as (
+        select event_month as month, profile_id, count(*)::integer as n
+        from pg_temp.analytics_changes
+        group by event_month, profile_id
+    ), upserted as (
+        insert into public.analytics_member_monthly as m (month, profile_id, participation_count)
+        select month, profile_id, delta * n from agg
+        on conflict (month, profile_id)
+        do update set participation_count = m.participation_count + excluded.participation_count
+        returning m.month, m.profile_id, m.participation_count
+    ), transitions as (
+        select u.month,
+               sum(case
+                   when delta > 0 and u.participation_count = a.n then 1
+                   when delta < 0 and u.participation_count <= 0 then -1
+                   else 0
+               end)::integer as n
+        from upserted u
+        join agg a using (month, profile_id)
+        group by u.month
+    )
+    update public.analytics_monthly_stats s
+    set active_members = s.active_members + t.n, updated_at = now()
+    from transitions t
+    where s.month = t.month and t.n <> 0;
+
+    delete from public.analytics_member_monthly m
+    using (select distinct event_month, profile_id from pg_temp.analytics_changes) d
+    where m.month = d.event_month and m.profile_id = d.profile_id and m.participation_count <= 0;
+
+    -- 회원별 누적 참가 수와 전체 활동 회원 수
+    with agg as (
+        select profile_id, count(*)::integer as n, max(created_at) as last_at
+        from pg_temp.analytics_changes
+        group by profile_id
+    ), upserted as (
+        insert into public.analytics_member_stats as m (profile_id, participation_count, last_participated_at)
+        select profile_id, delta * n, case when delta > 0 then last_at end from agg
+        on conflict (profile_id)
+        do update set
+            participation_count = m.participation_count + excluded.participation_count,
+            last_participated_at = case
+                when delta > 0 then greatest(m.last_participated_at, excluded.last_participated_at)
+                else m.last_participated_at
+            end,
+            updated_at = now()
+        returning m.profile_id, m.participation_count
+    )
+    select coalesce(sum(case
+        when delta > 0 and u.participation_count = a.n then 1
+        when delta < 0 and u.participation_count <= 0 then -1
+        else 0
+    end), 0)::integer
+    into active_delta
+    from upserted u
+    join agg a using (profile_id);
+
+    if delta < 0 then
+        -- 삭제된 참가가 가장 최근 참가였을 수 있으므로 남은 행에서 다시 계산합니다. (profile_id 인덱스 사용)
+        update public.analytics_member_stats m
+        set last_participated_at = (
+            select max(p.created_at) from public.event_participants p where p.profile_id = m.profile_id
+        )
+        where m.profile_id in (select distinct profile_id from pg_temp.analytics_changes);
+
+        delete from public.analytics_member_stats m
+        where m.profile_id in (select distinct profile_id from pg_temp.analytics_changes)
+          and m.participation_count <= 0;
+    end if;
+
+    update public.analytics_totals
+    set total_participations = total_participations + delta * (select count(*) from pg_temp.analytics_changes),
+        active_members = active_members + active_delta,
+        updated_at = now()
+    where id = 1;
+end;
+$$;
+
+create or replace function public.analytics_participants_inserted()
+returns trigger
+language plpgsql
+as $$
+begin
+    perform public.analytics_apply_participation(
+        1,
+        array(select event_id from inserted),
+        array(select profile_id from inserted),
+        array(select created_at from inserted)
+    );
+    return null;
+end;
+$$;
+
+create or replace function public.analytics_participants_deleted()
+returns trigger
+language plpgsql
+as $$
+begin
+    perform public.analytics_apply_participation(
+        -1,
+        array(select event_id from deleted),
+        array(select profile_id from deleted),
+        array(select created_at from deleted)
+    );
+    return null;
+end;
+$$;
+
+drop trigger if exists analytics_participants_insert on public.event_participants;
+create trigger analytics_participants_insert
+    after insert on public.event_participants
+    referencing new table as inserted
+    for each statement execute function public.analytics_participants_inserted();
+
+drop trigger if exists analytics_participants_delete on public.event_participants;
+create trigger analytics_participants_delete
+    after delete on public.event_participants
+    referencing old table as deleted
+    for each statement execute function public.analytics_participants_deleted();
+
+-- 행사 수 증감 (카테고리, 월, 전체)
+create or replace function public.analytics_add_event(
+    event_category text,
+    month_start date,
+    delta integer
+)
+returns void
+language sql
+as $$
+    insert into public.analytics_category_stats as s (category, event_count)
+    values (event_category, delta)
+    on conflict (category) do update set event_count = s.event_count + excluded.event_count, updated_at = now();
+
+    insert into public.analytics_monthly_stats as s (month, event_count)
+    values (month_start, delta)
+    on conflict (month) do update set event_count = s.event_count + excluded.event_count, updated_at = now();
+
+    update public.analytics_totals
+    set total_events = total_events + delta, updated_at = now()
+    where id = 1;
+$$;
+
+create or replace function public.analytics_event_changed()
+returns trigger
+language plpgsql
+as $$
+declare
+    new_category text;
+    new_month date;
+    participants record;
+begin
+    if tg_op = 'INSERT' then
+        new_category := coalesce(new.category, '기타');
+        new_month := public.analytics_event_month(new.event_date, new.created_at);
+        insert into public.analytics_event_stats (event_id, category, event_month, event_date)
+        values (new.id, new_category, new_month, new.event_date)
+        on conflict (event_id) do nothing;
+        perform public.analytics_add_event(new_category, new_month, 1);
+        return new;
+    end if;
+
+    if tg_op = 'DELETE' then
+        -- cascade 삭제 전에 참가 행을 먼저 지워 참가 집계가 행사 집계가 남아 있을 때 반영되도록 합니다.
+        delete from public.event_participants where event_id = old.id;
+        perform public.analytics_add_event(s.category, s.event_month, -1)
+        from public.analytics_event_stats s where s.event_id = old.id;
+        delete from public.analytics_event_stats where event_id = old.id;
+        return old;
+    end if;
+
+    -- UPDATE: 카테고리나 월이 바뀌면 참가 집계를 이전 쪽에서 빼고 새 쪽에 더합니다.
+    new_category := coalesce(new.category, '기타');
+    new_month := public.analytics_event_month(new.event_date, new.created_at);
+    update public.analytics_event_stats set event_date = new.event_date, updated_at = now()
+    where event_id = new.id;
+
+    if exists (
+        select 1 from public.analytics_event_stats s
+        where s.event_id = new.id and (s.category <> new_category or s.event_month <> new_month)
+    ) then
+        select array_agg(p.event_id) as event_ids, array_agg(p.profile_id) as profile_ids,
+               array_agg(p.created_at) as created_ats
+        into participants
+        from public.event_participants p where p.event_id = new.id;
+
+        if participants.event_ids is not null then
+            perform public.analytics_apply_participation(
+                -1, participants.event_ids, participants.profile_ids, participants.created_ats
+            );
+        end if;
+        perform public.analytics_add_event(s.category, s.event_month, -1)
+        from public.analytics_event_stats s where s.event_id = new.id;
+
+        update public.analytics_event_stats
+        set category = new_category, event_month = new_month, updated_at = now()
+        where event_id = new.id;
+
+        perform public.analytics_add_event(new_category, new_month, 1);
+        if participants.event_ids is not null then
+            perform public.analytics_apply_participation(
+                1, participants.event_ids, participants.profile_ids, participants.created_ats
+            );
+        end if;
+    end if;
+    return new;
+end;
+$$;
+
+drop trigger if exists analytics_events_insert on public.events;
+create trigger analytics_events_insert
+    after insert on public.events
+    for each row execute function public.analytics_event_changed();
+
+drop trigger if exists analytics_events_update on public.events;
+create trigger analytics_events_update
+    after update of category, event_date on public.events
+    for each row execute function public.analytics_event_changed();
+
+drop trigger if exists analytics_events_delete on public.events;
+create trigger analytics_events_delete
+    before delete on public.events
+    for each row execute function public.analytics_event_changed();
+
+-- 전체 회원 수 (참가율 분모)
+create or replace function public.analytics_profiles_changed()
+returns trigger
+language plpgsql
+as $$
+begin
+    if tg_op = 'INSERT' then
+        update public.analytics_totals
+        set total_members = total_members + (select count(*) from inserted), updated_at = now()
+        where id = 1;
+    else
+        update public.analytics_totals
+        set total_members = total_members - (select count(*) from deleted), updated_at = now()
+        where id = 1;
+    end if;
+    return null;
+end;
+$$;
+
+drop trigger if exists analytics_profiles_insert on public.profiles;
+create trigger analytics_profiles_insert
+    after insert on public.profiles
+    referencing new table as inserted
+    for each statement execute function public.analytics_profiles_changed();
+
+drop trigger if exists analytics_profiles_delete on public.profiles;
+create trigger analytics_profiles_delete
+    after delete on public.profiles
+    referencing old table as deleted
+    for each statement execute function public.analytics_profiles_changed();
+
+-- 원본 테이블에서 모든 집계를 다시 계산합니다. (과거 데이터 채우기, 집계 보정)
+-- 계산하는 동안 트리거가 집계를 바꾸지 않도록 원본 테이블의 쓰기를 잠시 막습니다.
+create or replace function public.rebuild_analytics()
+returns table (
+    events integer,
+    participations bigint,
+    members integer
+)
+language plpgsql
+as $$
+begin
+    lock table public.events, public.event_participants, public.profiles in share mode;
+
+    truncate public.analytics_event_stats, public.analytics_category_stats, public.analytics_monthly_stats,
+             public.analytics_member_monthly, public.analytics_member_stats;
+
+    insert into public.analytics_event_stats (event_id, category, event_month, event_date, participant_count)
+    select e.id,
+           coalesce(e.category, '기타'),
+           public.analytics_event_month(e.event_date, e.created_at),
+           e.event_date,
+           (select count(*) from public.event_participants p where p.event_id = e.id)
+    from public.events e;
+
+    insert into public.analytics_category_stats (category, event_count, participant_count)
+    select category, count(*), coalesce(sum(participant_count), 0)
+    from public.analytics_event_stats
+    group by category;
+
+    insert into public.analytics_member_monthly (month, profile_id, participation_count)
+    select s.event_month, p.profile_id, count(*)
+    from public.event_participants p
+    join public.analytics_event_stats s on s.event_id = p.event_id
+    group by s.event_month, p.profile_id;
+
+    insert into public.analytics_monthly_stats (month, event_count, participant_count, active_members)
+    select s.event_month,
+           count(*),
+           coalesce(sum(s.participant_count), 0),
+           (select count(*) from public.analytics_member_monthly m where m.month = s.event_month)
+    from public.analytics_event_stats s
+    group by s.event_month;
+
+    insert into public.analytics_member_stats (profile_id, participation_count, last_participated_at)
+    select profile_id, count(*), max(created_at)
+    from public.event_participants
+    group by profile_id;
+
+    insert into public.analytics_totals as t (id, total_events, total_participations, total_members, active_members)
+    values (
+        1,
+        (select count(*) from public.analytics_event_stats),
+        (select count(*) from public.event_participants),
+        (select count(*) from public.profiles),
+        (select count(*) from public.analytics_member_stats)
+    )
+    on conflict (id) do update set
+        total_events = excluded.total_events,
+        total_participations = excluded.total_participations,
+        total_members = excluded.total_members,
+        active_members = excluded.active_members,
+        updated_at = now();
+
+    return query
+    select t.total_events, t.total_participations, t.total_members
+    from public.analytics_totals t where t.id = 1;
+end;
+$$;
+
+-- 기존 데이터로 집계를 채웁니다.
+select public.rebuild_analytics();
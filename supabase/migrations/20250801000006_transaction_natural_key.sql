@@ -0,0 +1,84 @@
+-- 거래내역 재업로드 시 중복 저장 방지를 위한 자연 키
+-- 키는 (거래일시, 금액, 잔액, 적요, 계좌번호)의 md5이며
+-- app/services/transaction_reconcile.natural_key()와 같은 방식으로 만듭니다.
+-- 거래일시는 초 단위 UTC 'YYYY-MM-DDTHH:MM:SS' 문자열로 씁니다.
+
+alter table public.transactions
+    add column if not exists natural_key text;
+
+create or replace function public.transaction_natural_key(
+    transaction_date timestamptz,
+    amount bigint,
+    balance bigint,
+    description text,
+    account_number text
+)
+returns text
+language sql
+stable
+as $$
+    select md5(
+        to_char(transaction_date at time zone 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+        || '|' || amount::text
+        || '|' || balance::text
+        || '|' || coalesce(description, '')
+        || '|' || coalesce(account_number, '')
+    );
+$$;
+
+-- 앱을 거치지 않은 insert와 거래 수정 시에도 키를 다시 계산합니다.
+create or replace function public.set_transaction_natural_key()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.natural_key := public.transaction_natural_key(
+        new.transaction_date, new.amount, new.balance, new.description, new.account_number
+    );
+    return new;
+end;
+$$;
+
+drop trigger if exists transactions_natural_key on public.transactions;
+create trigger transactions_natural_key
+    before insert or update of transaction_date, amount, balance, description, account_number
+    on public.transactions
+    for each row execute function public.set_transaction_natural_key();
+
+-- 기존 행 채우기: 이미 중복 저장된 거래는 가장 먼저 저장된 행에만 키를 주고
+-- 나머지는 natural_key를 비워 둡니다. (고유 인덱스 생성이 실패하지 않도록)
+-- 남은 중복 행 확인: select * from public.transactions where natural_key is null;
+alter table public.transactions disable trigger transactions_natural_key;
+
+with keyed as (
+    select id,
+           public.transaction_natural_key(transaction_date, amount, balance, description, account_number) as key,
+           row_number() over (
+               partition by public.transaction_natural_key(transaction_date, amount, balance, description, account_number)
+               order by created_at, id
+           ) as n
+    from public.transactions
+    where natural_key is null
+)
+update public.transactions t
+set natural_key = keyed.key
+from keyed
+where t.id = keyed.id and keyed.n = 1
+  and not exists (select 1 from public.transactions e where e.natural_key = keyed.key);
+
+alter table public.transactions enable trigger transactions_natural_key;
+
+-- upsert(on_conflict=natural_key)의 충돌 대상이자 중복 조회 인덱스
+create unique index if not exists transactions_natural_key_key
+    on public.transactions (natural_key);
+
+-- 업로드할 행들의 키 중 이미 저장된 키만 반환합니다. (요청 한 번에 일괄 조회)
+create or replace function public.transaction_keys_exist(keys text[])
+returns table (natural_key text)
+language sql
+stable
+as $$
+    select t.natural_key
+    from public.transactions t
+    where t.natural_key = any(keys);
+$$;
@@ -0,0 +1,55 @@
+-- /transactions/summary 기간별(일/주/월/학기) 수입·지출 집계 RPC
+-- 버킷별 한 행만 반환하므로 5년치 월별 차트도 요청 한 번, 60행입니다.
+-- 학기는 3월 1일(1학기), 9월 1일(2학기)에 시작합니다.
+-- 버킷 경계는 app/services/transaction_stats.bucket_start()와 같아야 합니다.
+
+create or replace function public.transaction_bucket_start(bucket text, ts timestamptz)
+returns date
+language sql
+stable
+as $$
+    select case bucket
+        when 'term' then case
+            when extract(month from ts) >= 9 then make_date(extract(year from ts)::int, 9, 1)
+            when extract(month from ts) >= 3 then make_date(extract(year from ts)::int, 3, 1)
+            else make_date(extract(year from ts)::int - 1, 9, 1)
+        end
+        else date_trunc(bucket, ts)::date
+    end;
+$$;
+
+create or replace function public.transaction_summary(
+    bucket text,
+    start_date date,
+    end_date date
+)
+returns table (
+    bucket_start date,
+    income bigint,
+    expense bigint,
+    transaction_count bigint,
+    closing_balance bigint
+)
+language plpgsql
+stable
+as $$
+begin
+    if bucket not in ('day', 'week', 'month', 'term') then
+        raise exception 'invalid bucket: %', bucket;
+    end if;
+
+    return query
+    select
+        public.transaction_bucket_start(bucket, t.transaction_date) as b,
+        coalesce(sum(t.amount) filter (where t.amount > 0), 0)::bigint,
+        coalesce(sum(-t.amount) filter (where t.amount < 0), 0)::bigint,
+        count(*)::bigint,
+        -- 버킷의 마지막 거래 후 잔액
+        (array_agg(t.balance order by t.transaction_date desc, t.created_at desc))[1]::bigint
+    from public.transactions t
+    where t.transaction_date >= start_date
+      and t.transaction_date < end_date + 1
+    group by b
+    order by b;
+end;
+$$;
@@ -0,0 +1,33 @@
+-- 관리자 일괄 등록(/admin/onboarding)은 시트 동기화로 먼저 만들어진 프로필을 학번 기준 upsert로
+-- auth 계정에 연결하면서 profiles.id를 새 auth 사용자 id로 바꿉니다.
+-- (프로필 id는 auth 사용자 id와 같아야 /users/me 등이 동작하므로 id를 따로 두지 않고 바꾸는 쪽을 택했습니다)
+-- 이미 참가 기록이 있는 회원도 바꿀 수 있도록 참가 정보의 외래 키를 on update cascade로 바꾸고,
+-- 외래 키가 없는 집계 테이블의 회원 id도 함께 옮깁니다.
+
+alter table public.event_participants
+    drop constraint if exists event_participants_profile_id_fkey;
+
+alter table public.event_participants
+    add constraint event_participants_profile_id_fkey
+    foreign key (profile_id) references public.profiles (id)
+    on update cascade on delete cascade;
+
+-- cascade로 바뀐 참가 행은 insert/delete가 아니라 update이므로 집계 트리거가 실행되지 않습니다.
+-- 새 id는 방금 만든 auth 사용자이므로 집계에 기존 행이 없어 키가 겹치지 않습니다.
+create or replace function public.profiles_move_analytics()
+returns trigger
+language plpgsql
+as $$
+begin
+    update public.analytics_member_monthly set profile_id = new.id where profile_id = old.id;
+    update public.analytics_member_stats set profile_id = new.id where profile_id = old.id;
+    return null;
+end;
+$$;
+
+drop trigger if exists profiles_move_analytics on public.profiles;
+create trigger profiles_move_analytics
+    after update of id on public.profiles
+    for each row
+    when (old.id is distinct from new.id)
+    execute function public.profiles_move_analytics();